@@ -0,0 +1,370 @@
+import numpy as np
+from abc import ABC, abstractmethod
+from typing import Dict, List, Sequence, Tuple
+from midas.symbol import SecurityType, SymbolMap
+
+
+class CostModel(ABC):
+    """
+    Computes trading costs for a batch of order legs at once, one array element per leg.
+
+    The parameters of every instrument in the symbols map are gathered into arrays when the model is created, so a
+    basket of any size is priced with a few NumPy operations instead of a Python call per leg. Quantities are signed,
+    positive when buying and negative when selling.
+
+    Subclasses define the commission and slippage over arrays of slots, quantities and prices, value and cost follow
+    the security type of each instrument like Symbol.value and Symbol.cost. Instrument ids must be non-negative, they
+    index a lookup table of slots.
+
+    Attributes:
+    - instrument_ids (np.ndarray): Sorted instrument ids, the slot of an instrument is its index.
+    - fees (np.ndarray): Fee per unit of each instrument.
+    - slippage_factors (np.ndarray): Slippage in price units of each instrument.
+    - price_multipliers (np.ndarray): Price multiplier of each instrument.
+    - quantity_multipliers (np.ndarray): Quantity multiplier of each instrument.
+    - initial_margins (np.ndarray): Initial margin per contract of each instrument.
+    """
+
+    def __init__(self, symbols_map: SymbolMap):
+        """
+        Gathers the parameters of the instruments in the symbols map.
+
+        Parameters:
+        - symbols_map (SymbolMap): The instruments the model prices.
+        """
+        symbols = sorted(
+            symbols_map.symbols, key=lambda symbol: symbol.instrument_id
+        )
+        self.instrument_ids = np.array(
+            [symbol.instrument_id for symbol in symbols], dtype=np.int64
+        )
+        self.fees = np.array([symbol.fees for symbol in symbols], dtype=float)
+        self.slippage_factors = np.array(
+            [symbol.slippage_factor for symbol in symbols], dtype=float
+        )
+        self.price_multipliers = np.array(
+            [symbol.price_multiplier for symbol in symbols], dtype=float
+        )
+        self.quantity_multipliers = np.array(
+            [symbol.quantity_multiplier for symbol in symbols], dtype=float
+        )
+        self.initial_margins = np.array(
+            [symbol.initial_margin for symbol in symbols], dtype=float
+        )
+        self._futures = np.array(
+            [
+                symbol.security_type == SecurityType.FUTURE
+                for symbol in symbols
+            ],
+            dtype=bool,
+        )
+        self._options = np.array(
+            [
+                symbol.security_type == SecurityType.OPTION
+                for symbol in symbols
+            ],
+            dtype=bool,
+        )
+        self._slot_table = np.full(
+            int(self.instrument_ids.max(initial=-1)) + 1, -1, dtype=np.intp
+        )
+        self._slot_table[self.instrument_ids] = np.arange(len(symbols))
+
+    def slots(self, instrument_ids: Sequence[int]) -> np.ndarray:
+        """
+        Maps instrument ids to their slot in the parameter arrays.
+
+        Parameters:
+        - instrument_ids (Sequence[int]): The instrument id of each leg.
+
+        Returns:
+        - np.ndarray: The slot of each leg.
+        """
+        ids = np.asarray(instrument_ids, dtype=np.intp)
+        try:
+            slots = self._slot_table[ids]
+        except IndexError:
+            slots = None
+
+        if slots is None or (slots < 0).any():
+            unknown = set(ids.tolist()) - set(self.instrument_ids.tolist())
+            raise ValueError(
+                f"Instruments not in symbols map: {sorted(unknown)}"
+            )
+        return slots
+
+    def commission_fees(
+        self,
+        instrument_ids: Sequence[int],
+        quantities: Sequence[float],
+        prices: Sequence[float],
+    ) -> np.ndarray:
+        """
+        Calculates the commission fees of each leg, negative like Symbol.commission_fees.
+
+        Parameters:
+        - instrument_ids (Sequence[int]): The instrument id of each leg.
+        - quantities (Sequence[float]): The signed quantity of each leg.
+        - prices (Sequence[float]): The fill price of each leg.
+
+        Returns:
+        - np.ndarray: The fees of each leg.
+        """
+        return self._commission_fees(
+            self.slots(instrument_ids),
+            np.asarray(quantities, dtype=float),
+            np.asarray(prices, dtype=float),
+        )
+
+    def slippage_prices(
+        self,
+        instrument_ids: Sequence[int],
+        quantities: Sequence[float],
+        prices: Sequence[float],
+    ) -> np.ndarray:
+        """
+        Adjusts the price of each leg against the order, buys fill higher and sells lower.
+
+        Parameters:
+        - instrument_ids (Sequence[int]): The instrument id of each leg.
+        - quantities (Sequence[float]): The signed quantity of each leg.
+        - prices (Sequence[float]): The current market price of each leg.
+
+        Returns:
+        - np.ndarray: The fill price of each leg.
+        """
+        return self._slippage_prices(
+            self.slots(instrument_ids),
+            np.asarray(quantities, dtype=float),
+            np.asarray(prices, dtype=float),
+        )
+
+    def fills(
+        self,
+        instrument_ids: Sequence[int],
+        quantities: Sequence[float],
+        prices: Sequence[float],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculates the fill price and the commission fees of each leg of market orders.
+
+        Parameters:
+        - instrument_ids (Sequence[int]): The instrument id of each leg.
+        - quantities (Sequence[float]): The signed quantity of each leg.
+        - prices (Sequence[float]): The current market price of each leg.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray]: The fill price and the fees of each leg.
+        """
+        slots = self.slots(instrument_ids)
+        quantities = np.asarray(quantities, dtype=float)
+        fill_prices = self._slippage_prices(
+            slots, quantities, np.asarray(prices, dtype=float)
+        )
+        return fill_prices, self._commission_fees(
+            slots, quantities, fill_prices
+        )
+
+    @abstractmethod
+    def _commission_fees(
+        self, slots: np.ndarray, quantities: np.ndarray, prices: np.ndarray
+    ) -> np.ndarray:
+        pass
+
+    @abstractmethod
+    def _slippage_prices(
+        self, slots: np.ndarray, quantities: np.ndarray, prices: np.ndarray
+    ) -> np.ndarray:
+        pass
+
+    def value(
+        self,
+        instrument_ids: Sequence[int],
+        quantities: Sequence[float],
+        prices: Sequence[float],
+    ) -> np.ndarray:
+        """
+        Calculates the value of each leg.
+
+        Parameters:
+        - instrument_ids (Sequence[int]): The instrument id of each leg.
+        - quantities (Sequence[float]): The signed quantity of each leg.
+        - prices (Sequence[float]): The price of each leg.
+
+        Returns:
+        - np.ndarray: The value of each leg.
+        """
+        slots = self.slots(instrument_ids)
+        quantities = np.asarray(quantities, dtype=float)
+        prices = np.asarray(prices, dtype=float)
+        quantity_multipliers = self.quantity_multipliers[slots]
+
+        return np.where(
+            self._futures[slots],
+            self.price_multipliers[slots]
+            * prices
+            * quantities
+            * quantity_multipliers,
+            np.where(
+                self._options[slots],
+                np.abs(quantities) * prices * quantity_multipliers,
+                quantities * prices,
+            ),
+        )
+
+    def cost(
+        self,
+        instrument_ids: Sequence[int],
+        quantities: Sequence[float],
+        prices: Sequence[float],
+    ) -> np.ndarray:
+        """
+        Calculates the capital required by each leg, margin for futures.
+
+        Parameters:
+        - instrument_ids (Sequence[int]): The instrument id of each leg.
+        - quantities (Sequence[float]): The signed quantity of each leg.
+        - prices (Sequence[float]): The price of each leg.
+
+        Returns:
+        - np.ndarray: The cost of each leg.
+        """
+        slots = self.slots(instrument_ids)
+        quantities = np.abs(np.asarray(quantities, dtype=float))
+        prices = np.asarray(prices, dtype=float)
+
+        return np.where(
+            self._futures[slots],
+            quantities * self.initial_margins[slots],
+            np.where(
+                self._options[slots],
+                quantities * prices * self.quantity_multipliers[slots],
+                quantities * prices,
+            ),
+        )
+
+
+class FixedCostModel(CostModel):
+    """
+    Charges each instrument's fee per unit and slips prices by its slippage factor, the costs of Symbol.commission_fees
+    and Symbol.slippage_price.
+    """
+
+    def _commission_fees(
+        self, slots: np.ndarray, quantities: np.ndarray, prices: np.ndarray
+    ) -> np.ndarray:
+        return np.abs(quantities) * self.fees[slots] * -1
+
+    def _slippage_prices(
+        self, slots: np.ndarray, quantities: np.ndarray, prices: np.ndarray
+    ) -> np.ndarray:
+        return prices + np.sign(quantities) * self.slippage_factors[slots]
+
+
+class TieredCostModel(FixedCostModel):
+    """
+    Charges a fee per unit that falls with the size of the order, with an optional minimum per order.
+
+    Prices slip by each instrument's slippage factor like the fixed model.
+
+    Attributes:
+    - bounds (np.ndarray): Largest order quantity of each tier, the last tier applies to larger orders.
+    - rates (np.ndarray): Fee per unit of each tier.
+    - minimum (float): Smallest fee charged on an order.
+    """
+
+    def __init__(
+        self,
+        symbols_map: SymbolMap,
+        tiers: List[Tuple[float, float]],
+        minimum: float = 0.0,
+    ):
+        """
+        Initializes the tiers of the model.
+
+        Parameters:
+        - symbols_map (SymbolMap): The instruments the model prices.
+        - tiers (List[Tuple[float, float]]): (largest quantity, fee per unit) of each tier, in increasing quantity.
+        - minimum (float): Smallest fee charged on an order.
+        """
+        if not tiers:
+            raise ValueError("'tiers' must contain at least one tier.")
+        if minimum < 0:
+            raise ValueError("'minimum' must be non-negative.")
+
+        super().__init__(symbols_map)
+        self.bounds = np.array([bound for bound, _ in tiers], dtype=float)
+        self.rates = np.array([rate for _, rate in tiers], dtype=float)
+        self.minimum = minimum
+
+        if np.any(np.diff(self.bounds) <= 0):
+            raise ValueError("'tiers' must be in increasing quantity.")
+        if np.any(self.rates < 0):
+            raise ValueError("'tiers' fee rates must be non-negative.")
+
+    def _commission_fees(
+        self, slots: np.ndarray, quantities: np.ndarray, prices: np.ndarray
+    ) -> np.ndarray:
+        quantities = np.abs(quantities)
+        tiers = np.minimum(
+            np.searchsorted(self.bounds, quantities), len(self.rates) - 1
+        )
+        fees = np.maximum(quantities * self.rates[tiers], self.minimum)
+        return np.where(quantities > 0, fees, 0.0) * -1
+
+
+class SpreadCostModel(FixedCostModel):
+    """
+    Fills orders across a bid-ask spread proportional to the price, buys at half the spread above the price and
+    sells at half the spread below.
+
+    Fees are each instrument's fee per unit like the fixed model.
+
+    Attributes:
+    - spread (float): The bid-ask spread as a fraction of the price.
+    """
+
+    def __init__(self, symbols_map: SymbolMap, spread: float):
+        """
+        Initializes the spread of the model.
+
+        Parameters:
+        - symbols_map (SymbolMap): The instruments the model prices.
+        - spread (float): The bid-ask spread as a fraction of the price, e.g. 0.001 for 10 basis points.
+        """
+        if spread < 0:
+            raise ValueError("'spread' must be non-negative.")
+
+        super().__init__(symbols_map)
+        self.spread = spread
+
+    def _slippage_prices(
+        self, slots: np.ndarray, quantities: np.ndarray, prices: np.ndarray
+    ) -> np.ndarray:
+        return prices * (1 + np.sign(quantities) * (self.spread / 2))
+
+
+def cost_model_factory(
+    symbols_map: SymbolMap, model: str = "fixed", **kwargs
+) -> CostModel:
+    """
+    Creates a cost model by name.
+
+    Parameters:
+    - symbols_map (SymbolMap): The instruments the model prices.
+    - model (str): One of 'fixed', 'tiered' or 'spread'.
+    - **kwargs: The parameters of the model.
+
+    Returns:
+    - CostModel: The cost model.
+    """
+    models: Dict[str, type] = {
+        "fixed": FixedCostModel,
+        "tiered": TieredCostModel,
+        "spread": SpreadCostModel,
+    }
+
+    if model not in models:
+        raise ValueError(f"Unsupported cost model: {model}")
+
+    return models[model](symbols_map, **kwargs)
@@ -1,12 +1,12 @@
 import pandas as pd
 import importlib.util
 from typing import Type
-from typing import List
+from typing import List, Union
 from abc import ABC, abstractmethod
 from midas.engine.components.order_book import OrderBook
 from midas.signal import SignalInstruction
 from midas.engine.components.portfolio_server import PortfolioServer
-from midas.engine.events import SignalEvent, MarketEvent
+from midas.engine.events import SignalEvent, MarketEvent, TimeSliceEvent
 from midas.symbol import SymbolMap
 from midas.engine.components.observer.base import Subject, Observer, EventType
 from midas.utils.logger import SystemLogger
@@ -63,11 +63,13 @@ class BaseStrategy(Subject, Observer, ABC):
         self,
         subject: Subject,
         event_type: EventType,
-        event: MarketEvent,
+        event: Union[MarketEvent, TimeSliceEvent],
     ):
         """
         Handle the event based on the type.
 
+        ORDER_BOOK events carry a TimeSliceEvent when the backtest data client streams time slices.
+
             Parameters:
             - subject (Subject): The subject that triggered the event.
                 - event_type (EventType): The type of event that was triggered.
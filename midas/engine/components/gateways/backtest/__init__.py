@@ -1,3 +1,5 @@
 from .broker_client import BrokerClient
+from .cache import HistoricalCache
 from .data_client import DataClient
 from .dummy_broker import DummyBroker
+from .matching_engine import MatchingEngine, RestingOrder
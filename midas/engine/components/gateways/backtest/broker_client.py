@@ -1,11 +1,14 @@
+from typing import Callable, Dict, Iterable, Optional, Union
 from ibapi.contract import Contract
 from midas.utils.logger import SystemLogger
+from midas.active_orders import ActiveOrder
 from midas.engine.components.gateways.base import BaseBrokerClient
 from midas.engine.events import (
     ExecutionEvent,
     OrderEvent,
     EODEvent,
     MarketEvent,
+    TimeSliceEvent,
 )
 from midas.engine.components.gateways.backtest.dummy_broker import DummyBroker
 from midas.engine.components.observer.base import Observer, Subject, EventType
@@ -29,30 +32,73 @@ class BrokerClient(Subject, Observer, BaseBrokerClient):
     Methods:
     - on_order(event: OrderEvent): Processes new order events, initiating trade execution.
     - handle_order(timestamp, trade_id, leg_id, action, contract, order): Executes orders based on trading signals and market data.
+    - cancel_order(orderId): Cancels a resting limit or stop order.
     - on_execution(event: ExecutionEvent): Handles execution events, updating system state based on trade outcomes.
     - eod_update(): Performs end-of-day updates such as marking positions to market and checking margin requirements.
     - update_positions(): Retrieves and updates position data from the broker simulation.
     - update_trades(contract=None): Retrieves and updates trade execution details.
     - update_account(): Fetches and updates account details like balance and margin.
+    - mark_positions(instrument_ids=None): Re-marks positions to market without sampling the equity value.
     - update_equity_value(): Updates equity value based on current market valuations.
     - liquidate_positions(): Liquidates all positions at the end of a trading session or in response to market conditions.
     """
 
-    def __init__(self, broker: DummyBroker, symbols_map: SymbolMap):
+    EQUITY_SAMPLING = ("record", "bar", "interval", "trades", "eod")
+
+    def __init__(
+        self,
+        broker: DummyBroker,
+        symbols_map: SymbolMap,
+        equity_sampling: str = "record",
+        equity_interval_s: float = 0,
+    ):
         """
         Initializes a BrokerClient with the necessary components to simulate broker functionalities.
 
+        Positions are re-marked on every market record, the equity sampling policy only decides when the equity value
+        is sent to the performance manager:
+        - 'record': After every market record.
+        - 'bar': Once per market timestamp, the last value of the timestamp.
+        - 'interval': Once per `equity_interval_s` seconds of market time, the last value of the interval.
+        - 'trades': After executions only.
+        - 'eod': At the end of each day only.
+        Executions are sampled under every policy but 'eod', and the liquidation at the end of a backtest always is.
+
         Parameters:
-        - event_queue (Queue): The event queue from which the broker receives trading events.
-        - logger (logging.Logger): Logger for outputting system activities and errors.
-        - portfolio_server (PortfolioServer): The component that manages portfolio state.
-        - performance_manager (BasePerformanceManager): Manages and calculates performance metrics.
         - broker (DummyBroker): The simulated broker backend for order execution and account management.
+        - symbols_map (SymbolMap): Mapping of the instruments traded.
+        - equity_sampling (str): When the equity value is sampled, one of EQUITY_SAMPLING.
+        - equity_interval_s (float): Length of an interval in seconds of market time, used by the 'interval' policy.
         """
+        if equity_sampling not in self.EQUITY_SAMPLING:
+            raise ValueError(
+                f"'equity_sampling' must be one of {self.EQUITY_SAMPLING}."
+            )
+        if equity_sampling == "interval" and equity_interval_s <= 0:
+            raise ValueError(
+                "'equity_interval_s' must be greater than zero when sampling by interval."
+            )
+
         Subject.__init__(self)
         self.broker = broker
         self.symbols_map = symbols_map
         self.logger = SystemLogger.get_logger()
+        self.equity_sampling = equity_sampling
+        self._equity_step = (
+            int(equity_interval_s * 1_000_000_000)
+            if equity_sampling == "interval"
+            else 1
+        )
+        self._equity_bucket: Optional[int] = None
+
+    def event_handlers(self) -> Dict[EventType, Callable[..., None]]:
+        return {
+            EventType.ORDER_CREATED: self.handle_order,
+            EventType.TRADE_EXECUTED: self.handle_execution,
+            EventType.EOD_EVENT: self.handle_eod,
+            EventType.ORDER_BOOK: self.handle_order_book,
+            EventType.ORDER_UPDATE: self.handle_order_update,
+        }
 
     def handle_event(
         self,
@@ -87,10 +133,78 @@ class BrokerClient(Subject, Observer, BaseBrokerClient):
             self.handle_eod(event)
 
         elif event_type == EventType.ORDER_BOOK:
-            if not isinstance(event, MarketEvent):
-                raise ValueError("'event' must be of MarketEvent.")
+            if not isinstance(event, (MarketEvent, TimeSliceEvent)):
+                raise ValueError(
+                    "'event' must be of MarketEvent or TimeSliceEvent."
+                )
 
-            self.update_equity_value()
+            self.handle_order_book(event)
+
+        elif event_type == EventType.ORDER_UPDATE:
+            if not isinstance(event, ActiveOrder):
+                raise ValueError("'event' must be of type ActiveOrder.")
+
+            self.handle_order_update(event)
+
+    def handle_order_book(
+        self,
+        event: Union[MarketEvent, TimeSliceEvent],
+    ) -> None:
+        """
+        Submits the queued orders whose latency has elapsed, fills the resting orders crossed by new market data and
+        updates the equity value.
+
+        Parameters:
+        - event (Union[MarketEvent, TimeSliceEvent]): The market data update.
+        """
+        if self.broker.pending_orders:
+            self.broker.release_orders(event.timestamp)
+
+        if self.equity_sampling in ("bar", "interval"):
+            self._sample_bucket(event.timestamp)
+
+        if isinstance(event, TimeSliceEvent):
+            if self.broker.matching_engine:
+                for record in event.data:
+                    self.broker.match_orders(record)
+            instrument_ids = [record.instrument_id for record in event.data]
+        else:
+            if self.broker.matching_engine:
+                self.broker.match_orders(event.data)
+            instrument_ids = (event.data.instrument_id,)
+
+        if self.equity_sampling == "record":
+            self.update_equity_value(instrument_ids)
+        else:
+            self.mark_positions(instrument_ids)
+
+    def _sample_bucket(self, timestamp: int) -> None:
+        """
+        Sends the equity value of the previous bucket of market time when a record opens a new one.
+
+        The account still holds the marks of the last record of the previous bucket, so that value is sent before the
+        new record is marked. A bucket is a market timestamp for the 'bar' policy.
+
+        Parameters:
+        - timestamp (int): UNIX timestamp in nanoseconds of the new market data.
+        """
+        bucket = timestamp // self._equity_step
+        if bucket != self._equity_bucket:
+            if self._equity_bucket is not None:
+                self.notify(
+                    EventType.EQUITY_VALUE_UPDATE,
+                    self.broker.return_equity_value(),
+                )
+            self._equity_bucket = bucket
+
+    def handle_order_update(self, event: ActiveOrder) -> None:
+        """
+        Forwards status changes of resting orders to the portfolio server.
+
+        Parameters:
+        - event (ActiveOrder): The order and its new status.
+        """
+        self.notify(EventType.ORDER_UPDATE, event)
 
     def handle_order(self, event: OrderEvent):
         """
@@ -104,7 +218,7 @@ class BrokerClient(Subject, Observer, BaseBrokerClient):
         - contract (Contract): The financial instrument involved in the order.
         - order (BaseOrder): The specific order details including type and quantity.
         """
-        self.logger.info(event)
+        self.logger.info("%s", event)
 
         timestamp = event.timestamp
         trade_id = event.trade_id
@@ -122,6 +236,18 @@ class BrokerClient(Subject, Observer, BaseBrokerClient):
             order,
         )
 
+    def cancel_order(self, orderId: int) -> bool:
+        """
+        Cancel an order.
+
+        Parameters:
+        - orderId (int): The ID of the order to  be canceled.
+
+        Returns:
+        - bool: True if the order was resting and is now cancelled.
+        """
+        return self.broker.cancel_order(orderId)
+
     def handle_execution(self, event: ExecutionEvent):
         """
         Responds to execution events, updating system states such as positions and account details.
@@ -129,7 +255,7 @@ class BrokerClient(Subject, Observer, BaseBrokerClient):
         Parameters:
             event (ExecutionEvent): The event detailing the trade execution.
         """
-        self.logger.info(event)
+        self.logger.info("%s", event)
 
         # Update trades look with current event
         contract = event.contract
@@ -140,7 +266,10 @@ class BrokerClient(Subject, Observer, BaseBrokerClient):
         if trade_details == self.broker.last_trade:
             self.update_positions()
             self.update_account()
-            self.update_equity_value()
+            if self.equity_sampling == "eod":
+                self.mark_positions()
+            else:
+                self.update_equity_value()
 
     def handle_eod(self, event: EODEvent):
         """
@@ -150,6 +279,8 @@ class BrokerClient(Subject, Observer, BaseBrokerClient):
         regarding margin requirements. It updates account and equity values based on the day's final prices.
         """
         self.update_account()
+        if self.equity_sampling == "eod":
+            self.update_equity_value()
 
     def update_positions(self):
         """
@@ -194,14 +325,36 @@ class BrokerClient(Subject, Observer, BaseBrokerClient):
         account = self.broker.return_account()
         self.notify(EventType.ACCOUNT_UPDATE, account)
 
-    def update_equity_value(self):
+    def mark_positions(
+        self,
+        instrument_ids: Optional[Iterable[int]] = None,
+    ):
+        """
+        Re-marks positions to the latest market prices without sampling the equity value.
+
+        Parameters:
+        - instrument_ids (Optional[Iterable[int]]): Instruments with new market data, only their positions are re-marked. All positions are re-marked if None.
+        """
+        if instrument_ids is None:
+            self.broker._update_account()
+        else:
+            for instrument_id in instrument_ids:
+                self.broker.mark_instrument(instrument_id)
+
+    def update_equity_value(
+        self,
+        instrument_ids: Optional[Iterable[int]] = None,
+    ):
         """
         Updates the equity value of the account based on the latest market valuations.
 
         This method is essential for reflecting the current market value of the account's holdings, adjusting for market movements
         and trading activities throughout the trading day.
+
+        Parameters:
+        - instrument_ids (Optional[Iterable[int]]): Instruments with new market data, only their positions are re-marked. All positions are re-marked if None.
         """
-        self.broker._update_account()
+        self.mark_positions(instrument_ids)
         equity = self.broker.return_equity_value()
         self.notify(EventType.EQUITY_VALUE_UPDATE, equity)
 
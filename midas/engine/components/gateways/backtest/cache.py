@@ -0,0 +1,369 @@
+import os
+import json
+import hashlib
+import tempfile
+import threading
+import zstandard
+import pandas as pd
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Union
+from mbn import BufferStore, RecordMsg
+from midas.utils.unix import iso_to_unix
+from midas.utils.logger import SystemLogger
+
+CacheKey = Tuple[Tuple[str, ...], str, str, str]
+
+
+def store_to_bytes(store: BufferStore) -> bytes:
+    """
+    Serializes a BufferStore to its binary file representation.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "store.bin")
+        store.write_to_file(path)
+        with open(path, "rb") as f:
+            return f.read()
+
+
+def store_from_bytes(data: bytes) -> BufferStore:
+    """
+    Creates a new BufferStore, positioned at its first record, from its binary file representation.
+    """
+    return BufferStore(data)
+
+
+class BufferStoreSlice:
+    """
+    Read-only view of a BufferStore restricted to the records with ts_event in [start, end).
+
+    Exposes the replay, metadata and decode_to_df interface used by the backtest DataClient, allowing a cached
+    retrieval covering a larger range to answer a request for a sub-range.
+
+    Attributes:
+    - store (BufferStore): The underlying store, records ordered by ts_event.
+    - start (int): Inclusive lower bound in UNIX nanoseconds.
+    - end (int): Exclusive upper bound in UNIX nanoseconds.
+    """
+
+    def __init__(self, store: BufferStore, start: int, end: int):
+        self.store = store
+        self.start = start
+        self.end = end
+        self._exhausted = False
+
+    @property
+    def metadata(self):
+        return self.store.metadata
+
+    def replay(self) -> Optional[RecordMsg]:
+        if self._exhausted:
+            return None
+
+        record = self.store.replay()
+        while record is not None and record.ts_event < self.start:
+            record = self.store.replay()
+
+        if record is None or record.ts_event >= self.end:
+            self._exhausted = True
+            return None
+
+        return record
+
+    def decode_to_df(
+        self,
+        pretty_ts: bool = False,
+        pretty_px: bool = False,
+    ) -> pd.DataFrame:
+        df = self.store.decode_to_df(pretty_ts=False, pretty_px=pretty_px)
+        df = df[
+            (df["ts_event"] >= self.start) & (df["ts_event"] < self.end)
+        ].reset_index(drop=True)
+
+        if pretty_ts:
+            df["ts_event"] = pd.to_datetime(
+                df["ts_event"], unit="ns", utc=True
+            )
+
+        return df
+
+
+class HistoricalCache:
+    """
+    Two-tier cache of historical record retrievals keyed on (tickers, start, end, schema).
+
+    Retrievals are held as serialized BufferStores in an in-process LRU and in a zstd compressed on-disk store,
+    evicted least recently used first once the configured size caps are reached. A request whose range lies within
+    a cached retrieval of the same tickers and schema is answered by slicing that retrieval.
+
+    Attributes:
+    - cache_dir (Optional[str]): Directory of the on-disk store, None keeps the cache in memory only.
+    - max_disk_bytes (int): Maximum total size of the compressed files on disk.
+    - max_memory_bytes (int): Maximum total size of the serialized retrievals held in memory.
+    - memory_hits (int): Requests answered from memory.
+    - disk_hits (int): Requests answered from disk.
+    - misses (int): Requests not found in either tier.
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_disk_bytes: int = 1 << 30,
+        max_memory_bytes: int = 256 << 20,
+        compression_level: int = 3,
+    ):
+        """
+        Initializes the cache, loading the index of an existing on-disk store.
+
+        Parameters:
+        - cache_dir (Optional[str]): Directory of the on-disk store, None keeps the cache in memory only.
+        - max_disk_bytes (int): Maximum total size of the compressed files on disk.
+        - max_memory_bytes (int): Maximum total size of the serialized retrievals held in memory.
+        - compression_level (int): zstd compression level of the on-disk files.
+        """
+        self.logger = SystemLogger.get_logger()
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.max_memory_bytes = max_memory_bytes
+        self.compression_level = compression_level
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[CacheKey, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._index: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._load_index()
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @staticmethod
+    def make_key(
+        tickers: List[str],
+        start: str,
+        end: str,
+        schema: Union[str, object],
+    ) -> CacheKey:
+        return (tuple(sorted(tickers)), start, end, str(schema))
+
+    @staticmethod
+    def _file_name(key: CacheKey) -> str:
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()
+        return f"{digest}.zst"
+
+    @staticmethod
+    def _covers(cached: CacheKey, requested: CacheKey) -> bool:
+        return (
+            cached[0] == requested[0]
+            and cached[3] == requested[3]
+            and iso_to_unix(cached[1]) <= iso_to_unix(requested[1])
+            and iso_to_unix(cached[2]) >= iso_to_unix(requested[2])
+        )
+
+    # -- Lookup --
+    def get(
+        self,
+        tickers: List[str],
+        start: str,
+        end: str,
+        schema: Union[str, object],
+    ) -> Optional[Union[BufferStore, BufferStoreSlice]]:
+        """
+        Returns a new store for the request if it is covered by a cached retrieval.
+
+        Parameters:
+        - tickers (List[str]): A list of ticker symbols.
+        - start (str): The start date in ISO format 'YYYY-MM-DD'.
+        - end (str): The end date in ISO format 'YYYY-MM-DD'.
+        - schema (Union[str, Schema]): The schema of the records.
+
+        Returns:
+        - Optional[Union[BufferStore, BufferStoreSlice]]: The cached records, or None on a miss.
+        """
+        key = self.make_key(tickers, start, end, schema)
+
+        with self._lock:
+            cached_key, data = self._get_memory(key)
+
+            if data is not None:
+                self.memory_hits += 1
+            else:
+                cached_key, data = self._get_disk(key)
+
+                if data is None:
+                    self.misses += 1
+                    return None
+
+                self.disk_hits += 1
+                self._put_memory(cached_key, data)
+
+        store = store_from_bytes(data)
+
+        if cached_key == key:
+            return store
+        return BufferStoreSlice(store, iso_to_unix(start), iso_to_unix(end))
+
+    def _get_memory(
+        self,
+        key: CacheKey,
+    ) -> Tuple[Optional[CacheKey], Optional[bytes]]:
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return key, self._memory[key]
+
+        for cached_key in reversed(self._memory):
+            if self._covers(cached_key, key):
+                self._memory.move_to_end(cached_key)
+                return cached_key, self._memory[cached_key]
+
+        return None, None
+
+    def _get_disk(
+        self,
+        key: CacheKey,
+    ) -> Tuple[Optional[CacheKey], Optional[bytes]]:
+        if not self.cache_dir:
+            return None, None
+
+        file_name = self._file_name(key)
+        if file_name not in self._index:
+            file_name = next(
+                (
+                    name
+                    for name, entry in reversed(self._index.items())
+                    if self._covers(self._entry_key(entry), key)
+                ),
+                None,
+            )
+
+        if file_name is None:
+            return None, None
+
+        try:
+            with open(os.path.join(self.cache_dir, file_name), "rb") as f:
+                data = zstandard.ZstdDecompressor().decompress(f.read())
+        except (OSError, zstandard.ZstdError) as e:
+            self.logger.warning(f"Dropping unreadable cache file: {e}")
+            self._remove_disk(file_name)
+            self._write_index()
+            return None, None
+
+        self._index.move_to_end(file_name)
+        self._write_index()
+        return self._entry_key(self._index[file_name]), data
+
+    # -- Insert --
+    def put(
+        self,
+        tickers: List[str],
+        start: str,
+        end: str,
+        schema: Union[str, object],
+        store: BufferStore,
+    ) -> None:
+        """
+        Adds a retrieval to both tiers, evicting least recently used entries beyond the size caps.
+
+        Parameters:
+        - tickers (List[str]): A list of ticker symbols.
+        - start (str): The start date in ISO format 'YYYY-MM-DD'.
+        - end (str): The end date in ISO format 'YYYY-MM-DD'.
+        - schema (Union[str, Schema]): The schema of the records.
+        - store (BufferStore): The retrieved records.
+        """
+        key = self.make_key(tickers, start, end, schema)
+        data = store_to_bytes(store)
+
+        with self._lock:
+            self._put_memory(key, data)
+            self._put_disk(key, data)
+
+    def _put_memory(self, key: CacheKey, data: bytes) -> None:
+        if key in self._memory:
+            self._memory_bytes -= len(self._memory.pop(key))
+
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+
+        while self._memory_bytes > self.max_memory_bytes and self._memory:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def _put_disk(self, key: CacheKey, data: bytes) -> None:
+        if not self.cache_dir:
+            return
+
+        compressed = zstandard.ZstdCompressor(
+            level=self.compression_level
+        ).compress(data)
+        file_name = self._file_name(key)
+        path = os.path.join(self.cache_dir, file_name)
+
+        with open(f"{path}.tmp", "wb") as f:
+            f.write(compressed)
+        os.replace(f"{path}.tmp", path)
+
+        self._index.pop(file_name, None)
+        self._index[file_name] = {
+            "tickers": list(key[0]),
+            "start": key[1],
+            "end": key[2],
+            "schema": key[3],
+            "size": len(compressed),
+        }
+
+        total = sum(entry["size"] for entry in self._index.values())
+        while total > self.max_disk_bytes and len(self._index) > 1:
+            evicted = next(iter(self._index))
+            total -= self._index[evicted]["size"]
+            self._remove_disk(evicted)
+
+        self._write_index()
+
+    # -- On-disk index --
+    @staticmethod
+    def _entry_key(entry: Dict) -> CacheKey:
+        return (
+            tuple(entry["tickers"]),
+            entry["start"],
+            entry["end"],
+            entry["schema"],
+        )
+
+    def _remove_disk(self, file_name: str) -> None:
+        self._index.pop(file_name, None)
+        try:
+            os.remove(os.path.join(self.cache_dir, file_name))
+        except FileNotFoundError:
+            pass
+
+    def _load_index(self) -> None:
+        path = os.path.join(self.cache_dir, self.INDEX_FILE)
+
+        if not os.path.exists(path):
+            return
+
+        try:
+            with open(path, "r") as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable cache index: {e}")
+            return
+
+        # Stored least recently used first
+        for file_name, entry in entries:
+            if os.path.exists(os.path.join(self.cache_dir, file_name)):
+                self._index[file_name] = entry
+
+    def _write_index(self) -> None:
+        path = os.path.join(self.cache_dir, self.INDEX_FILE)
+
+        with open(f"{path}.tmp", "w") as f:
+            json.dump(list(self._index.items()), f)
+        os.replace(f"{path}.tmp", path)
@@ -1,13 +1,25 @@
-from typing import List, Optional
+import os
+import numpy as np
+import pandas as pd
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from glob import glob
+from itertools import islice
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
 from mbn import Schema, BufferStore, RecordMsg
 from midasClient.client import DatabaseClient
 from midasClient.historical import RetrieveParams
-from midas.utils.unix import unix_to_iso
-from midas.engine.events import EODEvent
+from midas.engine.events import EODEvent, TimeSliceEvent
 from midas.engine.components.gateways.base import BaseDataClient
+from midas.engine.components.gateways.backtest.cache import HistoricalCache
+from midas.engine.components.gateways.backtest.sharding import (
+    MergedStore,
+    shard_requests,
+)
 from midas.engine.components.observer.base import Subject, EventType
 from midas.symbol import SymbolMap
-from datetime import datetime
+from midas.constants import PRICE_FACTOR
+from datetime import date, timedelta
 from midas.utils.logger import SystemLogger
 
 
@@ -24,10 +36,16 @@ class DataClient(Subject, BaseDataClient):
     - order_book (OrderBook): The order book where market data is posted for trading operations.
     """
 
+    _EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
     def __init__(
         self,
         database_client: DatabaseClient,
         symbols_map: SymbolMap,
+        cache: Optional[HistoricalCache] = None,
+        shard_by: str = "",
+        max_workers: int = 4,
+        time_slices: bool = False,
     ):
         """
         Initializes the DataClient with the necessary components for market data management.
@@ -36,16 +54,40 @@ class DataClient(Subject, BaseDataClient):
         - event_queue (Queue): The main event queue for posting data-related events.
         - data_client (DatabaseClient): The database client used for retrieving market data.
         - order_book (OrderBook): The order book where the market data will be used for trading operations.
+        - cache (Optional[HistoricalCache]): Cache of database retrievals, None always queries the database.
+        - shard_by (str): Split database retrievals into concurrent 'ticker', 'month' or 'ticker_month' shards, '' retrieves in one request.
+        - max_workers (int): Number of shards retrieved concurrently.
+        - time_slices (bool): Stream the records sharing a timestamp as one TimeSliceEvent instead of one record at a time.
         """
         super().__init__()
         self.logger = SystemLogger.get_logger()
         self.database_client = database_client
         self.symbols_map = symbols_map
+        self.cache = cache
+        self.shard_by = shard_by
+        self.max_workers = max_workers
+        self.time_slices = time_slices
         self.data: BufferStore
         self.last_ts = None
         self.next_date = None
         self.current_date = None
         self.eod_triggered = False
+        self._id_table: List[Optional[int]] = []
+        self._cursor = 0
+        self._decoded: Optional[pd.DataFrame] = None
+        self._eod_days: Optional[np.ndarray] = None
+        self._eod_after: Optional[np.ndarray] = None
+        self._eod_base = 0
+        self._eod_synced = False
+        self._eod_carry_day: Optional[int] = None
+        self._eod_fired_day: Optional[int] = None
+        self._windows: Iterator[BufferStore] = iter(())
+        self._pending_record: Optional[RecordMsg] = None
+        self._pending_position = 0
+        self._eod_positions: List[int] = []
+        self._eod_dates: List[int] = []
+        self._eod_next = 0
+        self._next_eod_position = -1
 
     def load_backtest_data(
         self,
@@ -54,18 +96,50 @@ class DataClient(Subject, BaseDataClient):
         end_date: str,
         schema: Schema,
         data_file_path: Optional[str] = None,
+        chunk_days: int = 0,
     ) -> bool:
-        """Loads backtest data."""
+        """
+        Loads backtest data.
+
+        With chunk_days set (database) or a directory as data_file_path (one BufferStore file per window),
+        the data is replayed one window at a time, the next window being loaded only once the current one
+        is exhausted, so memory is bounded by the window size rather than the backtest length. A single
+        BufferStore file is always loaded whole and cannot be combined with chunk_days.
+
+        Parameters:
+        - tickers (List[str]): A list of ticker symbols (e.g., ['AAPL', 'MSFT']).
+        - start_date (str): The start date for the data retrieval in ISO format 'YYYY-MM-DD'.
+        - end_date (str): The end date for the data retrieval in ISO format 'YYYY-MM-DD'.
+        - schema (Schema): The schema of the records.
+        - data_file_path (Optional[str]): Path to a BufferStore file, or a directory of BufferStore files replayed in name order.
+        - chunk_days (int): Length in days of each window retrieved from the database, 0 retrieves the full range at once.
+
+        Returns:
+        - bool: True if the first window of data was loaded.
+        """
+        if (
+            chunk_days > 0
+            and data_file_path
+            and not os.path.isdir(data_file_path)
+        ):
+            raise ValueError(
+                "'chunk_days' cannot be used with a single data file, use "
+                "a directory of BufferStore files instead."
+            )
 
-        self.data = self.get_data(
+        self._windows = self._data_windows(
             tickers,
             start_date,
             end_date,
             schema,
             data_file_path,
+            chunk_days,
         )
+        self._eod_carry_day = None
+        self._eod_fired_day = None
+        self._pending_record = None
 
-        return True
+        return self._next_window()
 
     def get_data(
         self,
@@ -89,38 +163,480 @@ class DataClient(Subject, BaseDataClient):
         - bool: True if data retrieval and initial processing are successful.
         """
         if data_file_path:
-            data = BufferStore.from_file(data_file_path)
-        else:
-            params = RetrieveParams(tickers, start_date, end_date, schema)
-            data = self.database_client.historical.get_records(params)
+            return BufferStore.from_file(data_file_path)
+
+        if self.shard_by:
+            shards = shard_requests(
+                tickers,
+                start_date,
+                end_date,
+                self.shard_by,
+            )
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                stores = list(
+                    executor.map(
+                        lambda shard: self._retrieve(*shard, schema),
+                        shards,
+                    )
+                )
+            return MergedStore(stores)
+
+        return self._retrieve(tickers, start_date, end_date, schema)
+
+    def _retrieve(
+        self,
+        tickers: List[str],
+        start_date: str,
+        end_date: str,
+        schema: Schema,
+    ) -> BufferStore:
+        """
+        Retrieves records from the cache if available, otherwise from the database.
+        """
+        if self.cache:
+            data = self.cache.get(tickers, start_date, end_date, schema)
+            if data is not None:
+                return data
+
+        params = RetrieveParams(tickers, start_date, end_date, schema)
+        data = self.database_client.historical.get_records(params)
+
+        if self.cache:
+            self.cache.put(tickers, start_date, end_date, schema, data)
 
         return data
 
+    def _data_windows(
+        self,
+        tickers: List[str],
+        start_date: str,
+        end_date: str,
+        schema: Schema,
+        data_file_path: Optional[str],
+        chunk_days: int,
+    ) -> Iterator[BufferStore]:
+        """
+        Lazily yields the BufferStore of each replay window.
+        """
+        if data_file_path and os.path.isdir(data_file_path):
+            for file in sorted(glob(os.path.join(data_file_path, "*.bin"))):
+                yield BufferStore.from_file(file)
+        elif chunk_days > 0 and not data_file_path:
+            for start, end in self._date_windows(
+                start_date,
+                end_date,
+                chunk_days,
+            ):
+                yield self.get_data(tickers, start, end, schema)
+        else:
+            yield self.get_data(
+                tickers,
+                start_date,
+                end_date,
+                schema,
+                data_file_path,
+            )
+
+    @staticmethod
+    def _date_windows(
+        start_date: str,
+        end_date: str,
+        chunk_days: int,
+    ) -> List[Tuple[str, str]]:
+        """
+        Splits a date range into consecutive windows, each window ending where the next one starts.
+
+        Parameters:
+        - start_date (str): The start date in ISO format 'YYYY-MM-DD'.
+        - end_date (str): The end date in ISO format 'YYYY-MM-DD'.
+        - chunk_days (int): Length of each window in days.
+
+        Returns:
+        - List[Tuple[str, str]]: The (start, end) dates of each window in ISO format.
+        """
+        start = date.fromisoformat(start_date)
+        end = date.fromisoformat(end_date)
+        step = timedelta(days=chunk_days)
+
+        windows = []
+        while start < end:
+            window_end = min(start + step, end)
+            windows.append((start.isoformat(), window_end.isoformat()))
+            start = window_end
+        return windows
+
+    def _next_window(self) -> bool:
+        """
+        Replaces the current data with the next replay window, carrying the end-of-day state over.
+
+        Returns:
+        - bool: False when there are no windows left.
+        """
+        if self._eod_synced and self._eod_days is not None:
+            days = self._eod_days[self._eod_base :]
+            if len(days):
+                last_day = int(days.max())
+                if (
+                    self._eod_carry_day is None
+                    or last_day > self._eod_carry_day
+                ):
+                    self._eod_carry_day = last_day
+
+        # Release the exhausted window before loading the next one
+        self.data = None
+        data = next(self._windows, None)
+
+        if data is None:
+            return False
+
+        self.data = data
+        self._index_data()
+        return True
+
+    def _index_data(self) -> None:
+        """
+        Decodes the loaded BufferStore once and builds the instrument id table and end-of-day boundary
+        index from its instrument id and timestamp columns only.
+
+        BufferStore has no column selective decode, so the whole window is decoded. The frame is kept for
+        get_aligned_window and released as soon as the replay starts.
+        """
+        columns = self.data.decode_to_df(pretty_ts=False, pretty_px=False)
+        native_ids = columns["instrument_id"].to_numpy(dtype=np.int64)
+        timestamps = columns["ts_event"].to_numpy(dtype=np.int64)
+
+        # Reused by get_aligned_window until the replay starts
+        self._decoded = columns
+        self._cursor = 0
+
+        # One pass over the instrument id column serves both indexes
+        unique_ids, inverse = np.unique(native_ids, return_inverse=True)
+        self._build_id_table(unique_ids)
+        self._build_eod_index(unique_ids, inverse, timestamps)
+
+    def _build_id_table(self, unique_ids: np.ndarray) -> None:
+        """
+        Resolves every native instrument id in the loaded BufferStore to its Midas instrument id once,
+        storing the result in a dense list indexed by the native id.
+
+        Parameters:
+        - unique_ids (np.ndarray): The distinct native instrument ids of the records.
+        """
+        self._id_table = []
+        for native_id in unique_ids.tolist():
+            self._resolve_id(native_id)
+
+    def _build_eod_index(
+        self,
+        unique_ids: np.ndarray,
+        inverse: np.ndarray,
+        timestamps: np.ndarray,
+    ) -> None:
+        """
+        Computes, in one vectorized pass, the New York trading date of every record and whether it falls
+        after the day session close of its symbol. The record offsets where end-of-day events fire are
+        derived from these arrays.
+
+        Parameters:
+        - unique_ids (np.ndarray): The distinct native instrument ids of the records.
+        - inverse (np.ndarray): The position in unique_ids of every record's native instrument id.
+        - timestamps (np.ndarray): The ts_event (UNIX nanoseconds) of every record.
+        """
+        # Local dates and close checks from the session table of each symbol
+        days = np.empty(len(timestamps), dtype=np.int64)
+        after = np.empty(len(timestamps), dtype=bool)
+        for i, native_id in enumerate(unique_ids.tolist()):
+            symbol = self.symbols_map.map[self._id_table[native_id]]
+            rows = inverse == i
+            days[rows] = symbol.session_table.days(timestamps[rows])
+            after[rows] = symbol.session_table.after_close_array(
+                timestamps[rows]
+            )
+
+        self._eod_days = days
+        self._eod_after = after
+        self._set_eod_boundaries(0)
+
+    def _eod_boundaries(self, start: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Derives the end-of-day trigger offsets for a replay beginning at the given record offset.
+
+        The current date only moves forward, so it is the running maximum of the record dates, and an
+        event fires at the first after-close record of each current date.
+
+        The running date and last fired date of previous windows are carried into the computation.
+
+        Parameters:
+        - start (int): Offset of the first record checked for end-of-day.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray]: Record offsets of the events and the day number of each event.
+        """
+        current_days = np.maximum.accumulate(self._eod_days[start:])
+        if self._eod_carry_day is not None:
+            np.maximum(current_days, self._eod_carry_day, out=current_days)
+
+        candidates = np.flatnonzero(self._eod_after[start:])
+        candidate_days = current_days[candidates]
+
+        first = np.ones(len(candidates), dtype=bool)
+        first[1:] = candidate_days[1:] != candidate_days[:-1]
+
+        # Already fired in a previous window
+        if self._eod_fired_day is not None:
+            first &= candidate_days != self._eod_fired_day
+
+        return candidates[first] + start, candidate_days[first]
+
+    def _set_eod_boundaries(self, start: int) -> None:
+        positions, days = self._eod_boundaries(start)
+        self._eod_base = start
+        self._eod_synced = False
+        self._eod_positions = positions.tolist()
+        self._eod_dates = days.tolist()
+        self._eod_next = 0
+        self._next_eod_position = (
+            self._eod_positions[0] if self._eod_positions else -1
+        )
+
+    def _resolve_id(self, native_id: int) -> int:
+        """
+        Maps a BufferStore native instrument id to the Midas instrument id and caches it in the id table.
+
+        Parameters:
+        - native_id (int): The instrument id as found in the BufferStore records.
+
+        Returns:
+        - int: The Midas instrument id.
+        """
+        ticker = self.data.metadata.mappings.get_ticker(native_id)
+        symbol = self.symbols_map.get_symbol(ticker)
+
+        if symbol is None:
+            raise ValueError(f"Ticker {ticker} not found in symbols map.")
+
+        if native_id >= len(self._id_table):
+            self._id_table.extend(
+                [None] * (native_id + 1 - len(self._id_table))
+            )
+
+        self._id_table[native_id] = symbol.instrument_id
+        return symbol.instrument_id
+
     def next_record(self) -> RecordMsg:
+        # All windows replayed
+        if self.data is None:
+            return None
+
         record = self.data.replay()
 
-        if record is None:
-            return None
+        while record is None:
+            if not self._next_window():
+                return None
+            record = self.data.replay()
+
+        # Release the decoded window once the replay has started
+        if self._decoded is not None:
+            self._decoded = None
 
         # Adjust instrument id
-        id = record.hd.instrument_id
-        ticker = self.data.metadata.mappings.get_ticker(id)
-        new_id = self.symbols_map.get_symbol(ticker).instrument_id
+        native_id = record.hd.instrument_id
+        try:
+            new_id = self._id_table[native_id]
+        except IndexError:
+            new_id = None
+
+        if new_id is None:
+            new_id = self._resolve_id(native_id)
+
         record.instrument_id = new_id
+        self._cursor += 1
 
         return record
 
+    def get_aligned_window(
+        self,
+        rows: int,
+        instrument_ids: Optional[Sequence[int]] = None,
+        column: str = "close",
+        pretty_px: bool = True,
+        as_frame: bool = True,
+    ) -> Union[pd.DataFrame, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Reads the next timestamps where every instrument has a record, e.g. to warm up a strategy, as one
+        column per instrument.
+
+        The columns decoded when each replay window is loaded are scattered into a timestamp by instrument
+        grid, instead of replaying records one at a time. A timestamp whose records straddle two windows is
+        completed with the records of the next window. The replay then resumes after the last timestamp
+        returned, so records up to and including it are consumed, as a primer reading them with
+        next_record would.
+
+        Parameters:
+        - rows (int): Number of aligned timestamps to read.
+        - instrument_ids (Optional[Sequence[int]]): The instruments to align, defaults to every symbol in the symbols map.
+        - column (str): The record field to read, e.g. 'close'.
+        - pretty_px (bool): Read prices as floats, otherwise the fixed-point integers are kept exact.
+        - as_frame (bool): Return a DataFrame indexed by ts_event with one column per instrument id, otherwise the timestamps and a (rows, instruments) array.
+
+        Returns:
+        - Union[pd.DataFrame, Tuple[np.ndarray, np.ndarray]]: The aligned window.
+        """
+        if rows < 1:
+            raise ValueError("'rows' must be greater than zero.")
+
+        if instrument_ids is None:
+            instrument_ids = self.symbols_map.instrument_ids
+        instrument_ids = np.asarray(instrument_ids, dtype=np.int64)
+
+        timestamps, values = [], []
+        needed = rows
+        carry = None
+        while needed:
+            if self.data is None:
+                raise RuntimeError("Not enough records to fill the window.")
+
+            window_ts, window_values, consumed, carry = self._aligned_rows(
+                instrument_ids, column, pretty_px, needed, carry
+            )
+            timestamps.append(window_ts)
+            values.append(window_values)
+            needed -= len(window_ts)
+
+            self._skip(consumed)
+            if needed:
+                self._next_window()
+
+        timestamps = np.concatenate(timestamps)
+        values = np.concatenate(values)
+
+        if not as_frame:
+            return timestamps, values
+
+        return pd.DataFrame(
+            values,
+            index=pd.Index(timestamps, name="ts_event"),
+            columns=instrument_ids.tolist(),
+            copy=False,
+        )
+
+    def _aligned_rows(
+        self,
+        instrument_ids: np.ndarray,
+        column: str,
+        pretty_px: bool,
+        limit: int,
+        carry: Optional[Tuple[int, np.ndarray, np.ndarray]],
+    ) -> Tuple[
+        np.ndarray,
+        np.ndarray,
+        int,
+        Optional[Tuple[int, np.ndarray, np.ndarray]],
+    ]:
+        """
+        Finds the aligned timestamps among the unread records of the loaded window.
+
+        Parameters:
+        - instrument_ids (np.ndarray): The instruments to align.
+        - column (str): The record field to read.
+        - pretty_px (bool): Read prices as floats.
+        - limit (int): Maximum number of aligned timestamps.
+        - carry (Optional[Tuple[int, np.ndarray, np.ndarray]]): The timestamp, values and presence of the unaligned last row of the previous window.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray, int, Optional[Tuple[int, np.ndarray, np.ndarray]]]: The timestamps, their
+          values, the number of records up to the last timestamp, or every unread record when fewer than
+          limit timestamps are aligned, and the unaligned last row to carry into the next window.
+        """
+        if self._decoded is None:
+            self._decoded = self.data.decode_to_df(
+                pretty_ts=False, pretty_px=False
+            )
+        start = self._cursor
+        native_ids = self._decoded["instrument_id"].to_numpy(dtype=np.int64)[
+            start:
+        ]
+        timestamps = self._decoded["ts_event"].to_numpy(dtype=np.int64)[start:]
+        field = self._decoded[column].to_numpy()[start:]
+        if pretty_px and self._is_price(column):
+            field = field / PRICE_FACTOR
+
+        # Position of each record's instrument in the window columns, -1 if not requested
+        id_table = np.array(
+            [-1 if i is None else i for i in self._id_table], dtype=np.int64
+        )
+        ids = id_table[native_ids]
+        positions = np.full(
+            max(int(ids.max(initial=0)), int(instrument_ids.max())) + 2,
+            -1,
+            dtype=np.intp,
+        )
+        positions[instrument_ids] = np.arange(len(instrument_ids))
+        positions = positions[ids]
+
+        requested = positions >= 0
+        record_ts = timestamps[requested]
+        positions = positions[requested]
+
+        # Records are in time order, so rows are numbered by timestamp changes
+        new_row = np.ones(len(record_ts), dtype=bool)
+        new_row[1:] = record_ts[1:] != record_ts[:-1]
+        row = np.cumsum(new_row) - 1
+        row_ts = record_ts[new_row]
+        grid = np.zeros((len(row_ts), len(instrument_ids)), dtype=field.dtype)
+        grid[row, positions] = field[requested]
+        present = np.zeros(grid.shape, dtype=bool)
+        present[row, positions] = True
+
+        # Complete the last row of the previous window with the records of its timestamp
+        if carry is not None and len(row_ts):
+            carry_ts, carry_values, carry_present = carry
+            if row_ts[0] == carry_ts:
+                fill = carry_present & ~present[0]
+                grid[0, fill] = carry_values[fill]
+                present[0] |= carry_present
+            carry = None
+
+        complete = present.all(axis=1)
+        aligned = np.flatnonzero(complete)[:limit]
+        window_ts = row_ts[aligned]
+
+        if len(window_ts) < limit:
+            consumed = len(timestamps)
+            if len(row_ts) and not complete[-1]:
+                carry = (int(row_ts[-1]), grid[-1], present[-1])
+        else:
+            consumed = int(
+                np.searchsorted(timestamps, window_ts[-1], side="right")
+            )
+            carry = None
+        return window_ts, grid[aligned], consumed, carry
+
+    @staticmethod
+    def _is_price(column: str) -> bool:
+        """Whether a record field holds a fixed-point price."""
+        return column in ("open", "high", "low", "close", "price") or (
+            column.endswith("_px")
+        )
+
+    def _skip(self, count: int) -> None:
+        """
+        Advances the replay of the loaded window by count records.
+
+        BufferStore has no seek, so the records are replayed and dropped by an iterator drained in C, without
+        a Python call per record.
+        """
+        deque(islice(iter(self.data.replay, None), count), maxlen=0)
+        self._cursor += count
+
     def data_stream(self) -> bool:
         """
         Simulate data stream.
+
+        With time_slices set, every consecutive record sharing a ts_event is notified as one TimeSliceEvent.
         """
-        # record = self.data.replay()
-        #
-        # # Adjust instrument id
-        # id = record.hd.instrument_id
-        # ticker = self.data.metadata.mappings.get_ticker(id)
-        # new_id = self.symbols_map.get_symbol(ticker).instrument_id
-        # record.instrument_id = new_id
+        if self.time_slices:
+            return self._time_slice_stream()
 
         record = self.next_record()
 
@@ -132,24 +648,109 @@ class DataClient(Subject, BaseDataClient):
 
         # Update market data
         self.notify(EventType.MARKET_DATA, record)
-        # elf.notify_market_data(record)
 
         return True
 
-    def _check_eod(self, record: RecordMsg):
+    def _time_slice_stream(self) -> bool:
         """
-        Checks if the current record marks the end of a trading day.
+        Simulate data stream one timestamp at a time.
+
+        The first record of the next slice is read ahead and held until the following call. End-of-day
+        checks still run per record, so an end-of-day event is notified before the slice that triggers it.
         """
-        ts = datetime.fromisoformat(
-            unix_to_iso(record.ts_event, tz_info="America/New_York")
+        record = self._pending_record
+        position = self._pending_position
+
+        if record is None:
+            record = self.next_record()
+            position = self._cursor - 1
+
+            if record is None:
+                return False
+
+        timestamp = record.ts_event
+        records = []
+
+        while record is not None and record.ts_event == timestamp:
+            self._check_eod(record, position)
+            records.append(record)
+            record = self.next_record()
+            position = self._cursor - 1
+
+        self._pending_record = record
+        self._pending_position = position
+
+        self.notify(
+            EventType.MARKET_DATA,
+            TimeSliceEvent(timestamp=timestamp, data=records),
         )
-        date = ts.date()
 
-        if not self.current_date or date > self.current_date:
-            self.current_date = date
-            self.eod_triggered = False
+        return True
+
+    def _check_eod(self, record: RecordMsg, position: Optional[int] = None):
+        """
+        Checks if the current record marks the end of a trading day.
+
+        When data was loaded through load_backtest_data this compares the replay position of the record,
+        by default the last record read, against the precomputed end-of-day offsets, otherwise the record
+        is evaluated directly.
+        """
+        if self._eod_after is None:
+            self._check_eod_record(record)
+            return
+
+        if position is None:
+            position = self._cursor - 1
+
+        # Records consumed before the first check (e.g. strategy primer) are not part of the replay
+        if not self._eod_synced:
+            if position != self._eod_base:
+                self._set_eod_boundaries(position)
+            self._eod_synced = True
+
+        if position < self._next_eod_position or self._next_eod_position < 0:
+            return
+
+        while (
+            self._eod_next < len(self._eod_positions)
+            and self._eod_positions[self._eod_next] < position
+        ):
+            self._eod_next += 1
+
+        if (
+            self._eod_next < len(self._eod_positions)
+            and self._eod_positions[self._eod_next] == position
+        ):
+            self._eod_fired_day = self._eod_dates[self._eod_next]
+            self.current_date = date.fromordinal(
+                self._EPOCH_ORDINAL + self._eod_fired_day
+            )
+            self.logger.info("EOD triggered")
+            self.eod_triggered = True
+            self.notify(
+                EventType.EOD_EVENT,
+                EODEvent(timestamp=self.current_date),
+            )
+            self._eod_next += 1
+
+        self._next_eod_position = (
+            self._eod_positions[self._eod_next]
+            if self._eod_next < len(self._eod_positions)
+            else -1
+        )
 
+    def _check_eod_record(self, record: RecordMsg):
+        """
+        Checks if the given record marks the end of a trading day by converting its timestamp.
+        """
         symbol = self.symbols_map.map[record.instrument_id]
+        day = date.fromordinal(
+            self._EPOCH_ORDINAL + symbol.session_table.day(record.ts_event)
+        )
+
+        if not self.current_date or day > self.current_date:
+            self.current_date = day
+            self.eod_triggered = False
 
         if not self.eod_triggered and symbol.after_day_session(
             record.ts_event
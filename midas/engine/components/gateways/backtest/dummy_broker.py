@@ -1,15 +1,25 @@
+import math
+import heapq
+from itertools import count
 from ibapi.contract import Contract
-from typing import Dict, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from mbn import RecordMsg
 from midas.symbol import Symbol
 from midas.engine.components.order_book import OrderBook
-from midas.engine.events import ExecutionEvent
+from midas.engine.events import ExecutionEvent, EODEvent
 from midas.trade import Trade
-from midas.orders import Action, BaseOrder
+from midas.orders import Action, BaseOrder, OrderType
+from midas.active_orders import ActiveOrder
 from midas.account import Account, EquityDetails
-from midas.positions import position_factory, Position
+from midas.positions import position_factory, PositionBook
+from midas.cost_models import CostModel, FixedCostModel
 from midas.utils.logger import SystemLogger
 from midas.engine.components.observer.base import Subject, Observer, EventType
 from midas.symbol import SymbolMap
+from midas.engine.components.gateways.backtest.matching_engine import (
+    MatchingEngine,
+    RestingOrder,
+)
 
 
 class DummyBroker(Subject, Observer):
@@ -25,9 +35,14 @@ class DummyBroker(Subject, Observer):
     - order_book (OrderBook): The order book for retrieving market data and managing orders.
     - logger (Logger): The logger for recording broker activities and errors.
     - symbols_map (Dict[str, Symbol]): A mapping of ticker symbols to instrument details.
-    - positions (Dict[Contract, PositionDetails]): Current positions held by the broker.
+    - positions (PositionBook): Current positions held by the broker, stored in columnar arrays.
     - last_trade (Dict[str, ExecutionDetails]): Details of the last executed trades.
     - account (AccountDetails): Details of the broker's account including available funds, P&L, etc.
+    - matching_engine (MatchingEngine): Resting limit and stop orders, filled when market data crosses their price.
+    - reconcile_every (int): Number of incremental re-marks between full re-marks checking the running account totals, 0 disables the check.
+    - order_latency (Dict[str, int]): Nanoseconds between an order being placed and reaching the venue, by venue name with 'default' for the others.
+    - pending_orders (List[tuple]): Heap of orders placed but not yet at the venue, ordered by release timestamp then placement.
+    - cost_model (CostModel): Computes the slippage and fees of fills, a batch of fills at once.
     """
 
     def __init__(
@@ -35,6 +50,9 @@ class DummyBroker(Subject, Observer):
         symbols_map: SymbolMap,
         order_book: OrderBook,
         capital: float,
+        reconcile_every: int = 0,
+        order_latency: Optional[Dict[str, int]] = None,
+        cost_model: Optional[CostModel] = None,
     ):
         """
         Initializes the DummyBroker with necessary components and account details.
@@ -44,20 +62,31 @@ class DummyBroker(Subject, Observer):
         - event_queue (Queue): The queue for posting execution events.
         - order_book (OrderBook): The order book for managing orders and retrieving market data.
         - capital (float): Initial capital available in the broker's account.
+        - reconcile_every (int): Number of incremental re-marks between full re-marks checking the running account totals, 0 disables the check.
+        - order_latency (Optional[Dict[str, int]]): Nanoseconds between an order being placed and reaching the venue, by venue name with 'default' for the others. None fills orders as soon as they are placed.
+        - cost_model (Optional[CostModel]): Computes the slippage and fees of fills, None uses each symbol's fees and slippage factor.
         - logger (Logger): The logger instance for recording broker activities.
         """
         super().__init__()
         self.logger = SystemLogger.get_logger()
         self.order_book = order_book
         self.symbols_map = symbols_map
+        self.reconcile_every = reconcile_every
+        self.order_latency = order_latency or {}
+        self.cost_model = cost_model or FixedCostModel(symbols_map)
 
         # Variables
-        self.positions: Dict[Contract, Position] = {}
-        self.unrealized_pnl: Dict[str, float] = {"account": 0}
-        self.margin_required: Dict[str, float] = {"account": 0}
-        self.liquidation_value: Dict[str, float] = {"account": 0}
+        self.positions = PositionBook(symbols_map)
+        self._unrealized_pnl_total = 0.0
+        self._margin_required_total = 0.0
+        self._liquidation_value_total = 0.0
+        self._marks = 0
         self.last_trades: Dict[str, Trade] = {}
         self.last_trade: Union[Trade, None] = None
+        self.matching_engine = MatchingEngine()
+        self.pending_orders: List[tuple] = []
+        self._pending_sequence = count()
+        self._latencies: Dict[int, int] = {}
         self.account = Account(
             timestamp=None,
             full_available_funds=capital,
@@ -66,6 +95,9 @@ class DummyBroker(Subject, Observer):
             unrealized_pnl=0,
         )
 
+    def event_handlers(self) -> Dict[EventType, Callable[..., None]]:
+        return {EventType.EOD_EVENT: self.handle_eod}
+
     def handle_event(
         self,
         subject: Subject,
@@ -73,10 +105,19 @@ class DummyBroker(Subject, Observer):
         event,
     ) -> None:
         if event_type == EventType.EOD_EVENT:
-            self.logger.info(event)
-            self.mark_to_market()
-            self.check_margin_call()
-            self.notify(EventType.EOD_EVENT, event)
+            self.handle_eod(event)
+
+    def handle_eod(self, event: EODEvent) -> None:
+        """
+        Marks positions to market and checks margin at the end of a trading day, then forwards the event.
+
+        Parameters:
+        - event (EODEvent): The end-of-day event.
+        """
+        self.logger.info("%s", event)
+        self.mark_to_market()
+        self.check_margin_call()
+        self.notify(EventType.EOD_EVENT, event)
 
     def placeOrder(
         self,
@@ -86,10 +127,14 @@ class DummyBroker(Subject, Observer):
         action: Action,
         contract: Contract,
         order: BaseOrder,
-    ) -> None:
+    ) -> Optional[int]:
         """
         Simulates the placing fo an order to the broker in the backtest environment.
 
+        Orders on a venue with a latency are queued until replay time reaches the placement time plus the latency,
+        see release_orders. Once at the venue, market orders fill at the last price plus slippage, limit and stop
+        orders rest in the matching engine until market data crosses their price.
+
         Parameters:
         - timestamp (int): The timestamp of the order.
         - trade_id (int): The unique identifier for the trade.
@@ -97,15 +142,239 @@ class DummyBroker(Subject, Observer):
         - action (Action): The action to perform (BUY or SELL).
         - contract (Contract): The contract for which the order is placed.
         - order (BaseOrder): The order details including quantity, price, etc.
+
+        Returns:
+        - Optional[int]: The order id of a resting order, None if the order filled immediately or is queued.
         """
         symbol = self.symbols_map.get_symbol(contract.symbol)
 
-        # Order Data
-        quantity = order.quantity  # +/- values
-        mkt_data = self.order_book.retrieve(symbol.instrument_id)
-        fill_price = symbol.slippage_price(mkt_data.pretty_price, action)
-        fees = symbol.commission_fees(quantity)
+        latency = self._latencies.get(symbol.instrument_id)
+        if latency is None:
+            latency = self._latencies[symbol.instrument_id] = (
+                self.order_latency.get(
+                    symbol.exchange.value, self.order_latency.get("default", 0)
+                )
+            )
 
+        if latency:
+            heapq.heappush(
+                self.pending_orders,
+                (
+                    timestamp + latency,
+                    next(self._pending_sequence),
+                    trade_id,
+                    leg_id,
+                    action,
+                    symbol,
+                    order,
+                ),
+            )
+            return None
+
+        if order.order.orderType != OrderType.MARKET.value:
+            return self._rest(
+                timestamp, trade_id, leg_id, action, symbol, order
+            )
+
+        self._fill_market_orders(
+            timestamp, [(trade_id, leg_id, action, symbol, order)]
+        )
+        return None
+
+    def release_orders(self, timestamp: int) -> None:
+        """
+        Submits the queued orders whose latency has elapsed by the given replay time, in release order.
+
+        Market orders released together fill as a batch against the current order book, with their slippage and
+        fees computed in one call to the cost model.
+
+        Parameters:
+        - timestamp (int): The current replay time in nanoseconds.
+        """
+        pending = self.pending_orders
+        market_orders = []
+        while pending and pending[0][0] <= timestamp:
+            _, _, trade_id, leg_id, action, symbol, order = heapq.heappop(
+                pending
+            )
+            if order.order.orderType == OrderType.MARKET.value:
+                market_orders.append((trade_id, leg_id, action, symbol, order))
+            else:
+                self._rest(timestamp, trade_id, leg_id, action, symbol, order)
+
+        if market_orders:
+            self._fill_market_orders(timestamp, market_orders)
+
+    def _rest(
+        self,
+        timestamp: int,
+        trade_id: int,
+        leg_id: int,
+        action: Action,
+        symbol: Symbol,
+        order: BaseOrder,
+    ) -> int:
+        resting = self.matching_engine.add(
+            timestamp,
+            trade_id,
+            leg_id,
+            action,
+            symbol,
+            order,
+        )
+        self._update_order(resting, "Submitted")
+        return resting.order_id
+
+    def _fill_market_orders(
+        self,
+        timestamp: int,
+        orders: List[Tuple[int, int, Action, Symbol, BaseOrder]],
+    ) -> None:
+        """
+        Fills market orders at the last price plus slippage.
+
+        Parameters:
+        - timestamp (int): The timestamp of the fills.
+        - orders (List[Tuple[int, int, Action, Symbol, BaseOrder]]): The trade id, leg id, action, symbol and order of each fill.
+        """
+        instrument_ids = [
+            symbol.instrument_id for _, _, _, symbol, _ in orders
+        ]
+        quantities = [order.quantity for _, _, _, _, order in orders]
+        prices = [
+            self.order_book.retrieve(instrument_id).pretty_price
+            for instrument_id in instrument_ids
+        ]
+        fill_prices, fees = self.cost_model.fills(
+            instrument_ids, quantities, prices
+        )
+
+        for (trade_id, leg_id, action, symbol, order), fill_price, fee in zip(
+            orders, fill_prices.tolist(), fees.tolist()
+        ):
+            self._fill(
+                timestamp,
+                trade_id,
+                leg_id,
+                action,
+                symbol,
+                order.quantity,
+                fill_price,
+                fee,
+            )
+
+    def match_orders(self, record: RecordMsg) -> None:
+        """
+        Fills the resting orders crossed by a market data record.
+
+        Limit orders fill at their limit price, stop orders at their stop price plus slippage.
+
+        Parameters:
+        - record (RecordMsg): The market data record.
+        """
+        crossed = self.matching_engine.match(record)
+        if not crossed:
+            return
+
+        instrument_ids = [resting.symbol.instrument_id for resting in crossed]
+        quantities = [resting.order.quantity for resting in crossed]
+        prices = [
+            (
+                resting.order.order.lmtPrice
+                if resting.is_limit
+                else resting.order.order.auxPrice
+            )
+            for resting in crossed
+        ]
+        slippage_prices = self.cost_model.slippage_prices(
+            instrument_ids, quantities, prices
+        ).tolist()
+        fill_prices = [
+            price if resting.is_limit else slippage_price
+            for resting, price, slippage_price in zip(
+                crossed, prices, slippage_prices
+            )
+        ]
+        fees = self.cost_model.commission_fees(
+            instrument_ids, quantities, fill_prices
+        ).tolist()
+
+        for resting, fill_price, fee in zip(crossed, fill_prices, fees):
+            self._update_order(resting, "Filled")
+            self._fill(
+                record.ts_event,
+                resting.trade_id,
+                resting.leg_id,
+                resting.action,
+                resting.symbol,
+                resting.order.quantity,
+                fill_price,
+                fee,
+            )
+
+    def cancel_order(self, order_id: int) -> bool:
+        """
+        Cancels a resting order.
+
+        Parameters:
+        - order_id (int): The id of the order to cancel.
+
+        Returns:
+        - bool: True if the order was resting and is now cancelled.
+        """
+        resting = self.matching_engine.cancel(order_id)
+        if resting is None:
+            return False
+
+        self._update_order(resting, "Cancelled")
+        return True
+
+    def _update_order(self, resting: RestingOrder, status: str) -> None:
+        order = resting.order.order
+        contract = resting.symbol.contract
+        self.notify(
+            EventType.ORDER_UPDATE,
+            ActiveOrder(
+                permId=resting.order_id,
+                clientId=0,
+                orderId=resting.order_id,
+                parentId=0,
+                status=status,
+                instrument=resting.symbol.instrument_id,
+                secType=contract.secType,
+                exchange=contract.exchange,
+                action=order.action,
+                orderType=order.orderType,
+                totalQty=float(order.totalQuantity),
+                lmtPrice=order.lmtPrice,
+                auxPrice=order.auxPrice,
+            ),
+        )
+
+    def _fill(
+        self,
+        timestamp: int,
+        trade_id: int,
+        leg_id: int,
+        action: Action,
+        symbol: Symbol,
+        quantity: float,
+        fill_price: float,
+        fees: float,
+    ) -> None:
+        """
+        Executes a fill, updating positions, account and trades and notifying the execution.
+
+        Parameters:
+        - timestamp (int): The timestamp of the fill.
+        - trade_id (int): The unique identifier for the trade.
+        - leg_id (int): The identifier for the leg of the trade.
+        - action (Action): The action of the order filled.
+        - symbol (Symbol): The symbol of the instrument filled.
+        - quantity (float): The signed quantity filled.
+        - fill_price (float): The fill price.
+        - fees (float): The commission fees of the fill, negative.
+        """
         # Adjust cash by fees
         self.account.full_available_funds += fees
 
@@ -147,50 +416,106 @@ class DummyBroker(Subject, Observer):
         Notes:
         - This method handles updating the broker's positions, including adding new positions, updating existing positions, and removing positions if they are closed out completely.
         """
-        if symbol.contract not in self.positions:
+        position = self.positions.get(symbol.contract)
+        if position is None:
             details = {
                 "action": action.to_broker_standard(),
                 "quantity": quantity,
                 "avg_price": fill_price,
                 "market_price": fill_price,
             }
-            self.positions[symbol.contract] = position_factory(
+            position = position_factory(
                 asset_type=symbol.security_type, symbol=symbol, **details
             )
-            impact = self.positions[symbol.contract].position_impact()
+            impact = position.position_impact()
         else:
-            impact = self.positions[symbol.contract].update(
-                quantity, fill_price, fill_price, action
-            )
+            impact = position.update(quantity, fill_price, fill_price, action)
+        self.positions[symbol.contract] = position
 
         # Update cash impact of position trade
         self.account.full_available_funds += impact.cash
 
     def _update_account(self):
-        for contract, position in self.positions.items():
-            symbol = self.symbols_map.get_symbol(contract.symbol)
-            mkt_data = self.order_book.retrieve(symbol.instrument_id)
-            position.market_price = mkt_data.pretty_price
-            impact = position.position_impact()
+        """
+        Re-marks every position and recomputes the account totals from scratch.
+        """
+        prices = [
+            self.order_book.retrieve(instrument_id).pretty_price
+            for instrument_id in self.positions.instrument_ids()
+        ]
+        (
+            self._unrealized_pnl_total,
+            self._margin_required_total,
+            self._liquidation_value_total,
+        ) = self.positions.mark(prices)
+        self._set_account_totals()
+
+    def mark_instrument(self, instrument_id: int) -> None:
+        """
+        Re-marks the position in an instrument to its latest price, adjusting the running account totals by the change.
 
-            # Update postion specific account values
-            self.unrealized_pnl[contract] = impact.unrealized_pnl
-            self.margin_required[contract] = impact.margin_required
-            self.liquidation_value[contract] = impact.liquidation_value
+        Only the position whose price changed is revalued, the cost does not grow with the number of positions.
 
-        # Update Account values
-        self.account.unrealized_pnl = sum(
-            value for key, value in self.unrealized_pnl.items()
-        )
-        self.account.full_init_margin_req = sum(
-            value for key, value in self.margin_required.items()
-        )
+        Parameters:
+        - instrument_id (int): The instrument with new market data.
+        """
+        if self.positions.has_instrument(instrument_id):
+            mkt_data = self.order_book.retrieve(instrument_id)
+            unrealized_pnl, margin_required, liquidation_value = (
+                self.positions.mark_instrument(
+                    instrument_id, mkt_data.pretty_price
+                )
+            )
+            self._unrealized_pnl_total += unrealized_pnl
+            self._margin_required_total += margin_required
+            self._liquidation_value_total += liquidation_value
+        self._set_account_totals()
+
+        if self.reconcile_every:
+            self._marks += 1
+            if self._marks % self.reconcile_every == 0:
+                self._reconcile()
+
+    def _set_account_totals(self) -> None:
+        self.account.unrealized_pnl = self._unrealized_pnl_total
+        self.account.full_init_margin_req = self._margin_required_total
         self.account.net_liquidation = (
-            sum(value for key, value in self.liquidation_value.items())
-            + self.account.full_available_funds
+            self._liquidation_value_total + self.account.full_available_funds
         )
         self.account.timestamp = self.order_book.last_updated
 
+    def _reconcile(self) -> bool:
+        """
+        Checks the running account totals against a full re-mark, which also resets them.
+
+        Returns:
+        - bool: True if the running totals matched the full re-mark.
+        """
+        running = (
+            self._unrealized_pnl_total,
+            self._margin_required_total,
+            self._liquidation_value_total,
+        )
+        self._update_account()
+        full = (
+            self._unrealized_pnl_total,
+            self._margin_required_total,
+            self._liquidation_value_total,
+        )
+
+        if all(
+            math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-6)
+            for a, b in zip(running, full)
+        ):
+            return True
+
+        self.logger.error(
+            "Account totals diverged from full re-mark, running %s, full %s",
+            running,
+            full,
+        )
+        return False
+
     def _update_trades(
         self,
         timestamp: int,
@@ -339,7 +664,7 @@ class DummyBroker(Subject, Observer):
         # Keys to remove positions that are full-exited
         keys_to_remove = [
             contract
-            for contract, position in self.positions.items()
+            for contract, position in positions.items()
             if position.quantity == 0
         ]
         for contract in keys_to_remove:
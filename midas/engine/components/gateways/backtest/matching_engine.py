@@ -0,0 +1,195 @@
+import heapq
+from itertools import count
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
+from mbn import BboMsg, OhlcvMsg
+from midas.symbol import Symbol
+from midas.orders import Action, BaseOrder, OrderType
+
+# Heaps kept per instrument, keyed so the first order to cross is on top
+BUY_LIMIT, SELL_LIMIT, BUY_STOP, SELL_STOP = range(4)
+
+
+@dataclass
+class RestingOrder:
+    """
+    Limit or stop order resting in the backtest matching engine.
+
+    Attributes:
+    - order_id (int): Identifier assigned when the order was placed.
+    - timestamp (int): UNIX timestamp in nanoseconds when the order was placed.
+    - trade_id (int): The trade identifier.
+    - leg_id (int): The leg identifier of the trade.
+    - action (Action): The action of the order.
+    - symbol (Symbol): The symbol of the instrument ordered.
+    - order (BaseOrder): The limit or stop order.
+    - price (int): The limit or stop price, scaled by 1e9 like market data prices.
+    """
+
+    order_id: int
+    timestamp: int
+    trade_id: int
+    leg_id: int
+    action: Action
+    symbol: Symbol
+    order: BaseOrder
+    price: int
+
+    @property
+    def is_limit(self) -> bool:
+        return self.order.order.orderType == OrderType.LIMIT.value
+
+
+class MatchingEngine:
+    """
+    Holds the resting limit and stop orders of a backtest in price-sorted heaps per instrument.
+
+    Each instrument has four heaps (buy limits, sell limits, buy stops, sell stops) keyed so the order closest to
+    crossing is on top. A market record pops only the orders it crosses, O(log n) per order in the heap, and leaves
+    the rest untouched. Cancelled orders are dropped from the order index and their heap entries skipped when they
+    reach the top; heaps are rebuilt once stale entries outnumber live orders.
+
+    A bar crosses orders within its low-high range, a BBO crosses buy orders at the ask and sell orders at the bid.
+
+    Attributes:
+    - orders (Dict[int, RestingOrder]): Resting orders by order id.
+    """
+
+    def __init__(self):
+        self.orders: Dict[int, RestingOrder] = {}
+        self._heaps: Dict[int, Tuple[list, list, list, list]] = {}
+        self._sequence = count()
+        self._next_order_id = 1
+        self._stale = 0
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+    def add(
+        self,
+        timestamp: int,
+        trade_id: int,
+        leg_id: int,
+        action: Action,
+        symbol: Symbol,
+        order: BaseOrder,
+    ) -> RestingOrder:
+        """
+        Rests a limit or stop order until a market record crosses its price.
+
+        Parameters:
+        - timestamp (int): UNIX timestamp in nanoseconds when the order was placed.
+        - trade_id (int): The trade identifier.
+        - leg_id (int): The leg identifier of the trade.
+        - action (Action): The action of the order.
+        - symbol (Symbol): The symbol of the instrument ordered.
+        - order (BaseOrder): The limit or stop order.
+
+        Returns:
+        - RestingOrder: The resting order with its assigned order id.
+        """
+        order_type = order.order.orderType
+        buy = order.order.action == "BUY"
+
+        if order_type == OrderType.LIMIT.value:
+            price = order.order.lmtPrice
+            side = BUY_LIMIT if buy else SELL_LIMIT
+        elif order_type == OrderType.STOPLOSS.value:
+            price = order.order.auxPrice
+            side = BUY_STOP if buy else SELL_STOP
+        else:
+            raise ValueError(f"Order type {order_type} cannot rest.")
+
+        resting = RestingOrder(
+            order_id=self._next_order_id,
+            timestamp=timestamp,
+            trade_id=trade_id,
+            leg_id=leg_id,
+            action=action,
+            symbol=symbol,
+            order=order,
+            price=int(round(price * 1e9)),
+        )
+        self._next_order_id += 1
+        self.orders[resting.order_id] = resting
+
+        # Buy limits and sell stops cross from the highest price down
+        key = (
+            -resting.price if side in (BUY_LIMIT, SELL_STOP) else resting.price
+        )
+        heaps = self._heaps.get(symbol.instrument_id)
+        if heaps is None:
+            heaps = self._heaps[symbol.instrument_id] = ([], [], [], [])
+        heapq.heappush(
+            heaps[side], (key, next(self._sequence), resting.order_id)
+        )
+        return resting
+
+    def cancel(self, order_id: int) -> Optional[RestingOrder]:
+        """
+        Removes a resting order.
+
+        Parameters:
+        - order_id (int): The id of the order to cancel.
+
+        Returns:
+        - Optional[RestingOrder]: The cancelled order, None if no order with the id is resting.
+        """
+        resting = self.orders.pop(order_id, None)
+        if resting is None:
+            return None
+
+        self._stale += 1
+        if self._stale > 1024 and self._stale > len(self.orders):
+            self._compact()
+        return resting
+
+    def match(self, record: Union[OhlcvMsg, BboMsg]) -> List[RestingOrder]:
+        """
+        Removes and returns the resting orders of the record's instrument crossed by the record, in placement order.
+
+        Parameters:
+        - record (Union[OhlcvMsg, BboMsg]): The market data record.
+
+        Returns:
+        - List[RestingOrder]: The crossed orders.
+        """
+        heaps = self._heaps.get(record.instrument_id)
+        if heaps is None:
+            return []
+
+        if isinstance(record, BboMsg):
+            level = record.levels[0]
+            buy_low = buy_high = level.ask_px
+            sell_low = sell_high = level.bid_px
+        else:
+            buy_low = sell_low = record.low
+            buy_high = sell_high = record.high
+
+        crossed = []
+        orders = self.orders
+        for heap, threshold in (
+            (heaps[BUY_LIMIT], -buy_low),
+            (heaps[SELL_LIMIT], sell_high),
+            (heaps[BUY_STOP], buy_high),
+            (heaps[SELL_STOP], -sell_low),
+        ):
+            while heap and heap[0][0] <= threshold:
+                _, sequence, order_id = heapq.heappop(heap)
+                resting = orders.pop(order_id, None)
+                if resting is None:
+                    self._stale -= 1
+                    continue
+                crossed.append((sequence, resting))
+
+        if len(crossed) > 1:
+            crossed.sort(key=lambda entry: entry[0])
+        return [resting for _, resting in crossed]
+
+    def _compact(self) -> None:
+        orders = self.orders
+        for heaps in self._heaps.values():
+            for heap in heaps:
+                heap[:] = [entry for entry in heap if entry[2] in orders]
+                heapq.heapify(heap)
+        self._stale = 0
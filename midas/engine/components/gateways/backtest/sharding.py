@@ -0,0 +1,156 @@
+import heapq
+import pandas as pd
+from datetime import date
+from typing import Dict, Iterator, List, Optional, Tuple
+from mbn import BufferStore, RecordMsg
+
+SHARD_BY = ("", "ticker", "month", "ticker_month")
+
+
+def shard_requests(
+    tickers: List[str],
+    start_date: str,
+    end_date: str,
+    shard_by: str,
+) -> List[Tuple[List[str], str, str]]:
+    """
+    Splits a retrieval into per-ticker and/or per-month requests.
+
+    Month shards are split on the first day of each month, each shard ending where the next one starts.
+
+    Parameters:
+    - tickers (List[str]): A list of ticker symbols.
+    - start_date (str): The start date in ISO format 'YYYY-MM-DD'.
+    - end_date (str): The end date in ISO format 'YYYY-MM-DD'.
+    - shard_by (str): One of '', 'ticker', 'month' or 'ticker_month'.
+
+    Returns:
+    - List[Tuple[List[str], str, str]]: The (tickers, start, end) of each shard.
+    """
+    if shard_by not in SHARD_BY:
+        raise ValueError(f"'shard_by' must be one of {SHARD_BY}.")
+
+    ranges = [(start_date, end_date)]
+    if shard_by in ("month", "ticker_month"):
+        ranges = []
+        start = date.fromisoformat(start_date)
+        end = date.fromisoformat(end_date)
+        while start < end:
+            if start.month == 12:
+                month_end = date(start.year + 1, 1, 1)
+            else:
+                month_end = date(start.year, start.month + 1, 1)
+            month_end = min(month_end, end)
+            ranges.append((start.isoformat(), month_end.isoformat()))
+            start = month_end
+
+    groups = [tickers]
+    if shard_by in ("ticker", "ticker_month"):
+        groups = [[ticker] for ticker in tickers]
+
+    return [(group, start, end) for start, end in ranges for group in groups]
+
+
+class _Mappings:
+    """
+    Instrument id to ticker mapping unified across the merged stores.
+    """
+
+    def __init__(self):
+        self.tickers: Dict[int, str] = {}
+
+    def get_ticker(self, instrument_id: int) -> Optional[str]:
+        return self.tickers.get(instrument_id)
+
+
+class _Metadata:
+    def __init__(self, mappings: _Mappings):
+        self.mappings = mappings
+
+
+class MergedStore:
+    """
+    Time-ordered k-way merge of BufferStores retrieved as separate shards.
+
+    Exposes the replay, metadata and decode_to_df interface used by the backtest DataClient. Records are ordered
+    by (ts_event, instrument_id), equal keys keeping the order of the shards and of the records within a shard, so
+    the result matches a single retrieval of the same range. Shards agreeing on an instrument id for a ticker keep
+    it; conflicting ids are remapped to a new unified id.
+
+    Attributes:
+    - stores (List[BufferStore]): The shards, in request order.
+    - metadata: Unified instrument id mappings.
+    """
+
+    def __init__(self, stores: List[BufferStore]):
+        self.stores = stores
+        self.metadata = _Metadata(_Mappings())
+        self._ticker_ids: Dict[str, int] = {}
+        self._remaps: List[Dict[int, int]] = [{} for _ in stores]
+        self._merged = heapq.merge(
+            *(self._shard_records(i) for i in range(len(stores))),
+            key=lambda record: (record.ts_event, record.instrument_id),
+        )
+
+    def _unified_id(self, shard: int, native_id: int) -> int:
+        ticker = self.stores[shard].metadata.mappings.get_ticker(native_id)
+
+        if ticker not in self._ticker_ids:
+            unified_id = native_id
+            if unified_id in self.metadata.mappings.tickers:
+                unified_id = max(self.metadata.mappings.tickers) + 1
+            self._ticker_ids[ticker] = unified_id
+            self.metadata.mappings.tickers[unified_id] = ticker
+
+        unified_id = self._ticker_ids[ticker]
+        self._remaps[shard][native_id] = unified_id
+        return unified_id
+
+    def _shard_records(self, shard: int) -> Iterator[RecordMsg]:
+        store = self.stores[shard]
+        remap = self._remaps[shard]
+
+        while (record := store.replay()) is not None:
+            native_id = record.instrument_id
+            unified_id = remap.get(native_id)
+
+            if unified_id is None:
+                unified_id = self._unified_id(shard, native_id)
+
+            if unified_id != native_id:
+                record.instrument_id = unified_id
+            yield record
+
+    def replay(self) -> Optional[RecordMsg]:
+        return next(self._merged, None)
+
+    def decode_to_df(
+        self,
+        pretty_ts: bool = False,
+        pretty_px: bool = False,
+    ) -> pd.DataFrame:
+        frames = []
+        for shard, store in enumerate(self.stores):
+            df = store.decode_to_df(pretty_ts=False, pretty_px=pretty_px)
+            remap = self._remaps[shard]
+            for native_id in df["instrument_id"].unique():
+                if int(native_id) not in remap:
+                    self._unified_id(shard, int(native_id))
+            df["instrument_id"] = df["instrument_id"].map(remap)
+            frames.append(df)
+
+        if not frames:
+            return pd.DataFrame(columns=["instrument_id", "ts_event"])
+
+        df = pd.concat(frames, ignore_index=True)
+        df = df.sort_values(
+            ["ts_event", "instrument_id"],
+            kind="stable",
+        ).reset_index(drop=True)
+
+        if pretty_ts:
+            df["ts_event"] = pd.to_datetime(
+                df["ts_event"], unit="ns", utc=True
+            )
+
+        return df
@@ -1,3 +1,4 @@
 from .contract_manager import ContractManager
 from .data_client import DataClient
 from .broker_client import BrokerClient
+from .runtime import LiveRuntime
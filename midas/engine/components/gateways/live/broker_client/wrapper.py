@@ -3,6 +3,8 @@ import pytz
 import time
 import threading
 from copy import deepcopy
+from functools import partial
+from typing import Optional
 from decimal import Decimal
 from threading import Timer
 from datetime import datetime
@@ -19,6 +21,7 @@ from ibapi.commission_report import CommissionReport
 from ibapi.contract import Contract, ContractDetails
 from midas.utils.logger import SystemLogger
 from midas.engine.components.observer.base import Subject, EventType
+from midas.engine.components.gateways.live.runtime import LiveRuntime
 from midas.symbol import SymbolMap
 
 
@@ -43,6 +46,7 @@ class BrokerApp(EWrapper, EClient, Subject):
     - account_download_event (threading.Event): Event signaling completion of account download.
     - open_orders_event (threading.Event): Event signaling reception of open orders.
     - next_valid_order_id_lock (threading.Lock): Lock for managing thread safety of order IDs.
+    - runtime (Optional[LiveRuntime]): Event loop notifications and the account update debounce are handed off to, None uses the calling thread and a Timer.
     """
 
     def __init__(self, symbols_map: SymbolMap):
@@ -84,6 +88,26 @@ class BrokerApp(EWrapper, EClient, Subject):
         self.next_valid_order_id_lock = threading.Lock()
         self.account_update_lock = threading.Lock()
 
+        self.runtime: Optional[LiveRuntime] = None
+
+    def set_runtime(self, runtime: LiveRuntime) -> None:
+        """
+        Hands notifications and the account update debounce off to the runtime's event loop.
+
+        Parameters:
+        - runtime (LiveRuntime): The live session's event loop.
+        """
+        self.runtime = runtime
+
+    def notify(self, event_type: EventType, *args, **kwargs):
+        # IB callbacks run on the client thread, observers on the runtime's loop
+        if self.runtime is None:
+            Subject.notify(self, event_type, *args, **kwargs)
+        else:
+            self.runtime.call_soon(
+                partial(Subject.notify, self, event_type, *args, **kwargs)
+            )
+
     def error(
         self,
         reqId: int,
@@ -180,6 +204,15 @@ class BrokerApp(EWrapper, EClient, Subject):
                 self.account_info.update_from_broker_data(key, float(val))
 
         if key == "UnrealizedPnL":
+            if self.runtime is not None:
+                # 2 seccond delay
+                self.runtime.call_later(
+                    "account_update",
+                    2,
+                    self.process_account_updates,
+                )
+                return
+
             with self.account_update_lock:
                 if self.account_update_timer is not None:
                     self.account_update_timer.cancel()
@@ -239,7 +272,7 @@ class BrokerApp(EWrapper, EClient, Subject):
             accountName,
         )
 
-        if contract.symbol in self.symbols_map.broker_tickers:
+        if contract.symbol in self.symbols_map.broker_ticker_set:
             symbol = self.symbols_map.get_symbol(contract.symbol)
             market_price = marketPrice / symbol.price_multiplier
             avg_price = averageCost / (
@@ -443,7 +476,7 @@ class BrokerApp(EWrapper, EClient, Subject):
         super().execDetails(reqId, contract, execution)
 
         # Symbol
-        if contract.symbol in self.symbols_map.broker_tickers:
+        if contract.symbol in self.symbols_map.broker_ticker_set:
             symbol = self.symbols_map.get_symbol(contract.symbol)
 
             # Convert action to ["BUY", "SELL"]
@@ -1,6 +1,7 @@
 import os
 from datetime import datetime
 import threading
+from functools import partial
 from typing import Union, Optional
 from decimal import Decimal
 from ibapi.client import EClient
@@ -9,9 +10,9 @@ from ibapi.contract import ContractDetails
 from mbn import OhlcvMsg
 from midas.utils.logger import SystemLogger
 from midas.engine.components.observer.base import Subject, EventType
+from midas.engine.components.gateways.live.runtime import LiveRuntime
 from ibapi.ticktype import TickType
 from ibapi.common import TickAttrib
-import time
 
 
 class DataApp(EWrapper, EClient, Subject):
@@ -33,6 +34,7 @@ class DataApp(EWrapper, EClient, Subject):
     - valid_id_event (threading.Event): Event to signal receipt of the next valid order ID.
     - validate_contract_event (threading.Event): Event to signal the completion of contract validation.
     - next_valid_order_id_lock (threading.Lock): Lock to ensure thread-safe operations on next_valid_order_id.
+    - runtime (Optional[LiveRuntime]): Event loop notifications are handed off to, None notifies on the calling thread.
     """
 
     def __init__(self, tick_interval: Optional[int]):
@@ -47,7 +49,7 @@ class DataApp(EWrapper, EClient, Subject):
         """
         EClient.__init__(self, self)
         Subject.__init__(self)
-        self.logger = SystemLogger.get_logger()
+        self.logger = SystemLogger.get_logger("live_data")
 
         #  Data Storage
         self.next_valid_order_id = None
@@ -67,23 +69,31 @@ class DataApp(EWrapper, EClient, Subject):
         self.update_interval = (
             tick_interval  # Seconds interval for pushing the event
         )
-        self.is_running = True
-        self.timer_thread = threading.Thread(
-            target=self._run_timer,
-            daemon=True,
-        )
-        self.timer_thread.start()
+        self.runtime: Optional[LiveRuntime] = None
+
+    def set_runtime(self, runtime: LiveRuntime) -> None:
+        """
+        Hands notifications off to the runtime's event loop and pushes tick data on it every update_interval.
 
-    def _run_timer(self):
-        """A continuously running timer in a separate thread that checks every 5 seconds."""
-        while self.is_running:
-            time.sleep(self.update_interval)
-            self.push_market_event()
+        Parameters:
+        - runtime (LiveRuntime): The live session's event loop.
+        """
+        self.runtime = runtime
+
+        if self.update_interval:
+            runtime.every(self.update_interval, self.push_market_event)
+
+    def notify(self, event_type: EventType, *args, **kwargs):
+        # IB callbacks run on the client thread, observers on the runtime's loop
+        if self.runtime is None:
+            Subject.notify(self, event_type, *args, **kwargs)
+        else:
+            self.runtime.call_soon(
+                partial(Subject.notify, self, event_type, *args, **kwargs)
+            )
 
     def stop(self):
-        """Gracefully stop the timer thread and other resources."""
-        self.is_running = False
-        self.timer_thread.join()
+        """Gracefully stop the data app."""
         self.logger.info("Shutting down the DataApp.")
 
     def error(
@@ -232,39 +242,39 @@ class DataApp(EWrapper, EClient, Subject):
             # print("dbid")
             self.tick_data[reqId].levels[0].bid_px = int(price * 1e9)
             # print(self.tick_data)
-            self.logger.info(f"BID : {reqId} : {price}")
+            self.logger.info("BID : %s : %s", reqId, price)
         elif tickType == 2:  # ASK
             self.tick_data[reqId].levels[0].ask_px = int(price * 1e9)
-            self.logger.info(f"ASK : {reqId} : {price}")
+            self.logger.info("ASK : %s : %s", reqId, price)
         elif tickType == 4:
             self.tick_data[reqId].price = int(price * 1e9)
-            self.logger.info(f"Last : {reqId} :  {price}")
+            self.logger.info("Last : %s :  %s", reqId, price)
 
     def tickSize(self, reqId: int, tickType, size: Decimal):
         """Market data tick size callback. Handles all size-related ticks."""
 
         if tickType == 0:  # BID_SIZE
             self.tick_data[reqId].levels[0].bid_sz = int(size)
-            self.logger.info(f"BID SIZE : {reqId} : {size}")
+            self.logger.info("BID SIZE : %s : %s", reqId, size)
         elif tickType == 3:  # ASK_SIZE
             self.tick_data[reqId].levels[0].ask_sz = int(size)
-            self.logger.info(f"ASK SIZE : {reqId} : {size}")
+            self.logger.info("ASK SIZE : %s : %s", reqId, size)
         elif tickType == 5:  # Last_SIZE
             self.tick_data[reqId].size = int(size)
-            self.logger.info(f"Last SIZE : {reqId} : {size}")
+            self.logger.info("Last SIZE : %s : %s", reqId, size)
 
     def tickString(self, reqId: int, tickType: TickType, value: str):
         """Handles string-based market data updates."""
 
         if tickType == 45:  # TIMESTAMP
             self.tick_data[reqId].hd.ts_event = int(int(value) * 1e9)
-            self.logger.info(f"Time Last : {reqId} : {value}")
-            self.logger.info(f"Recv :{datetime.now()}")
+            self.logger.info("Time Last : %s : %s", reqId, value)
+            self.logger.info("Recv :%s", datetime.now())
 
     def push_market_event(self):
         """Pushes a market event after processing the tick data."""
 
-        self.logger.info(f"Market event pushed at {datetime.now()}")
+        self.logger.info("Market event pushed at %s", datetime.now())
 
         # Process the latest tick data (This is just an example)
         for _, data in self.tick_data.items():
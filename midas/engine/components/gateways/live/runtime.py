@@ -0,0 +1,225 @@
+import time
+import signal
+import asyncio
+import threading
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from midas.utils.logger import SystemLogger
+from midas.engine.components.observer.profiler import LatencyHistogram
+
+
+class LiveRuntime:
+    """
+    asyncio event loop running a live trading session.
+
+    Broker and market data callbacks arrive on the IB client threads and are handed off to the loop, so observers
+    (order book, strategy, portfolio server, ...) only run on the loop thread. The runtime owns the session timers,
+    the shutdown signal and the shutdown sequence. Between callbacks the loop waits in the selector, leaving the
+    process idle when no data arrives.
+
+    Callbacks handed off before run are queued and delivered once the loop starts.
+
+    Attributes:
+    - loop (asyncio.AbstractEventLoop): The event loop, created with the runtime.
+    - handoff_latency (LatencyHistogram): Nanoseconds from a callback being handed off to it starting on the loop.
+    - callback_latency (LatencyHistogram): Nanoseconds from a callback being handed off to it returning, including every observer it notified.
+    """
+
+    def __init__(self):
+        self.logger = SystemLogger.get_logger()
+        self.loop = asyncio.new_event_loop()
+        self.handoff_latency = LatencyHistogram()
+        self.callback_latency = LatencyHistogram()
+        self._clock = time.perf_counter_ns
+        self._periodic: List[Tuple[float, Callable[[], None]]] = []
+        self._delayed: Dict[str, asyncio.TimerHandle] = {}
+        self._stopping: Optional[asyncio.Event] = None
+        self._stop_requested = False
+        self._thread_id: Optional[int] = None
+
+    # -- Scheduling --
+    def call_soon(self, callback: Callable[..., None], *args) -> None:
+        """
+        Runs the callback on the loop, safe to call from any thread.
+
+        Called from the loop thread itself, the callback runs immediately.
+
+        Parameters:
+        - callback (Callable[..., None]): The function to run.
+        - *args: Positional arguments passed to the callback.
+        """
+        if threading.get_ident() == self._thread_id:
+            callback(*args)
+            return
+
+        self.loop.call_soon_threadsafe(
+            self._run_callback,
+            self._clock(),
+            callback,
+            args,
+        )
+
+    def _run_callback(
+        self,
+        queued: int,
+        callback: Callable[..., None],
+        args: tuple,
+    ) -> None:
+        start = self._clock()
+        try:
+            callback(*args)
+        finally:
+            self.handoff_latency.record(start - queued)
+            self.callback_latency.record(self._clock() - queued)
+
+    def call_later(
+        self,
+        key: str,
+        delay: float,
+        callback: Callable[[], None],
+    ) -> None:
+        """
+        Runs the callback on the loop after a delay, replacing the call pending under the same key.
+
+        Safe to call from any thread, used to debounce bursts of updates.
+
+        Parameters:
+        - key (str): Identifies the pending call to replace.
+        - delay (float): Delay in seconds.
+        - callback (Callable[[], None]): The function to run.
+        """
+        self.loop.call_soon_threadsafe(self._schedule, key, delay, callback)
+
+    def _schedule(
+        self,
+        key: str,
+        delay: float,
+        callback: Callable[[], None],
+    ) -> None:
+        pending = self._delayed.pop(key, None)
+        if pending is not None:
+            pending.cancel()
+
+        self._delayed[key] = self.loop.call_later(
+            delay,
+            self._run_delayed,
+            key,
+            callback,
+        )
+
+    def _run_delayed(self, key: str, callback: Callable[[], None]) -> None:
+        self._delayed.pop(key, None)
+        callback()
+
+    def every(self, interval: float, callback: Callable[[], None]) -> None:
+        """
+        Runs the callback on the loop every interval seconds while the runtime runs.
+
+        Parameters:
+        - interval (float): Interval in seconds.
+        - callback (Callable[[], None]): The function to run.
+        """
+        self._periodic.append((interval, callback))
+
+    async def _repeat(
+        self,
+        interval: float,
+        callback: Callable[[], None],
+    ) -> None:
+        next_time = self.loop.time() + interval
+        while True:
+            await asyncio.sleep(max(0.0, next_time - self.loop.time()))
+            next_time += interval
+            callback()
+
+    # -- Lifecycle --
+    def stop(self) -> None:
+        """
+        Requests the runtime to shut down, safe to call from any thread.
+        """
+        self.loop.call_soon_threadsafe(self._request_stop)
+
+    def _request_stop(self) -> None:
+        self._stop_requested = True
+        if self._stopping is not None:
+            self._stopping.set()
+
+    def run(
+        self,
+        shutdown: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> None:
+        """
+        Runs the loop until stop is called or SIGINT is received, then awaits the shutdown sequence and closes the loop.
+
+        Parameters:
+        - shutdown (Optional[Callable[[], Awaitable[None]]]): Coroutine function run on the loop before it closes.
+        """
+        try:
+            self.loop.run_until_complete(self._main(shutdown))
+        finally:
+            self._thread_id = None
+            self.loop.close()
+
+        self.logger.info(self.latency_summary())
+
+    async def _main(
+        self,
+        shutdown: Optional[Callable[[], Awaitable[None]]],
+    ) -> None:
+        self._thread_id = threading.get_ident()
+        self._stopping = asyncio.Event()
+        if self._stop_requested:
+            self._stopping.set()
+
+        restore_signal = self._install_signal_handler()
+        timers = [
+            self.loop.create_task(self._repeat(interval, callback))
+            for interval, callback in self._periodic
+        ]
+
+        try:
+            await self._stopping.wait()
+            self.logger.info("Live runtime shutting down.")
+
+            for timer in timers:
+                timer.cancel()
+
+            if shutdown is not None:
+                await shutdown()
+        finally:
+            for pending in self._delayed.values():
+                pending.cancel()
+            self._delayed.clear()
+            restore_signal()
+
+    def _install_signal_handler(self) -> Callable[[], None]:
+        try:
+            self.loop.add_signal_handler(signal.SIGINT, self._request_stop)
+            return lambda: self.loop.remove_signal_handler(signal.SIGINT)
+        except (NotImplementedError, RuntimeError, ValueError):
+            pass
+
+        # Loops without signal handler support (e.g. Windows or a non-main thread)
+        try:
+            previous = signal.signal(
+                signal.SIGINT,
+                lambda signum, frame: self.stop(),
+            )
+        except ValueError:
+            return lambda: None
+        return lambda: signal.signal(signal.SIGINT, previous)
+
+    def latency_summary(self) -> str:
+        """
+        Returns the callback latencies, in microseconds, recorded since the runtime was created.
+        """
+        lines = [f"Live runtime callbacks: {self.callback_latency.count}"]
+        for name, histogram in (
+            ("Handoff", self.handoff_latency),
+            ("Callback to strategy", self.callback_latency),
+        ):
+            lines.append(
+                f"  {name}: p50 {histogram.percentile(50) / 1e3:.1f} us, "
+                f"p99 {histogram.percentile(99) / 1e3:.1f} us, "
+                f"max {histogram.max / 1e3:.1f} us"
+            )
+        return "\n".join(lines)
@@ -1,5 +1,6 @@
 from .base import Observer, Subject, EventType
+from .profiler import EventBusProfiler
 
 
 # Public API of the 'engine' module
-__all__ = ["Observer", "Subject", "EventType"]
+__all__ = ["Observer", "Subject", "EventType", "EventBusProfiler"]
@@ -1,5 +1,8 @@
 from enum import Enum, auto
+from functools import partial
 from abc import ABC, abstractmethod
+from typing import Callable, Dict, Optional, Tuple
+from midas.engine.components.observer.profiler import EventBusProfiler
 
 
 class EventType(Enum):
@@ -27,9 +30,15 @@ class Subject:
 
     def __init__(self):
         """Initialize the Subject with an empty observer dictionary."""
+        # Wraps the handlers attached while set, see EventBusProfiler
+        self.profiler: Optional[EventBusProfiler] = None
+
         # Maps EventType to observers interested in that event
         self._observers = {}
 
+        # Maps EventType to the handlers called on notify, rebuilt on attach/detach
+        self._dispatch: Dict[EventType, Tuple[Callable[..., None], ...]] = {}
+
     def attach(self, observer: "Observer", event_type: EventType):
         """
         Attach an observer to a specific event type.
@@ -41,6 +50,7 @@ class Subject:
         if event_type not in self._observers:
             self._observers[event_type] = []
         self._observers[event_type].append(observer)
+        self._compile(event_type)
 
     def detach(self, observer: "Observer", event_type: EventType):
         """
@@ -55,6 +65,37 @@ class Subject:
             and observer in self._observers[event_type]
         ):
             self._observers[event_type].remove(observer)
+            self._compile(event_type)
+
+    def _compile(self, event_type: EventType):
+        """
+        Rebuild the handlers called when the event type is notified.
+
+        Parameters:
+        - event_type (EventType): The event type whose observers changed.
+        """
+        self._dispatch[event_type] = tuple(
+            self._resolve_handler(observer, event_type)
+            for observer in self._observers[event_type]
+        )
+
+    def _resolve_handler(
+        self,
+        observer: "Observer",
+        event_type: EventType,
+    ) -> Callable[..., None]:
+        """
+        Returns the observer's typed handler for the event type, falling back to its handle_event.
+        """
+        handler = None
+        if isinstance(observer, Observer):
+            handler = observer.event_handlers().get(event_type)
+        if handler is None:
+            handler = partial(observer.handle_event, self, event_type)
+
+        if self.profiler is not None:
+            handler = self.profiler.wrap(self, event_type, observer, handler)
+        return handler
 
     def notify(self, event_type: EventType, *args, **kwargs):
         """
@@ -65,14 +106,27 @@ class Subject:
         - *args: Additional positional arguments to be passed to the observers.
         - **kwargs: Additional keyword arguments to be passed to the observers.
         """
-        if event_type in self._observers:
-            for observer in self._observers[event_type]:
-                observer.handle_event(self, event_type, *args, **kwargs)
+        for handler in self._dispatch.get(event_type, ()):
+            handler(*args, **kwargs)
 
 
 class Observer(ABC):
     """Abstract base class for observers that need to respond to subject events."""
 
+    def event_handlers(self) -> Dict[EventType, Callable[..., None]]:
+        """
+        Typed handlers called directly by subjects, keyed by event type.
+
+        A handler receives only the notified arguments. Handlers are resolved when the observer is attached,
+        event types without one are delivered through handle_event. Return the observer's own bound methods
+        rather than methods of its components, so components replaced after attach still receive the events.
+        Replacing a handler method itself only takes effect once the observer is detached and attached again.
+
+        Returns:
+        - Dict[EventType, Callable[..., None]]: The handler of each event type.
+        """
+        return {}
+
     @abstractmethod
     def handle_event(
         self, subject: Subject, event_type: EventType, *args, **kwargs
@@ -0,0 +1,178 @@
+import math
+import time
+from typing import Callable, Dict, List, Tuple
+
+EdgeKey = Tuple[str, str, str]
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of latencies in nanoseconds.
+
+    Each power of two is split into 16 linear buckets, so reported percentiles are within 6.25% of the
+    recorded values.
+
+    Attributes:
+    - count (int): Number of recorded latencies.
+    - total (int): Sum of the recorded latencies.
+    - max (int): Largest recorded latency.
+    """
+
+    SUB_BUCKETS = 16
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self.buckets: List[int] = [0] * (self.SUB_BUCKETS * 64)
+
+    def record(self, value: int) -> None:
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+        if value < self.SUB_BUCKETS:
+            self.buckets[value] += 1
+        else:
+            shift = value.bit_length() - 5
+            self.buckets[
+                (shift + 1) * self.SUB_BUCKETS + (value >> shift) - 16
+            ] += 1
+
+    def _bucket_value(self, index: int) -> int:
+        if index < self.SUB_BUCKETS:
+            return index
+        shift = index // self.SUB_BUCKETS - 1
+        return (self.SUB_BUCKETS + index % self.SUB_BUCKETS) << shift
+
+    def percentile(self, q: float) -> int:
+        """
+        Returns the lower bound of the bucket holding the q-th percentile, the maximum for the highest bucket.
+
+        Parameters:
+        - q (float): The percentile in [0, 100].
+
+        Returns:
+        - int: The latency in nanoseconds, 0 if nothing was recorded.
+        """
+        if self.count == 0:
+            return 0
+
+        rank = max(1, math.ceil(self.count * q / 100))
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen == self.count:
+                return self.max
+            if seen >= rank:
+                return self._bucket_value(index)
+        return self.max
+
+
+class EdgeStats:
+    """
+    Calls and latencies of one (subject, event type, observer) edge.
+
+    Attributes:
+    - latency (LatencyHistogram): Latency of each call, including the handlers it notified in turn.
+    - self_ns (int): Total time spent in the handler itself, excluding the handlers it notified in turn.
+    """
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.self_ns = 0
+
+    @property
+    def calls(self) -> int:
+        return self.latency.count
+
+
+class EventBusProfiler:
+    """
+    Records call counts and latencies for each (subject, event type, observer) edge of the event bus.
+
+    Enabled by assigning an instance to the profiler of each subject before observers are attached; handlers are
+    wrapped when attached, so notify is unchanged when profiling is off.
+
+    Attributes:
+    - edges (Dict[EdgeKey, EdgeStats]): Statistics keyed on (subject, event type, observer) class and event names.
+    """
+
+    def __init__(self):
+        self.edges: Dict[EdgeKey, EdgeStats] = {}
+        self._clock = time.perf_counter_ns
+        # Time spent in nested handlers, one entry per handler being run
+        self._nested: List[int] = []
+
+    def wrap(
+        self,
+        subject: object,
+        event_type: object,
+        observer: object,
+        handler: Callable[..., None],
+    ) -> Callable[..., None]:
+        """
+        Returns the handler wrapped to record its calls on the edge.
+
+        Parameters:
+        - subject (Subject): The notifying subject.
+        - event_type (EventType): The notified event type.
+        - observer (Observer): The observer owning the handler.
+        - handler (Callable[..., None]): The handler called on notify.
+
+        Returns:
+        - Callable[..., None]: The timed handler.
+        """
+        key = (
+            type(subject).__name__,
+            getattr(event_type, "name", str(event_type)),
+            type(observer).__name__,
+        )
+        stats = self.edges.setdefault(key, EdgeStats())
+        latency = stats.latency
+        clock = self._clock
+        nested = self._nested
+
+        def timed(*args, **kwargs):
+            nested.append(0)
+            start = clock()
+            try:
+                return handler(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                inner = nested.pop()
+                if nested:
+                    nested[-1] += elapsed
+                latency.record(elapsed)
+                stats.self_ns += elapsed - inner
+
+        return timed
+
+    def summary(self) -> str:
+        """
+        Returns a table of the edges ordered by time spent in the handler itself, latencies in microseconds.
+        """
+        header = (
+            f"{'Subject':<20} {'Event':<20} {'Observer':<24} {'Calls':>10} "
+            f"{'Total ms':>10} {'Self ms':>10} {'p50 us':>9} {'p99 us':>9} "
+            f"{'Max us':>9}"
+        )
+        lines = ["Event bus profile:", header, "-" * len(header)]
+
+        for (subject, event, observer), stats in sorted(
+            self.edges.items(),
+            key=lambda item: item[1].self_ns,
+            reverse=True,
+        ):
+            latency = stats.latency
+            lines.append(
+                f"{subject:<20} {event:<20} {observer:<24} "
+                f"{stats.calls:>10} {latency.total / 1e6:>10.2f} "
+                f"{stats.self_ns / 1e6:>10.2f} "
+                f"{latency.percentile(50) / 1e3:>9.2f} "
+                f"{latency.percentile(99) / 1e3:>9.2f} "
+                f"{latency.max / 1e3:>9.2f}"
+            )
+
+        return "\n".join(lines)
@@ -1,13 +1,19 @@
-from typing import Dict
+from typing import Callable, Dict, Optional, Union
 from mbn import RecordMsg
-from midas.engine.events import MarketEvent
+from midas.engine.events import MarketEvent, TimeSliceEvent
 from midas.utils.logger import SystemLogger
 from midas.engine.components.observer.base import Subject, Observer, EventType
 from midas.symbol import SymbolMap
 
 
 class OrderBook(Subject, Observer):
-    """Manages market data updates and notifies observers about market changes."""
+    """
+    Manages market data updates and notifies observers about market changes.
+
+    Single records are forwarded in one MarketEvent view updated in place for every record, observers should copy
+    what they need rather than keep a reference to the event. Readiness is tracked with a counter over the dense slots
+    of the symbol map's instruments, read from the live map so instruments added after construction are tracked too.
+    """
 
     def __init__(self, symbol_map: SymbolMap):
         """
@@ -19,48 +25,117 @@ class OrderBook(Subject, Observer):
         """
         super().__init__()
         self.symbol_map = symbol_map
-        self.logger = SystemLogger.get_logger()
+        self.logger = SystemLogger.get_logger("order_book")
         self.last_updated = None
         self.book: Dict[int, RecordMsg] = {}
         self.tickers_loaded = False  # had data for all tickers
+        self._event: Optional[MarketEvent] = None
+
+        # Readiness, slot per instrument set once its first record arrives
+        self._slots = symbol_map.slots
+        self._seen = bytearray()
+        self._loaded = 0
 
     def check_tickers_loaded(self) -> bool:
-        return set(self.symbol_map.instrument_ids) == set(self.book.keys())
+        """
+        Checks whether the book has a record for every instrument of the symbol map, False for an empty map.
+
+        Returns:
+        - bool: True once every instrument has had a record.
+        """
+        if len(self._seen) != len(self._slots):
+            self._track_added()
+        return self._loaded == len(self._seen) > 0
+
+    def _track_added(self) -> None:
+        # Instruments added to the map since the last check may already be in the book
+        self._seen.extend(bytes(len(self._slots) - len(self._seen)))
+        for instrument_id in self.book:
+            slot = self._slots.get(instrument_id)
+            if slot is not None and not self._seen[slot]:
+                self._seen[slot] = 1
+                self._loaded += 1
+
+    def event_handlers(self) -> Dict[EventType, Callable[..., None]]:
+        return {EventType.MARKET_DATA: self.handle_market_data}
 
     def handle_event(
         self,
         subject: Subject,
         event_type: EventType,
-        record: RecordMsg,
+        record: Union[RecordMsg, TimeSliceEvent],
     ) -> None:
         """
         Handles notifications received from other subjects (like DataClient).
 
+        A TimeSliceEvent updates the book with each of its records and is forwarded as a single ORDER_BOOK event.
+
         Parameters:
         - subject (Subject): The subject that triggered the event.
         - event_type (EventType): The type of event that was triggered.
-        - record (RecordMsg, optional): The market data record.
-        - ticker (str, optional): The ticker symbol for the market data.
+        - record (Union[RecordMsg, TimeSliceEvent]): The market data record, or the records sharing a timestamp.
         """
         if event_type == EventType.MARKET_DATA and record:
-            # Update the order book with the new market data
-            self.update_book(record)
+            self.handle_market_data(record)
 
-            # Put market event in the event queue
-            market_event = MarketEvent(timestamp=record.ts_event, data=record)
-            self.logger.info(market_event)
+    def handle_market_data(
+        self,
+        record: Union[RecordMsg, TimeSliceEvent],
+    ) -> None:
+        """
+        Updates the book with new market data and notifies observers with an ORDER_BOOK event.
 
-            # Check inital data loaded
-            if not self.tickers_loaded:
-                self.tickers_loaded = self.check_tickers_loaded()
+        Parameters:
+        - record (Union[RecordMsg, TimeSliceEvent]): The market data record, or the records sharing a timestamp.
+        """
+        if isinstance(record, TimeSliceEvent):
+            # Update the order book with every record of the slice
+            for slice_record in record.data:
+                self.update_book(slice_record)
+
+            market_event = record
+            self.logger.info("%s", market_event)
+        else:
+            # Update the order book with the new market data
+            self.update_book(record)
 
-            # Notify any observers about the market update
-            self.notify(EventType.ORDER_BOOK, market_event)
+            # Reuse the event view, validated when first created
+            market_event = self._event
+            if market_event is None:
+                market_event = self._event = MarketEvent(
+                    timestamp=record.ts_event,
+                    data=record,
+                )
+            else:
+                market_event.timestamp = record.ts_event
+                market_event.data = record
+
+            # Log the record, the view changes before deferred formatting
+            self.logger.info(
+                "\nMARKET_DATA : \n  %s : %s\n", record.instrument_id, record
+            )
+
+        # Check inital data loaded
+        if not self.tickers_loaded:
+            self.tickers_loaded = self._loaded == len(self._seen) > 0
+
+        # Notify any observers about the market update
+        self.notify(EventType.ORDER_BOOK, market_event)
 
     def update_book(self, record: RecordMsg) -> None:
         self.book[record.instrument_id] = record
         self.last_updated = record.ts_event
 
+        if not self.tickers_loaded:
+            seen = self._seen
+            if len(seen) != len(self._slots):
+                self._track_added()
+            else:
+                slot = self._slots.get(record.instrument_id)
+                if slot is not None and not seen[slot]:
+                    seen[slot] = 1
+                    self._loaded += 1
+
     def retrieve(self, instrument_id: int) -> RecordMsg:
         """
         Retrieves the current price for a given ticker.
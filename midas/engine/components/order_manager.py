@@ -1,6 +1,7 @@
 from ibapi.contract import Contract
-from typing import List
+from typing import List, Optional
 from midas.symbol import SymbolMap
+from midas.cost_models import CostModel, FixedCostModel
 from midas.engine.components.order_book import OrderBook
 from midas.signal import SignalInstruction
 from midas.orders import Action, BaseOrder
@@ -20,6 +21,7 @@ class OrderExecutionManager(Subject, Observer):
         symbols_map: SymbolMap,
         order_book: OrderBook,
         portfolio_server: PortfolioServer,
+        cost_model: Optional[CostModel] = None,
     ):
         """
         Initialize the OrderManager with necessary components for managing orders.
@@ -29,13 +31,15 @@ class OrderExecutionManager(Subject, Observer):
         - event_queue (Queue): Event queue for sending events to other parts of the system.
         - order_book (OrderBook): Reference to the order book for price lookups.
         - portfolio_server (PortfolioServer): Reference to the portfolio server for managing account and positions.
+        - cost_model (Optional[CostModel]): Prices the capital required by all legs of a signal at once, None uses each symbol's costs.
         - logger (logging.Logger): Logger for logging messages.
         """
         super().__init__()
-        self.logger = SystemLogger.get_logger()
+        self.logger = SystemLogger.get_logger("order_manager")
         self.portfolio_server = portfolio_server
         self.order_book = order_book
         self.symbols_map = symbols_map
+        self.cost_model = cost_model or FixedCostModel(symbols_map)
 
     def handle_event(
         self,
@@ -50,7 +54,7 @@ class OrderExecutionManager(Subject, Observer):
         - event (SignalEvent): The signal event containing trade instructions.
         """
         if event_type == EventType.SIGNAL:
-            self.logger.info(event)
+            self.logger.info("%s", event)
             if not isinstance(event, SignalEvent):
                 raise TypeError(
                     "'event' must be of type SignalEvent instance."
@@ -63,7 +67,7 @@ class OrderExecutionManager(Subject, Observer):
             active_orders_tickers = (
                 self.portfolio_server.get_active_order_tickers()
             )
-            self.logger.info(f"Active order tickers {active_orders_tickers}")
+            self.logger.info("Active order tickers %s", active_orders_tickers)
 
             # Check if any of the tickers in trade_instructions are in active orders or positions
             if any(
@@ -90,14 +94,18 @@ class OrderExecutionManager(Subject, Observer):
         """
         # Create and Validate Orders
         orders = []
-        total_capital_required = 0
+        instrument_ids = []
+        quantities = []
+        prices = []
 
         for trade in trade_instructions:
-            self.logger.info(trade)
+            self.logger.info("%s", trade)
             symbol = self.symbols_map.map[trade.instrument]
             order = self._create_order(trade)
             current_price = self.order_book.retrieve(symbol.instrument_id)
-            order_cost = symbol.cost(order.quantity, current_price)
+            instrument_ids.append(symbol.instrument_id)
+            quantities.append(order.quantity)
+            prices.append(current_price.pretty_price)
 
             order_details = {
                 "timestamp": timestamp,
@@ -109,7 +117,11 @@ class OrderExecutionManager(Subject, Observer):
             }
 
             orders.append(order_details)
-            total_capital_required += order_cost
+
+        # Capital required by all legs in one call
+        total_capital_required = float(
+            self.cost_model.cost(instrument_ids, quantities, prices).sum()
+        )
 
         for order in orders:
             if (
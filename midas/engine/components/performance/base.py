@@ -1,16 +1,20 @@
 import math
 import pandas as pd
+from typing import Callable, Dict
 from midas.utils.logger import SystemLogger
 from midas.engine.config import Parameters, Mode
 from midas.engine.components.observer.base import Observer, Subject, EventType
 from midas.engine.components.base_strategy import BaseStrategy
-from midas.utils.unix import unix_to_iso
+from midas.utils.unix import unix_to_datetime
 from midasClient.client import DatabaseClient
 from midas.constants import PRICE_FACTOR
 import mbn
 from datetime import datetime
 from mbn import BacktestData
 from midas.symbol import SymbolMap
+from midas.trade import Trade
+from midas.account import Account, EquityDetails
+from midas.engine.events import SignalEvent
 from midas.engine.components.performance.managers import (
     AccountManager,
     EquityManager,
@@ -30,8 +34,7 @@ def replace_nan_inf_in_dict(d):
 
 
 def _convert_timestamp(df: pd.DataFrame, column: str = "ts_event") -> None:
-    df[column] = pd.to_datetime(df[column].map(lambda x: unix_to_iso(x)))
-    df[column] = df[column].dt.tz_convert("America/New_York")
+    df[column] = unix_to_datetime(df[column], "America/New_York")
     df[column] = df[column].dt.tz_localize(None)
 
 
@@ -55,10 +58,10 @@ class PerformanceManager(Subject, Observer):
         - logger (logging.Logger): Logger for recording activity and debugging.
         - params (Parameters): Configuration parameters for the performance manager.
         """
-        Subject().__init__()
+        Subject.__init__(self)
         self.logger = SystemLogger.get_logger()
         self.trade_manager = TradeManager(self.logger)
-        self.equity_manager = EquityManager(self.logger)
+        self.equity_manager = EquityManager(self.logger, params.risk_free_rate)
         self.signal_manager = SignalManager(self.logger)
         self.account_manager = AccountManager(self.logger)
         self.strategy: BaseStrategy
@@ -69,6 +72,33 @@ class PerformanceManager(Subject, Observer):
     def set_strategy(self, strategy: BaseStrategy):
         self.strategy = strategy
 
+    def event_handlers(self) -> Dict[EventType, Callable[..., None]]:
+        # Own methods, so managers replaced after attach still receive the events
+        return {
+            EventType.EQUITY_VALUE_UPDATE: self.handle_equity_update,
+            EventType.ACCOUNT_UPDATE: self.handle_account_update,
+            EventType.TRADE_UPDATE: self.handle_trade_update,
+            EventType.TRADE_COMMISSION_UPDATE: self.handle_trade_commission_update,
+            EventType.SIGNAL: self.handle_signal,
+        }
+
+    def handle_equity_update(self, equity_details: EquityDetails) -> None:
+        self.equity_manager.update_equity(equity_details)
+
+    def handle_account_update(self, account_details: Account) -> None:
+        self.account_manager.update_account_log(account_details)
+
+    def handle_trade_update(self, trade_id: str, trade_data: Trade) -> None:
+        self.trade_manager.update_trades(trade_id, trade_data)
+
+    def handle_trade_commission_update(
+        self, trade_id: str, commission: float
+    ) -> None:
+        self.trade_manager.update_trade_commission(trade_id, commission)
+
+    def handle_signal(self, signal: SignalEvent) -> None:
+        self.signal_manager.update_signals(signal)
+
     def handle_event(
         self, subject: Subject, event_type: EventType, *args, **kwargs
     ) -> None:
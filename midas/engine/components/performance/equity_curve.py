@@ -0,0 +1,154 @@
+import numpy as np
+from collections.abc import Sequence
+from typing import Iterable, Iterator, Tuple, Union
+from midas.account import EquityDetails
+from midas.utils.unix import unix_to_datetime
+
+
+class EquityCurveBuffer(Sequence):
+    """
+    Columnar equity curve, int64 timestamps and float64 equity values in arrays grown by doubling.
+
+    Appending is amortized O(1) and the columns are read as NumPy views of the filled part, so the curve is handed to
+    pandas and NumPy without building a list of dicts. Indexing returns EquityDetails for compatibility with the list
+    it replaces. Samples are expected in market time order.
+
+    Attributes:
+    - timestamps (np.ndarray): View of the UNIX timestamps in nanoseconds.
+    - equity_values (np.ndarray): View of the equity values.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initializes an empty curve.
+
+        Parameters:
+        - capacity (int): Number of samples allocated up front, doubled whenever the curve is full.
+        """
+        if capacity < 1:
+            raise ValueError("'capacity' must be greater than zero.")
+
+        self._timestamps = np.empty(capacity, dtype=np.int64)
+        self._equity_values = np.empty(capacity, dtype=np.float64)
+        self._len = 0
+
+    @classmethod
+    def from_records(
+        cls, records: Iterable[EquityDetails]
+    ) -> "EquityCurveBuffer":
+        """
+        Builds a curve from equity samples.
+
+        Parameters:
+        - records (Iterable[EquityDetails]): The samples in market time order.
+
+        Returns:
+        - EquityCurveBuffer: The curve.
+        """
+        records = list(records)
+        buffer = cls(max(len(records), 1))
+        for record in records:
+            buffer.append(record["timestamp"], record["equity_value"])
+        return buffer
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[EquityDetails, list]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("equity curve index out of range")
+        return EquityDetails(
+            timestamp=self._timestamps.item(index),
+            equity_value=self._equity_values.item(index),
+        )
+
+    def __iter__(self) -> Iterator[EquityDetails]:
+        for timestamp, equity_value in zip(
+            self.timestamps.tolist(), self.equity_values.tolist()
+        ):
+            yield EquityDetails(timestamp=timestamp, equity_value=equity_value)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._timestamps[: self._len]
+
+    @property
+    def equity_values(self) -> np.ndarray:
+        return self._equity_values[: self._len]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes allocated for the columns."""
+        return self._timestamps.nbytes + self._equity_values.nbytes
+
+    def append(self, timestamp: int, equity_value: float) -> None:
+        """
+        Appends a sample.
+
+        Parameters:
+        - timestamp (int): UNIX timestamp in nanoseconds of the sample.
+        - equity_value (float): The equity value.
+        """
+        size = self._len
+        if size == len(self._timestamps):
+            self._timestamps = np.resize(self._timestamps, 2 * size)
+            self._equity_values = np.resize(self._equity_values, 2 * size)
+
+        self._timestamps[size] = timestamp
+        self._equity_values[size] = equity_value
+        self._len = size + 1
+
+    def is_last(self, timestamp: int, equity_value: float) -> bool:
+        """
+        Checks if a sample repeats the last sample of the curve.
+
+        Parameters:
+        - timestamp (int): UNIX timestamp in nanoseconds of the sample.
+        - equity_value (float): The equity value.
+
+        Returns:
+        - bool: True if the last sample has the same timestamp and value.
+        """
+        last = self._len - 1
+        return (
+            last >= 0
+            and self._timestamps.item(last) == timestamp
+            and self._equity_values.item(last) == equity_value
+        )
+
+    def last_per_timestamp(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Keeps the last sample of each timestamp.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray]: The timestamps and equity values.
+        """
+        timestamps = self.timestamps
+        last = np.ones(len(timestamps), dtype=bool)
+        last[:-1] = timestamps[1:] != timestamps[:-1]
+        return timestamps[last], self.equity_values[last]
+
+    def last_per_day(
+        self, tz_info: str = "UTC"
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Keeps the last sample of each calendar day in a timezone.
+
+        Parameters:
+        - tz_info (str): Timezone of the days.
+
+        Returns:
+        - Tuple[np.ndarray, np.ndarray]: The timestamps and equity values.
+        """
+        timestamps = self.timestamps
+        days = unix_to_datetime(timestamps, tz_info).normalize().asi8
+        last = np.ones(len(timestamps), dtype=bool)
+        last[:-1] = days[1:] != days[:-1]
+        return timestamps[last], self.equity_values[last]
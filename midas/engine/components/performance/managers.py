@@ -1,10 +1,12 @@
 import numpy as np
 import pandas as pd
-from typing import List, Dict
+from typing import Iterable, List, Dict
 from midas.trade import Trade
 from midas.engine.events import SignalEvent
 from quantAnalytics.backtest.metrics import Metrics
-from midas.utils.unix import resample_timestamp, unix_to_iso
+from midas.utils.unix import unix_to_datetime
+from midas.engine.components.performance.statistics import EquityStatistics
+from midas.engine.components.performance.equity_curve import EquityCurveBuffer
 from midas.account import EquityDetails, Account
 import mbn
 from midas.symbol import SymbolMap
@@ -12,10 +14,7 @@ from midas.constants import PRICE_FACTOR
 
 
 def _convert_timestamp(df: pd.DataFrame, column: str = "timestamp") -> None:
-    df[column] = pd.to_datetime(
-        df[column].map(lambda x: unix_to_iso(x, "EST"))
-    )
-    df[column] = df[column].dt.tz_convert("America/New_York")
+    df[column] = unix_to_datetime(df[column], "America/New_York")
     df[column] = df[column].dt.tz_localize(None)
 
 
@@ -294,69 +293,83 @@ class TradeManager:
 
 
 class EquityManager:
-    def __init__(self, logger):
-        self.equity_value: List[EquityDetails] = []
+    def __init__(self, logger, risk_free_rate: float = 0.04):
+        self.equity_curve = EquityCurveBuffer()
         self.daily_stats: pd.DataFrame = None
         self.period_stats: pd.DataFrame = None
+        self.statistics = EquityStatistics(risk_free_rate)
         self.logger = logger
 
+    @property
+    def equity_value(self) -> EquityCurveBuffer:
+        return self.equity_curve
+
+    @equity_value.setter
+    def equity_value(self, equity_value: Iterable[EquityDetails]) -> None:
+        self.equity_curve = EquityCurveBuffer.from_records(equity_value)
+
     def update_equity(self, equity_details: EquityDetails):
         """
         Updates and logs equity changes.
 
+        Samples arrive in market time order, a duplicate can only repeat the last sample.
+
         Parameters:
         - equity_details (EquityDetails): The equity details to be logged.
         """
-        if equity_details not in self.equity_value:
-            self.equity_value.append(equity_details)
-            self.logger.info(
-                f"\nEQUITY UPDATED: \n  {self.equity_value[-1]}\n"
-            )
+        timestamp = equity_details["timestamp"]
+        equity_value = equity_details["equity_value"]
+        if not self.equity_curve.is_last(timestamp, equity_value):
+            self.equity_curve.append(timestamp, equity_value)
+            self.statistics.update(timestamp, equity_value)
+            self.logger.info("\nEQUITY UPDATED: \n  %s\n", equity_details)
         else:
             self.logger.info(
-                f"Equity update already included ignoring: {equity_details}"
+                "Equity update already included ignoring: %s", equity_details
             )
 
     @property
     def period_stats_mbn(self) -> mbn.TimeseriesStats:
-
-        return [
-            mbn.TimeseriesStats(
-                timestamp=stat["timestamp"],
-                equity_value=int(stat["equity_value"] * PRICE_FACTOR),
-                percent_drawdown=int(stat["percent_drawdown"] * PRICE_FACTOR),
-                cumulative_return=int(
-                    stat["cumulative_return"] * PRICE_FACTOR
-                ),
-                period_return=int(stat["period_return"] * PRICE_FACTOR),
-            )
-            for stat in self.period_stats_dict
-        ]
+        return self._timeseries_mbn(self.period_stats)
 
     @property
     def daily_stats_mbn(self) -> mbn.TimeseriesStats:
+        return self._timeseries_mbn(self.daily_stats)
 
+    @staticmethod
+    def _timeseries_mbn(stats: pd.DataFrame) -> List[mbn.TimeseriesStats]:
+        """
+        Converts a return table to mbn, scaling the columns by PRICE_FACTOR as whole arrays.
+
+        Parameters:
+        - stats (pd.DataFrame): The period or daily return table.
+
+        Returns:
+        - List[mbn.TimeseriesStats]: One entry per row.
+        """
+        timestamps = stats["timestamp"].to_numpy(dtype=np.int64).tolist()
+        equity_value, percent_drawdown, cumulative_return, period_return = (
+            (stats[column].to_numpy(dtype=np.float64) * PRICE_FACTOR)
+            .astype(np.int64)
+            .tolist()
+            for column in (
+                "equity_value",
+                "percent_drawdown",
+                "cumulative_return",
+                "period_return",
+            )
+        )
         return [
             mbn.TimeseriesStats(
-                timestamp=stat["timestamp"],
-                equity_value=int(stat["equity_value"] * PRICE_FACTOR),
-                percent_drawdown=int(stat["percent_drawdown"] * PRICE_FACTOR),
-                cumulative_return=int(
-                    stat["cumulative_return"] * PRICE_FACTOR
-                ),
-                period_return=int(stat["period_return"] * PRICE_FACTOR),
+                timestamp=timestamps[i],
+                equity_value=equity_value[i],
+                percent_drawdown=percent_drawdown[i],
+                cumulative_return=cumulative_return[i],
+                period_return=period_return[i],
             )
-            for stat in self.daily_stats_dict
+            for i in range(len(timestamps))
         ]
 
-    @property
-    def period_stats_dict(self) -> dict:
-        return self.period_stats.to_dict(orient="records")
-
-    @property
-    def daily_stats_dict(self) -> dict:
-        return self.daily_stats.to_dict(orient="records")
-
     def _calculate_return_and_drawdown(
         self, data: pd.DataFrame
     ) -> pd.DataFrame:
@@ -387,74 +400,43 @@ class EquityManager:
         data.fillna(0, inplace=True)
         return data
 
-    def _remove_intermediate_updates(self, data: pd.DataFrame) -> pd.DataFrame:
-        """
-        Removes intermediate updates and keeps the last equity value for each timestamp.
-
-        Parameters:
-        - data (pd.DataFrame): The dataframe containing equity updates with timestamps.
-
-        Returns:
-        - pd.DataFrame: DataFrame with only the last entry per timestamp.
-        """
-        # Group by the timestamp and keep the last entry for each group
-        data = data.groupby("timestamp").last()
-        return data
-
     def calculate_equity_statistics(
         self, risk_free_rate: float = 0.04
     ) -> Dict[str, float]:
         """
         Calculates statistics related to equity curve and returns them in a dictionary.
-        """
-        raw_equity_df = pd.DataFrame(self.equity_value)
-        raw_equity_df.set_index("timestamp", inplace=True)
 
-        # Remove intermediate updates before calculating returns/drawdowns
-        raw_equity_df = self._remove_intermediate_updates(raw_equity_df)
+        The statistics are read from the streaming accumulators, which are only rebuilt if the equity curve was
+        replaced or the risk-free rate differs. The period and daily return tables are built for export.
 
-        daily_equity_curve = resample_timestamp(
-            raw_equity_df.copy(),
-            interval="D",
-            tz_info="EST",
-        )
-        self.period_stats = self._calculate_return_and_drawdown(
-            raw_equity_df.copy()
-        )
-        self.period_stats.reset_index(inplace=True)
-        self.daily_stats = self._calculate_return_and_drawdown(
-            daily_equity_curve.copy()
-        )
-        self.daily_stats.reset_index(inplace=True)
+        Parameters:
+        - risk_free_rate (float): Annual risk-free rate of the Sharpe and Sortino ratios.
 
-        raw_equity_curve = raw_equity_df["equity_value"].to_numpy()
-        daily_returns = self.daily_stats["period_return"].to_numpy()
-        period_returns = self.period_stats["period_return"].to_numpy()
+        Returns:
+        - Dict[str, float]: The equity statistics.
+        """
+        curve = self.equity_curve
+        if (
+            self.statistics.samples != len(curve)
+            or self.statistics.risk_free_rate != risk_free_rate
+        ):
+            self.statistics = EquityStatistics(risk_free_rate)
+            for timestamp, equity_value in zip(
+                curve.timestamps.tolist(), curve.equity_values.tolist()
+            ):
+                self.statistics.update(timestamp, equity_value)
+
+        # Last value per timestamp and per day, read from the curve columns
+        for name, (timestamps, equity_values) in (
+            ("period_stats", curve.last_per_timestamp()),
+            ("daily_stats", curve.last_per_day(tz_info="EST")),
+        ):
+            stats = pd.DataFrame(
+                {"timestamp": timestamps, "equity_value": equity_values}
+            )
+            setattr(self, name, self._calculate_return_and_drawdown(stats))
 
-        return {
-            "net_profit": float(Metrics.net_profit(raw_equity_curve)),
-            "beginning_equity": float(raw_equity_curve[0]),
-            "ending_equity": float(raw_equity_curve[-1]),
-            "total_return": float(Metrics.total_return(raw_equity_curve)),
-            "daily_standard_deviation_percentage": float(
-                Metrics.standard_deviation(daily_returns)
-            ),
-            "annual_standard_deviation_percentage": float(
-                Metrics.annual_standard_deviation(daily_returns)
-            ),
-            "max_drawdown_percentage_period": float(
-                Metrics.max_drawdown(period_returns)
-            ),
-            "max_drawdown_percentage_daily": float(
-                Metrics.max_drawdown(daily_returns)
-            ),
-            "sharpe_ratio": float(
-                Metrics.sharpe_ratio(daily_returns, risk_free_rate)
-            ),
-            "sortino_ratio": float(
-                Metrics.sortino_ratio(daily_returns, risk_free_rate)
-            ),
-        }
+        return self.statistics.summary()
 
 
 class AccountManager:
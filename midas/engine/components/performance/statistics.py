@@ -0,0 +1,239 @@
+import math
+import pytz
+from datetime import datetime, time, timedelta, timezone
+from typing import Dict, Hashable, Optional, Tuple
+
+TRADING_DAYS = 252
+
+# (count, mean, sum of squared deviations)
+Moments = Tuple[int, float, float]
+
+
+def _welford(moments: Moments, value: float) -> Moments:
+    count, mean, m2 = moments
+    count += 1
+    delta = value - mean
+    mean += delta / count
+    return count, mean, m2 + delta * (value - mean)
+
+
+def _standard_deviation(moments: Moments) -> float:
+    count, _, m2 = moments
+    return math.sqrt(m2 / (count - 1)) if count > 1 else 0.0
+
+
+class ReturnAccumulator:
+    """
+    Online statistics of the returns of an equity curve sampled once per key, e.g. per timestamp or per day.
+
+    A sample with the same key as the previous one replaces it, keeping the last value of each key like a groupby, so
+    the latest sample is held apart and only folded into the running state when a sample with a new key arrives.
+    Queries fold it in on the fly. Keys must arrive in order.
+
+    Returns start with a zero for the first key, as in the return tables of EquityManager. Means and variances are
+    kept with Welford's updates, the downside moments cover the returns below the per-period risk-free rate.
+
+    Attributes:
+    - risk_free_rate (float): Annual risk-free rate.
+    - periods (int): Number of keys in a year, used to annualize.
+    - first (Optional[float]): Equity value of the first key.
+    """
+
+    def __init__(self, risk_free_rate: float = 0.04, periods: int = 252):
+        """
+        Initializes an empty accumulator.
+
+        Parameters:
+        - risk_free_rate (float): Annual risk-free rate.
+        - periods (int): Number of keys in a year, used to annualize.
+        """
+        self.risk_free_rate = risk_free_rate
+        self.periods = periods
+        self.first: Optional[float] = None
+        self._threshold = risk_free_rate / periods
+        self._key: Optional[Hashable] = None
+        self._pending: Optional[float] = None
+        # (previous value, peak, max drawdown, returns, downside returns)
+        self._state = (None, 0.0, 0.0, (0, 0.0, 0.0), (0, 0.0, 0.0))
+
+    def update(self, key: Hashable, equity_value: float) -> None:
+        """
+        Adds an equity sample.
+
+        Parameters:
+        - key (Hashable): The timestamp or period of the sample.
+        - equity_value (float): The equity value.
+        """
+        if self._pending is None:
+            self.first = equity_value
+        elif key != self._key:
+            self._state = self._advance(self._state, self._pending)
+        elif self._state[3][0] == 0:
+            # Replacing the only sample
+            self.first = equity_value
+
+        self._key = key
+        self._pending = equity_value
+
+    def _advance(self, state: tuple, equity_value: float) -> tuple:
+        previous, peak, max_drawdown, returns, downside = state
+        # A non-positive denominator (blown-up account) counts as flat
+        period_return = (
+            (equity_value - previous) / previous
+            if previous is not None and previous > 0
+            else 0.0
+        )
+        peak = max(peak, equity_value)
+        if peak > 0:
+            max_drawdown = min(max_drawdown, (equity_value - peak) / peak)
+        returns = _welford(returns, period_return)
+        if period_return < self._threshold:
+            downside = _welford(downside, period_return)
+        return equity_value, peak, max_drawdown, returns, downside
+
+    def _current(self) -> tuple:
+        if self._pending is None:
+            return self._state
+        return self._advance(self._state, self._pending)
+
+    @property
+    def count(self) -> int:
+        """Number of keys sampled."""
+        return self._current()[3][0]
+
+    @property
+    def last(self) -> Optional[float]:
+        """Equity value of the last key."""
+        return self._pending
+
+    @property
+    def cumulative_return(self) -> float:
+        """Return from the first to the last key."""
+        if self._pending is None or self.first <= 0:
+            return 0.0
+        return (self._pending - self.first) / self.first
+
+    @property
+    def standard_deviation(self) -> float:
+        """Sample standard deviation of the returns."""
+        return _standard_deviation(self._current()[3])
+
+    @property
+    def annual_standard_deviation(self) -> float:
+        """Standard deviation of the returns annualized."""
+        return self.standard_deviation * math.sqrt(self.periods)
+
+    @property
+    def max_drawdown(self) -> float:
+        """Largest fall from a running peak as a fraction of the peak, zero or negative."""
+        return self._current()[2]
+
+    @property
+    def sharpe_ratio(self) -> float:
+        """Annualized mean return in excess of the risk-free rate over the standard deviation."""
+        _, _, _, returns, _ = self._current()
+        deviation = _standard_deviation(returns)
+        if not deviation:
+            return 0.0
+        excess = returns[1] - self._threshold
+        return excess / deviation * math.sqrt(self.periods)
+
+    @property
+    def sortino_ratio(self) -> float:
+        """Annualized mean return in excess of the risk-free rate over the downside deviation."""
+        _, _, _, returns, downside = self._current()
+        deviation = _standard_deviation(downside)
+        if not deviation:
+            return 0.0
+        excess = returns[1] - self._threshold
+        return excess / deviation * math.sqrt(self.periods)
+
+
+class EquityStatistics:
+    """
+    Streams equity samples into per-timestamp and per-day return accumulators, so the equity statistics of a run can
+    be read at any point in O(1).
+
+    Days are calendar days in the given timezone, each day keeping its last sample as when the curve is resampled
+    daily. Day boundaries are computed once per day, other samples only compare their timestamp to them.
+
+    Attributes:
+    - risk_free_rate (float): Annual risk-free rate of the Sharpe and Sortino ratios.
+    - samples (int): Number of samples added.
+    - period (ReturnAccumulator): Statistics of the curve sampled per timestamp.
+    - daily (ReturnAccumulator): Statistics of the curve sampled per day.
+    """
+
+    def __init__(self, risk_free_rate: float = 0.04, tz_info: str = "EST"):
+        """
+        Initializes empty statistics.
+
+        Parameters:
+        - risk_free_rate (float): Annual risk-free rate.
+        - tz_info (str): Timezone of the days.
+        """
+        self.risk_free_rate = risk_free_rate
+        self.samples = 0
+        self.period = ReturnAccumulator(risk_free_rate, TRADING_DAYS)
+        self.daily = ReturnAccumulator(risk_free_rate, TRADING_DAYS)
+        self._tz = pytz.timezone(tz_info)
+        self._day = None
+        self._day_start = 0
+        self._day_end = 0
+
+    def update(self, timestamp: int, equity_value: float) -> None:
+        """
+        Adds an equity sample.
+
+        Parameters:
+        - timestamp (int): UNIX timestamp in nanoseconds of the sample.
+        - equity_value (float): The equity value.
+        """
+        if not self._day_start <= timestamp < self._day_end:
+            self._set_day(timestamp)
+
+        self.samples += 1
+        self.period.update(timestamp, equity_value)
+        self.daily.update(self._day, equity_value)
+
+    def _set_day(self, timestamp: int) -> None:
+        local = datetime.fromtimestamp(
+            timestamp / 1e9, tz=timezone.utc
+        ).astimezone(self._tz)
+        day = local.date()
+        start = self._tz.localize(datetime.combine(day, time()))
+        end = self._tz.localize(
+            datetime.combine(day + timedelta(days=1), time())
+        )
+        self._day = day
+        self._day_start = int(start.timestamp() * 1e9)
+        self._day_end = int(end.timestamp() * 1e9)
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Returns the equity statistics, keyed like EquityManager.calculate_equity_statistics.
+
+        Returns:
+        - Dict[str, float]: The statistics.
+        """
+        if not self.samples:
+            raise ValueError("No equity samples to calculate statistics.")
+
+        beginning_equity = self.period.first
+        ending_equity = self.period.last
+        return {
+            "net_profit": float(ending_equity - beginning_equity),
+            "beginning_equity": float(beginning_equity),
+            "ending_equity": float(ending_equity),
+            "total_return": float(self.period.cumulative_return),
+            "daily_standard_deviation_percentage": (
+                self.daily.standard_deviation
+            ),
+            "annual_standard_deviation_percentage": (
+                self.daily.annual_standard_deviation
+            ),
+            "max_drawdown_percentage_period": self.period.max_drawdown,
+            "max_drawdown_percentage_daily": self.daily.max_drawdown,
+            "sharpe_ratio": self.daily.sharpe_ratio,
+            "sortino_ratio": self.daily.sortino_ratio,
+        }
@@ -1,4 +1,5 @@
-from typing import Dict
+import logging
+from typing import Callable, Dict
 from midas.account import Account
 from midas.positions import Position
 from midas.engine.components.observer import Subject, Observer, EventType
@@ -51,7 +52,8 @@ class OrderManager:
                 self.active_orders[order.orderId] = order
 
         # self.notify(EventType.ORDER_UPDATE)  # update database
-        self.logger.info(f"\nORDERS UPDATED: \n{self._ouput_orders()}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("\nORDERS UPDATED: \n%s", self._ouput_orders())
 
     def _ouput_orders(self) -> str:
         """
@@ -96,7 +98,10 @@ class PositionManager:
 
         # Notify listener and log
         self.pending_positions_update.discard(instrument_id)
-        self.logger.info(f"\nPOSITIONS UPDATED: \n{self._output_positions()}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "\nPOSITIONS UPDATED: \n%s", self._output_positions()
+            )
 
     def _output_positions(self) -> str:
         """
@@ -128,9 +133,10 @@ class AccountManager:
         - account_details (AccountDetails): The updated account details.
         """
         self.account = account_details
-        self.logger.info(
-            f"\nACCOUNT UPDATED: \n{self.account.pretty_print("  ")}"
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "\nACCOUNT UPDATED: \n%s", self.account.pretty_print("  ")
+            )
 
 
 class PortfolioServer(Subject, Observer):
@@ -147,13 +153,36 @@ class PortfolioServer(Subject, Observer):
         - logger (logging.Logger): Logger for logging messages.
         - database (DatabaseClient, optional): Client for database operations.
         """
-        Subject().__init__()
-        self.logger = SystemLogger.get_logger()
+        Subject.__init__(self)
+        self.logger = SystemLogger.get_logger("portfolio_server")
         self.order_manager = OrderManager(self.logger)
         self.position_manager = PositionManager(self.logger)
+        # Instruments with a filled order stay active until their position update
+        self.position_manager.pending_positions_update = (
+            self.order_manager.pending_positions_update
+        )
         self.account_manager = AccountManager(self.logger)
         self.symbols_map = symbols_map
 
+    def event_handlers(self) -> Dict[EventType, Callable[..., None]]:
+        # Own methods, so managers replaced after attach still receive the events
+        return {
+            EventType.POSITION_UPDATE: self.handle_position_update,
+            EventType.ACCOUNT_UPDATE: self.handle_account_update,
+            EventType.ORDER_UPDATE: self.handle_order_update,
+        }
+
+    def handle_position_update(
+        self, instrument_id: int, position: Position
+    ) -> None:
+        self.position_manager.update_positions(instrument_id, position)
+
+    def handle_account_update(self, account_details: Account) -> None:
+        self.account_manager.update_account_details(account_details)
+
+    def handle_order_update(self, order: ActiveOrder) -> None:
+        self.order_manager.update_orders(order)
+
     def handle_event(
         self, subject: Subject, event_type: EventType, *args, **kwargs
     ):
@@ -1,3 +1,4 @@
+import os
 import toml
 from enum import Enum
 from typing import List
@@ -32,15 +33,21 @@ class Config:
         self.risk = config_dict.get("risk", {})
         self.broker = config_dict.get("broker", {})
         self.data_source = config_dict.get("data_source", {})
+        self.backtest = config_dict.get("backtest", {})
 
         # General settings
         self.session_id = self.general.get("session_id")
         self.log_level = self.general.get("log_level", "INFO")
         self.log_output = self.general.get("log_output", "file")
+        self.log_async = self.general.get("log_async", False)
+        self.log_levels = self.general.get("log_levels", {})
+        self.log_sample = self.general.get("log_sample", {})
+        self.log_buffer = self.general.get("log_buffer", 1000)
         self.output_path = self.general.get("output_path", "")
         self.train_data_file = self.general.get("train_data_file", "")
         self.test_data_file = self.general.get("test_data_file", "")
         self.data_file = self.general.get("data_file", "")
+        self.profile_events = self.general.get("profile_events", False)
 
         # Database settings
         self.database_url = self.database.get("url")
@@ -54,6 +61,29 @@ class Config:
             self.strategy.get("symbols").values()
         )
 
+        # Backtest settings
+        self.chunk_days = self.backtest.get("chunk_days", 0)
+        self.cache_dir = self.backtest.get("cache_dir", "")
+        self.cache_size_mb = self.backtest.get("cache_size_mb", 1024)
+        self.cache_memory_mb = self.backtest.get("cache_memory_mb", 256)
+        self.shard_by = self.backtest.get("shard_by", "")
+        self.shard_workers = self.backtest.get("shard_workers", 4)
+        self.time_slices = self.backtest.get("time_slices", False)
+        self.reconcile_every = self.backtest.get("reconcile_every", 0)
+        self.order_latency_ms = self.backtest.get("order_latency_ms", {})
+        self.cost_model = self.backtest.get("cost_model", {})
+        self.equity_sampling = self.backtest.get("equity_sampling", "record")
+        self.equity_interval_s = self.backtest.get("equity_interval_s", 0)
+        if (
+            self.chunk_days > 0
+            and self.data_file
+            and not os.path.isdir(self.data_file)
+        ):
+            raise ValueError(
+                "'chunk_days' cannot be used with a single data file, set "
+                "'data_file' to a directory of BufferStore files instead."
+            )
+
         # Risk settings
         self.risk_module = self.risk.get("module")
         self.risk_class = self.risk.get("class")
@@ -1,8 +1,8 @@
-import time
 import queue
-import signal
+import asyncio
 from typing import Union, Optional
 from midas.symbol import SymbolMap
+from midas.cost_models import cost_model_factory
 from midasClient.client import DatabaseClient
 from midas.engine.components.order_book import OrderBook
 from midas.engine.components.observer.database_updater import DatabaseUpdater
@@ -14,16 +14,19 @@ from midas.engine.components.performance.base import PerformanceManager
 from midas.engine.config import Parameters
 from midas.engine.components.base_strategy import load_strategy_class
 from midas.engine.config import Config, Mode
-from midas.engine.components.observer.base import EventType
+from midas.engine.components.observer.base import EventType, Subject
+from midas.engine.components.observer.profiler import EventBusProfiler
 from midas.engine.components.gateways.backtest import (
     DataClient as BacktestDataClient,
     BrokerClient as BacktestBrokerClient,
     DummyBroker,
+    HistoricalCache,
 )
 from midas.engine.components.gateways.live import (
     DataClient as LiveDataClient,
     BrokerClient as LiveBrokerClient,
     ContractManager,
+    LiveRuntime,
 )
 
 
@@ -38,12 +41,15 @@ class EngineBuilder:
         self.order_book = None
         self.portfolio_server = None
         self.order_manager = None
+        self.cost_model = None
         self.observer = None
         self.performance_manager = None
         self.hist_data_client = None
         self.broker_client = None
         self.live_data_client = None
         self.dummy_broker = None
+        self.live_runtime = None
+        self.profiler = None
         self.eod_event_flag = None
 
     def _load_config(self, config_path: str) -> Config:
@@ -57,6 +63,10 @@ class EngineBuilder:
             self.config.log_output,
             self.config.output_path,
             self.config.log_level,
+            self.config.log_async,
+            self.config.log_levels,
+            self.config.log_sample,
+            self.config.log_buffer,
         )
         return self
 
@@ -82,10 +92,14 @@ class EngineBuilder:
         """Step 4: Create order book, portfolio server, and order manager"""
         self.order_book = OrderBook(self.symbols_map)
         self.portfolio_server = PortfolioServer(self.symbols_map)
+        self.cost_model = cost_model_factory(
+            self.symbols_map, **self.config.cost_model
+        )
         self.order_manager = OrderExecutionManager(
             self.symbols_map,
             self.order_book,
             self.portfolio_server,
+            self.cost_model,
         )
         self.performance_manager = PerformanceManager(
             self.database_client,
@@ -110,25 +124,66 @@ class EngineBuilder:
                 self.symbols_map,
             )
 
+            # IB callbacks are handed off to the runtime's event loop
+            self.live_runtime = LiveRuntime()
+            self.live_data_client.app.set_runtime(self.live_runtime)
+            self.broker_client.app.set_runtime(self.live_runtime)
+
         else:
             self.hist_data_client = BacktestDataClient(
                 self.database_client,
                 self.symbols_map,
+                self._create_historical_cache(),
+                self.config.shard_by,
+                self.config.shard_workers,
+                self.config.time_slices,
             )
             self.dummy_broker = DummyBroker(
                 self.symbols_map,
                 self.order_book,
                 self.config.strategy_parameters.get("capital", 0),
+                self.config.reconcile_every,
+                {
+                    venue: int(latency * 1_000_000)
+                    for venue, latency in self.config.order_latency_ms.items()
+                },
+                self.cost_model,
             )
             self.broker_client = BacktestBrokerClient(
                 self.dummy_broker,
                 self.symbols_map,
+                self.config.equity_sampling,
+                self.config.equity_interval_s,
             )
         return self
 
+    def _create_historical_cache(self) -> Optional[HistoricalCache]:
+        """Historical data cache, if a cache directory is configured."""
+        if not self.config.cache_dir:
+            return None
+
+        return HistoricalCache(
+            self.config.cache_dir,
+            max_disk_bytes=int(self.config.cache_size_mb * (1 << 20)),
+            max_memory_bytes=int(self.config.cache_memory_mb * (1 << 20)),
+        )
+
     def create_observers(self):
         """Step 5: Create observer (for live mode only)"""
+        # Instrument the event bus before any observer is attached
+        self.profiler = (
+            EventBusProfiler() if self.config.profile_events else None
+        )
+
         if self.mode == Mode.BACKTEST:
+            self._instrument(
+                self.hist_data_client,
+                self.order_book,
+                self.dummy_broker,
+                self.broker_client,
+                self.order_manager,
+                self.performance_manager,
+            )
             self.hist_data_client.attach(
                 self.dummy_broker, EventType.EOD_EVENT
             )
@@ -140,6 +195,12 @@ class EngineBuilder:
                 self.broker_client, EventType.TRADE_EXECUTED
             )
             self.dummy_broker.attach(self.broker_client, EventType.EOD_EVENT)
+            self.dummy_broker.attach(
+                self.broker_client, EventType.ORDER_UPDATE
+            )
+            self.broker_client.attach(
+                self.portfolio_server, EventType.ORDER_UPDATE
+            )
             self.broker_client.attach(
                 self.portfolio_server, EventType.POSITION_UPDATE
             )
@@ -157,6 +218,13 @@ class EngineBuilder:
             )
 
         if self.mode == Mode.LIVE:
+            self._instrument(
+                self.live_data_client.app,
+                self.broker_client.app,
+                self.order_book,
+                self.order_manager,
+                self.performance_manager,
+            )
             self.live_data_client.app.attach(
                 self.order_book, EventType.MARKET_DATA
             )
@@ -181,6 +249,11 @@ class EngineBuilder:
 
         return self
 
+    def _instrument(self, *subjects: Subject) -> None:
+        """Set the builder's profiler on the subjects."""
+        for subject in subjects:
+            subject.profiler = self.profiler
+
     def build(self):
         """Finalize and return the built trading system"""
         return Engine(
@@ -199,6 +272,8 @@ class EngineBuilder:
             ),
             hist_data_client=self.hist_data_client,
             broker_client=self.broker_client,
+            live_runtime=self.live_runtime,
+            profiler=self.profiler,
         )
 
 
@@ -218,6 +293,8 @@ class Engine:
         live_data_client: Optional[LiveDataClient],
         hist_data_client: BacktestDataClient,
         broker_client: Union[LiveBrokerClient, BacktestBrokerClient],
+        live_runtime: Optional[LiveRuntime] = None,
+        profiler: Optional[EventBusProfiler] = None,
     ):
         self.mode = mode
         self.config = config
@@ -233,6 +310,8 @@ class Engine:
         self.live_data_client = live_data_client  # live data client
         self.hist_data_client = hist_data_client  # historical data client
         self.broker_client = broker_client
+        self.live_runtime = live_runtime
+        self.profiler = profiler
         self.strategy = None
         self.contract_manager = None
         self.risk_model = None
@@ -319,10 +398,16 @@ class Engine:
             self.parameters.end,
             self.parameters.schema,
             self.config.data_file,
+            self.config.chunk_days,
         )
 
         if response:
             self.logger.info("Backtest data loaded.")
+            cache = self.hist_data_client.cache
+            if cache:
+                self.logger.info(
+                    f"Historical cache hits: {cache.hits}, misses: {cache.misses}"
+                )
         else:
             raise RuntimeError("Backtest data did not load.")
 
@@ -363,6 +448,7 @@ class Engine:
         """
         if self.config.risk_class:
             self.risk_model = RiskHandler(self.config.risk_class)
+            self.risk_model.profiler = self.profiler
 
             # Attach the DatabaseUpdater as an observer to RiskModel
             self.risk_model.attach(
@@ -384,6 +470,7 @@ class Engine:
             order_book=self.order_book,
             hist_data_client=self.hist_data_client,
         )
+        self.strategy.profiler = self.profiler
         self.performance_manager.set_strategy(self.strategy)
         self.order_book.attach(self.strategy, EventType.ORDER_BOOK)
         self.strategy.attach(self.order_manager, EventType.SIGNAL)
@@ -407,20 +494,21 @@ class Engine:
         self.logger.info("Event loop ended.")
 
     def _run_live_event_loop(self):
-        """Event loop for live trading."""
-        self.running = True
-        signal.signal(signal.SIGINT, self._signal_handler)
-
-        while self.running:
-            continue
+        """Event loop for live trading, runs until SIGINT."""
+        self.live_runtime.run(self._shutdown_live)
 
+    async def _shutdown_live(self):
+        """Final live session steps, run on the live runtime's loop."""
         # Perform cleanup here
-        self.database_updater.delete_session()
+        if self.observer is not None:
+            self.observer.delete_session()
 
         # Finalize and save to database
         self.broker_client.request_account_summary()
-        time.sleep(5)  # time for final account summary request-maybe shorten
-        self.performance_manager.save()
+        # Time for the final account summary, delivered through the loop
+        await asyncio.sleep(5)
+        self.performance_manager.save(self.mode, self.config.output_path)
+        self._log_profile()
 
     def _run_backtest_event_loop(self):
         """Event loop for backtesting."""
@@ -435,6 +523,12 @@ class Engine:
 
         # Finalize and save to database
         self.performance_manager.save(self.mode, self.config.output_path)
+        self._log_profile()
+
+    def _log_profile(self):
+        """Log the event bus profile, if profiling is enabled."""
+        if self.profiler is not None:
+            self.logger.info(self.profiler.summary())
 
     def stop(self):
         """Gracefully shut down the engine."""
@@ -442,8 +536,3 @@ class Engine:
         if self.mode == Mode.LIVE:
             self.live_data_client.disconnect()
         self.logger.info("Engine shutdown complete.")
-
-    def _signal_handler(self, signum, frame):
-        """Handles signals like SIGINT to gracefully shut down the event loop."""
-        self.logger.info("Signal received, preparing to shut down.")
-        self.running = False  # Stop the event loop
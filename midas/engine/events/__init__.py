@@ -3,6 +3,7 @@ from .signal_event import SignalEvent
 from .order_event import OrderEvent
 from .execution_event import ExecutionEvent
 from .eod_event import EODEvent
+from .time_slice_event import TimeSliceEvent
 
 # Public API of the 'events' module
 __all__ = [
@@ -11,4 +12,5 @@ __all__ = [
     "OrderEvent",
     "ExecutionEvent",
     "EODEvent",
+    "TimeSliceEvent",
 ]
@@ -0,0 +1,39 @@
+from typing import List, Union
+from mbn import OhlcvMsg, BboMsg
+from dataclasses import dataclass, field
+
+
+@dataclass
+class TimeSliceEvent:
+    """
+    Represents the market data updates of every instrument sharing a timestamp, delivered as one event.
+
+    Emitted in place of one MarketEvent per record when the backtest data client streams time slices, giving
+    strategies a complete cross-section of the instruments updated at that timestamp.
+
+    Attributes:
+    - timestamp (int): The UNIX timestamp in nanoseconds shared by the records.
+    - data (List[RecordMsg]): The records in replay order.
+    - type (str): Automatically set to 'TIME_SLICE', indicating the type of event.
+    """
+
+    timestamp: int
+    data: List[Union[OhlcvMsg, BboMsg]]
+    type: str = field(init=False, default="TIME_SLICE")
+
+    def __post_init__(self):
+        # Type Check
+        if not isinstance(self.timestamp, int):
+            raise TypeError("'timestamp' field must be of type int.")
+        if not isinstance(self.data, list) or not all(
+            isinstance(record, (OhlcvMsg, BboMsg)) for record in self.data
+        ):
+            raise TypeError(
+                "'data' field must be a list of OhlcvMsg or BboMsg."
+            )
+
+    def __str__(self) -> str:
+        string = f"\n{self.type} : \n"
+        for record in self.data:
+            string += f"  {record.instrument_id} : {record}\n"
+        return string
@@ -1,7 +1,10 @@
-from typing import Optional, Dict
+import numpy as np
 from abc import ABC, abstractmethod
+from collections.abc import MutableMapping
 from dataclasses import dataclass, field
-from midas.symbol import SecurityType, Symbol, Right
+from ibapi.contract import Contract
+from typing import Optional, Dict, Iterator, List, Tuple
+from midas.symbol import SecurityType, Symbol, SymbolMap, Right
 
 
 @dataclass
@@ -578,3 +581,314 @@ def position_factory(
         kwargs["initial_margin"] = symbol.initial_margin
 
     return asset_classes[asset_type](**kwargs)
+
+
+# Position kinds stored in the PositionBook
+EQUITY, FUTURE, OPTION = range(3)
+POSITION_KINDS: Dict[type, int] = {
+    EquityPosition: EQUITY,
+    FuturePosition: FUTURE,
+    OptionPosition: OPTION,
+}
+POSITION_CLASSES: Dict[int, type] = {
+    kind: cls for cls, kind in POSITION_KINDS.items()
+}
+
+
+class PositionBook(MutableMapping):
+    """
+    Columnar store of positions keyed by contract, backed by NumPy arrays indexed by a dense slot per instrument.
+
+    Marking the whole book to market and computing its unrealized PnL, margin and liquidation value are vectorized
+    over the arrays. Position objects are only built when a position is read; assigning one stores its fields back
+    into the arrays, so changes to a read position are not kept unless it is assigned again.
+
+    The valuation of each position as of its last mark is kept per slot, allowing a single instrument to be re-marked
+    and the change in value returned without touching the other positions.
+
+    Attributes:
+    - symbols_map (SymbolMap): Resolves contracts to instrument ids.
+    - quantity (np.ndarray): Signed quantity per slot.
+    - avg_price (np.ndarray): Average entry price per slot.
+    - market_price (np.ndarray): Price of the last mark per slot.
+    - price_multiplier (np.ndarray): Price multiplier per slot.
+    - quantity_multiplier (np.ndarray): Quantity multiplier per slot.
+    - initial_margin (np.ndarray): Margin per contract for futures, zero otherwise.
+    - side (np.ndarray): 1 for long (BUY) positions, -1 for short (SELL) positions.
+    - unrealized_pnl (np.ndarray): Unrealized PnL per slot as of the last mark.
+    - margin_required (np.ndarray): Margin required per slot as of the last mark.
+    - liquidation_value (np.ndarray): Liquidation value per slot as of the last mark.
+    """
+
+    COLUMNS = (
+        "quantity",
+        "avg_price",
+        "market_price",
+        "price_multiplier",
+        "quantity_multiplier",
+        "initial_margin",
+        "side",
+        "unrealized_pnl",
+        "margin_required",
+        "liquidation_value",
+    )
+
+    def __init__(self, symbols_map: SymbolMap, capacity: int = 64):
+        """
+        Initializes an empty position book.
+
+        Parameters:
+        - symbols_map (SymbolMap): Resolves contracts to instrument ids.
+        - capacity (int): Number of slots allocated up front, doubled whenever more instruments are held.
+        """
+        if capacity < 1:
+            raise ValueError("'capacity' must be greater than zero.")
+
+        self.symbols_map = symbols_map
+        self._slots: Dict[int, int] = {}
+        self._contracts: List[Contract] = []
+        self._options: Dict[int, Tuple[Right, float, str]] = {}
+        self._len = 0
+        self._instrument_ids = np.zeros(capacity, dtype=np.int64)
+        self._kind = np.zeros(capacity, dtype=np.int8)
+        self._open = np.zeros(capacity, dtype=bool)
+        for name in self.COLUMNS:
+            setattr(self, name, np.zeros(capacity))
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Contract]:
+        contracts = self._contracts
+        for slot in np.flatnonzero(self._open[: len(contracts)]):
+            yield contracts[slot]
+
+    def __contains__(self, contract: object) -> bool:
+        return self._open_slot(contract) is not None
+
+    def __getitem__(self, contract: Contract) -> Position:
+        slot = self._open_slot(contract)
+        if slot is None:
+            raise KeyError(contract)
+        return self._materialize(slot)
+
+    def __setitem__(self, contract: Contract, position: Position) -> None:
+        kind = POSITION_KINDS.get(type(position))
+        if kind is None:
+            raise TypeError(
+                f"Unsupported position type: {type(position).__name__}"
+            )
+
+        instrument_id = self.symbols_map.get_id(contract.symbol)
+        if instrument_id is None:
+            raise ValueError(f"Contract {contract.symbol} not in symbols map.")
+
+        slot = self._slots.get(instrument_id)
+        if slot is None:
+            slot = self._allocate(instrument_id, contract)
+
+        if not self._open[slot]:
+            # Nothing marked yet, first mark values the whole position
+            self._open[slot] = True
+            self._len += 1
+            self.unrealized_pnl[slot] = 0
+            self.margin_required[slot] = 0
+            self.liquidation_value[slot] = 0
+
+        self._contracts[slot] = contract
+        self._kind[slot] = kind
+        self.quantity[slot] = position.quantity
+        self.avg_price[slot] = position.avg_price
+        self.market_price[slot] = position.market_price
+        self.price_multiplier[slot] = position.price_multiplier
+        self.quantity_multiplier[slot] = position.quantity_multiplier
+        self.side[slot] = 1 if position.action == "BUY" else -1
+        self.initial_margin[slot] = (
+            position.initial_margin if kind == FUTURE else 0
+        )
+        if kind == OPTION:
+            self._options[slot] = (
+                position.type,
+                position.strike_price,
+                position.expiration_date,
+            )
+
+    def __delitem__(self, contract: Contract) -> None:
+        slot = self._open_slot(contract)
+        if slot is None:
+            raise KeyError(contract)
+
+        self._open[slot] = False
+        self._len -= 1
+        self._options.pop(slot, None)
+
+    def copy(self) -> Dict[Contract, Position]:
+        """
+        Materializes every position.
+
+        Returns:
+        - Dict[Contract, Position]: The positions by contract.
+        """
+        return dict(self.items())
+
+    def has_instrument(self, instrument_id: int) -> bool:
+        """
+        Checks if a position is held in an instrument.
+
+        Parameters:
+        - instrument_id (int): The instrument id.
+
+        Returns:
+        - bool: True if the book holds a position in the instrument.
+        """
+        slot = self._slots.get(instrument_id)
+        return slot is not None and bool(self._open[slot])
+
+    def instrument_ids(self) -> List[int]:
+        """
+        Returns the instruments held, in the order expected by mark.
+
+        Returns:
+        - List[int]: The instrument ids of the positions held.
+        """
+        return self._instrument_ids[self._open_slots()].tolist()
+
+    def mark(self, prices: List[float]) -> Tuple[float, float, float]:
+        """
+        Marks every position to market and values the book.
+
+        Parameters:
+        - prices (List[float]): The market price of each position, ordered as instrument_ids.
+
+        Returns:
+        - Tuple[float, float, float]: Total unrealized PnL, margin required and liquidation value.
+        """
+        slots = self._open_slots()
+        self.market_price[slots] = prices
+
+        kind = self._kind[slots]
+        quantity = self.quantity[slots]
+        market_price = self.market_price[slots]
+        price_multiplier = np.where(
+            kind == EQUITY, 1.0, self.price_multiplier[slots]
+        )
+        quantity_multiplier = self.quantity_multiplier[slots]
+        side = np.where(kind == OPTION, self.side[slots], 1.0)
+
+        unrealized_pnl = (
+            (market_price - self.avg_price[slots])
+            * price_multiplier
+            * quantity
+            * quantity_multiplier
+            * side
+        )
+        margin_required = self.initial_margin[slots] * np.abs(quantity)
+        liquidation_value = np.where(
+            kind == FUTURE,
+            margin_required + unrealized_pnl,
+            market_price * price_multiplier * quantity * quantity_multiplier,
+        )
+
+        self.unrealized_pnl[slots] = unrealized_pnl
+        self.margin_required[slots] = margin_required
+        self.liquidation_value[slots] = liquidation_value
+        return (
+            float(unrealized_pnl.sum()),
+            float(margin_required.sum()),
+            float(liquidation_value.sum()),
+        )
+
+    def mark_instrument(
+        self, instrument_id: int, price: float
+    ) -> Tuple[float, float, float]:
+        """
+        Marks the position in one instrument to market.
+
+        Parameters:
+        - instrument_id (int): The instrument id of the position.
+        - price (float): The market price.
+
+        Returns:
+        - Tuple[float, float, float]: Change in unrealized PnL, margin required and liquidation value since the
+          position was last marked.
+        """
+        slot = self._slots.get(instrument_id)
+        if slot is None or not self._open[slot]:
+            raise KeyError(instrument_id)
+
+        kind = self._kind.item(slot)
+        quantity = self.quantity.item(slot)
+        price_multiplier = (
+            1.0 if kind == EQUITY else self.price_multiplier.item(slot)
+        )
+        quantity_multiplier = self.quantity_multiplier.item(slot)
+        side = self.side.item(slot) if kind == OPTION else 1.0
+
+        unrealized_pnl = (
+            (price - self.avg_price.item(slot))
+            * price_multiplier
+            * quantity
+            * quantity_multiplier
+            * side
+        )
+        margin_required = self.initial_margin.item(slot) * abs(quantity)
+        if kind == FUTURE:
+            liquidation_value = margin_required + unrealized_pnl
+        else:
+            liquidation_value = (
+                price * price_multiplier * quantity * quantity_multiplier
+            )
+
+        change = (
+            unrealized_pnl - self.unrealized_pnl.item(slot),
+            margin_required - self.margin_required.item(slot),
+            liquidation_value - self.liquidation_value.item(slot),
+        )
+        self.market_price[slot] = price
+        self.unrealized_pnl[slot] = unrealized_pnl
+        self.margin_required[slot] = margin_required
+        self.liquidation_value[slot] = liquidation_value
+        return change
+
+    def _open_slot(self, contract: Contract) -> Optional[int]:
+        slot = self._slots.get(self.symbols_map.get_id(contract.symbol))
+        if slot is None or not self._open[slot]:
+            return None
+        return slot
+
+    def _open_slots(self) -> np.ndarray:
+        return np.flatnonzero(self._open[: len(self._contracts)])
+
+    def _allocate(self, instrument_id: int, contract: Contract) -> int:
+        slot = len(self._contracts)
+        if slot == len(self._open):
+            capacity = 2 * slot
+            for name in ("_instrument_ids", "_kind", "_open") + self.COLUMNS:
+                column = getattr(self, name)
+                grown = np.zeros(capacity, dtype=column.dtype)
+                grown[:slot] = column
+                setattr(self, name, grown)
+
+        self._slots[instrument_id] = slot
+        self._contracts.append(contract)
+        self._instrument_ids[slot] = instrument_id
+        return slot
+
+    def _materialize(self, slot: int) -> Position:
+        kind = self._kind.item(slot)
+        fields = {
+            "action": "BUY" if self.side.item(slot) > 0 else "SELL",
+            "quantity": self.quantity.item(slot),
+            "avg_price": self.avg_price.item(slot),
+            "market_price": self.market_price.item(slot),
+            "price_multiplier": self.price_multiplier.item(slot),
+            "quantity_multiplier": int(self.quantity_multiplier.item(slot)),
+        }
+        if kind == FUTURE:
+            fields["initial_margin"] = self.initial_margin.item(slot)
+        elif kind == OPTION:
+            right, strike_price, expiration_date = self._options[slot]
+            fields["type"] = right
+            fields["strike_price"] = strike_price
+            fields["expiration_date"] = expiration_date
+        return POSITION_CLASSES[kind](**fields)
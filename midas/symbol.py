@@ -1,15 +1,17 @@
 from enum import Enum
-from typing import Optional, Dict, List
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Optional, Dict, FrozenSet, List, Tuple, Union
 from ibapi.contract import Contract
 from abc import ABC, abstractmethod
 from midas.orders import Action
 from dataclasses import dataclass, field
-from datetime import time, datetime
+from datetime import date, time, datetime
+import numpy as np
 import pandas as pd
 import pandas_market_calendars as mcal
 from midas.utils.unix import unix_to_date
 from datetime import timedelta
-from midas.utils.unix import unix_to_iso
 
 
 # -- Symbol Details --
@@ -127,6 +129,255 @@ class TradingSession:
             raise ValueError("One session (day or night) must be defined.")
 
 
+def _time_offset(value: time) -> pd.Timedelta:
+    return pd.Timedelta(
+        hours=value.hour,
+        minutes=value.minute,
+        seconds=value.second,
+        microseconds=value.microsecond,
+    )
+
+
+@lru_cache(maxsize=None)
+def _valid_days(market_calendar: str, year: int) -> pd.DatetimeIndex:
+    """Trading days of a market calendar for one year, shared by every symbol trading on the calendar."""
+    calendar = mcal.get_calendar(market_calendar)
+    return calendar.valid_days(
+        start_date=f"{year}-01-01", end_date=f"{year}-12-31"
+    )
+
+
+@lru_cache(maxsize=None)
+def _calendar_year(
+    market_calendar: str, year: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Loads the trading days and early closes of a market calendar for one year, shared by every symbol
+    trading on the calendar.
+
+    Returns:
+    - Tuple[np.ndarray, np.ndarray, np.ndarray]: The trading dates, the early close dates and the early
+      close instants in UTC nanoseconds.
+    """
+    calendar = mcal.get_calendar(market_calendar)
+    schedule = calendar.schedule(
+        start_date=f"{year}-01-01", end_date=f"{year}-12-31"
+    )
+    early_closes = calendar.early_closes(schedule)
+    return (
+        schedule.index.to_numpy().astype("datetime64[D]"),
+        early_closes.index.to_numpy().astype("datetime64[D]"),
+        pd.DatetimeIndex(early_closes["market_close"]).as_unit("ns").asi8,
+    )
+
+
+class SessionTable:
+    """
+    Day session open and close instants of every local date, in UTC nanoseconds, so session checks are
+    integer comparisons instead of timezone conversions.
+
+    Rows are built from the TradingSession times in the local timezone, which accounts for daylight
+    saving. With a market calendar, dates that are not trading days have an empty session ending at the
+    regular close, and early closes move the close earlier. The table covers whole years and is extended
+    when a timestamp falls outside of it.
+    """
+
+    _DAY_NS = 86_400_000_000_000
+
+    def __init__(
+        self,
+        trading_session: TradingSession,
+        market_calendar: Optional[str] = None,
+        tz_info: str = "America/New_York",
+    ):
+        """
+        Initializes an empty table.
+
+        Parameters:
+        - trading_session (TradingSession): The session times in the local timezone.
+        - market_calendar (Optional[str]): pandas_market_calendars name for holidays and early closes.
+        - tz_info (str): The local timezone of the session times.
+        """
+        if not trading_session.day_open:
+            raise ValueError("Day session must be defined.")
+
+        self.trading_session = trading_session
+        self.market_calendar = market_calendar
+        self.tz_info = tz_info
+        self._first_year = 0
+        self._last_year = -1
+        self._first_day = 0
+        self._starts = np.empty(0, dtype=np.int64)
+        self._opens = np.empty(0, dtype=np.int64)
+        self._closes = np.empty(0, dtype=np.int64)
+
+        # Bounds of the last row looked up
+        self._row_start = 0
+        self._row_end = 0
+        self._row_day = 0
+        self._open = 0
+        self._close = 0
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def _build_year(
+        self, year: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        dates = pd.date_range(f"{year}-01-01", f"{year}-12-31", freq="D")
+
+        def instants(offset: pd.Timedelta) -> np.ndarray:
+            return (
+                (dates + offset)
+                .tz_localize(
+                    self.tz_info,
+                    ambiguous=np.ones(len(dates), dtype=bool),
+                    nonexistent="shift_forward",
+                )
+                .as_unit("ns")
+                .asi8
+            )
+
+        starts = instants(pd.Timedelta(0))
+        opens = instants(_time_offset(self.trading_session.day_open))
+        closes = instants(_time_offset(self.trading_session.day_close))
+
+        if self.market_calendar:
+            days = dates.to_numpy().astype("datetime64[D]")
+            trading_days, early_days, early_closes = _calendar_year(
+                self.market_calendar, year
+            )
+            early = np.searchsorted(days, early_days)
+            closes[early] = np.minimum(closes[early], early_closes)
+            opens = np.where(np.isin(days, trading_days), opens, closes + 1)
+        return starts, opens, closes
+
+    def _extend(self, timestamp_ns: int) -> None:
+        """Extends the table by whole years to cover the given timestamp."""
+        year = (
+            pd.Timestamp(int(timestamp_ns), tz="UTC")
+            .tz_convert(self.tz_info)
+            .year
+        )
+        if self._last_year < self._first_year:
+            first, last = year, year
+        else:
+            first = min(year, self._first_year)
+            last = max(year, self._last_year)
+
+        before = [self._build_year(y) for y in range(first, self._first_year)]
+        after = [
+            self._build_year(y)
+            for y in range(max(self._last_year + 1, first), last + 1)
+        ]
+        current = [(self._starts, self._opens, self._closes)]
+        rows = before + current + after
+        self._starts, self._opens, self._closes = (
+            np.concatenate([row[i] for row in rows]) for i in range(3)
+        )
+        self._first_year, self._last_year = first, last
+        self._first_day = int(
+            np.datetime64(f"{first}-01-01", "D").astype(np.int64)
+        )
+
+    def _end(self) -> int:
+        return int(self._starts[-1]) + self._DAY_NS if len(self) else 0
+
+    def _seek(self, timestamp_ns: int) -> None:
+        """Caches the row of the local date containing the given timestamp."""
+        if not len(self) or not (
+            self._starts[0] <= timestamp_ns < self._end()
+        ):
+            self._extend(timestamp_ns)
+
+        row = int(np.searchsorted(self._starts, timestamp_ns, "right")) - 1
+        self._row_start = int(self._starts[row])
+        self._row_end = (
+            int(self._starts[row + 1]) if row + 1 < len(self) else self._end()
+        )
+        self._row_day = self._first_day + row
+        self._open = int(self._opens[row])
+        self._close = int(self._closes[row])
+
+    def _rows(self, timestamps: np.ndarray) -> np.ndarray:
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        if len(timestamps):
+            for bound in (timestamps.min(), timestamps.max()):
+                if not len(self) or not (
+                    self._starts[0] <= bound < self._end()
+                ):
+                    self._extend(int(bound))
+        return np.searchsorted(self._starts, timestamps, "right") - 1
+
+    def day(self, timestamp_ns: int) -> int:
+        """
+        Local date of a timestamp.
+
+        Parameters:
+        - timestamp_ns (int): UNIX timestamp in nanoseconds.
+
+        Returns:
+        - int: The local date as days since 1970-01-01.
+        """
+        if not self._row_start <= timestamp_ns < self._row_end:
+            self._seek(timestamp_ns)
+        return self._row_day
+
+    def in_session(self, timestamp_ns: int) -> bool:
+        """
+        Checks if a timestamp falls within the day session of its local date, bounds included.
+
+        Parameters:
+        - timestamp_ns (int): UNIX timestamp in nanoseconds.
+
+        Returns:
+        - bool: True if the timestamp is within the session.
+        """
+        if not self._row_start <= timestamp_ns < self._row_end:
+            self._seek(timestamp_ns)
+        return self._open <= timestamp_ns <= self._close
+
+    def after_close(self, timestamp_ns: int) -> bool:
+        """
+        Checks if a timestamp is after the day session close of its local date.
+
+        Parameters:
+        - timestamp_ns (int): UNIX timestamp in nanoseconds.
+
+        Returns:
+        - bool: True if the timestamp is after the close.
+        """
+        if not self._row_start <= timestamp_ns < self._row_end:
+            self._seek(timestamp_ns)
+        return timestamp_ns > self._close
+
+    def days(self, timestamps: np.ndarray) -> np.ndarray:
+        """
+        Local dates of an array of timestamps.
+
+        Parameters:
+        - timestamps (np.ndarray): UNIX timestamps in nanoseconds.
+
+        Returns:
+        - np.ndarray: The local dates as days since 1970-01-01.
+        """
+        rows = self._rows(timestamps)
+        return self._first_day + rows
+
+    def after_close_array(self, timestamps: np.ndarray) -> np.ndarray:
+        """
+        Checks an array of timestamps against the day session close of their local dates.
+
+        Parameters:
+        - timestamps (np.ndarray): UNIX timestamps in nanoseconds.
+
+        Returns:
+        - np.ndarray: True where the timestamp is after the close.
+        """
+        rows = self._rows(timestamps)
+        return np.asarray(timestamps, dtype=np.int64) > self._closes[rows]
+
+
 # -- Symbols --
 @dataclass
 class Symbol(ABC):
@@ -265,30 +516,16 @@ class Symbol(ABC):
 
         return adjusted_price
 
-    def after_day_session(self, timestamp_ns: int) -> bool:
-        dt = datetime.fromisoformat(
-            unix_to_iso(timestamp_ns, tz_info="America/New_York")
-        )
-        time = dt.time()
+    @cached_property
+    def session_table(self) -> SessionTable:
+        """Day session instants of every New York date, built lazily."""
+        return SessionTable(self.trading_sessions)
 
-        if self.trading_sessions.day_close < time:
-            return True
-        return False
+    def after_day_session(self, timestamp_ns: int) -> bool:
+        return self.session_table.after_close(timestamp_ns)
 
     def in_day_session(self, timestamp_ns: int) -> bool:
-        dt = datetime.fromisoformat(
-            unix_to_iso(timestamp_ns, tz_info="America/New_York")
-        )
-        time = dt.time()
-
-        # Check if the time falls within any of the trading sessions
-        if (
-            self.trading_sessions.day_open
-            <= time
-            <= self.trading_sessions.day_close
-        ):
-            return True
-        return False
+        return self.session_table.in_session(timestamp_ns)
 
     @abstractmethod
     def value(self, quantity: float, price: Optional[float] = None) -> float:
@@ -379,6 +616,12 @@ class Future(Symbol):
     expr_months: List[FuturesMonth]
     term_day_rule: str
     market_calendar: str
+    _expirations: Dict[tuple, datetime] = field(
+        init=False, default_factory=dict, repr=False, compare=False
+    )
+    _roll_windows: Dict[tuple, np.ndarray] = field(
+        init=False, default_factory=dict, repr=False, compare=False
+    )
 
     def __post_init__(self):
         self.security_type = SecurityType.FUTURE
@@ -425,6 +668,11 @@ class Future(Symbol):
         # Create contract object
         self.contract = self.to_contract()
 
+    @cached_property
+    def session_table(self) -> SessionTable:
+        """Day session instants of every New York date, with the holidays and early closes of the market calendar."""
+        return SessionTable(self.trading_sessions, self.market_calendar)
+
     def to_contract_data(self) -> dict:
         data = super().to_contract_data()
         data["lastTradeDateOrContractMonth"] = (
@@ -501,7 +749,7 @@ class Future(Symbol):
 
         if month in [month.value for month in self.expr_months]:
             # Get the termination date for the current contract month/year
-            termination_date = self.apply_day_rule(month, year).date()
+            termination_date = self.expiration_date(month, year).date()
 
             # Calculate the rolling window period
             window_start = termination_date - timedelta(days=window)
@@ -512,6 +760,117 @@ class Future(Symbol):
         else:
             return False
 
+    def in_rolling_window_array(
+        self,
+        timestamps: np.ndarray,
+        window: int = 2,
+        tz_info="UTC",
+    ) -> np.ndarray:
+        """
+        Check which timestamps of an array fall within the rolling window before the termination date.
+
+        Parameters:
+        - timestamps (np.ndarray): The timestamps in nanoseconds.
+        - window (int): The rolling window size in days (defaults to 2).
+        - tz_info (str): The timezone information (defaults to "UTC").
+
+        Returns:
+        - np.ndarray: Whether each timestamp is within the rolling window of the termination period.
+        """
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        if not len(timestamps):
+            return np.zeros(0, dtype=bool)
+
+        first_year, last_year = (
+            pd.Timestamp(int(ts), tz="UTC").tz_convert(tz_info).year
+            for ts in (timestamps.min(), timestamps.max())
+        )
+        bounds = self.roll_windows(first_year, last_year, window, tz_info)
+        return np.searchsorted(bounds, timestamps, "right") % 2 == 1
+
+    def roll_windows(
+        self,
+        first_year: int,
+        last_year: int,
+        window: int = 2,
+        tz_info="UTC",
+    ) -> np.ndarray:
+        """
+        Computes the rolling windows of every expiration month in a range of years, cached per range.
+
+        Windows start at local midnight of their first day and end at local midnight after their last day,
+        clipped to the expiration month as only dates in that month are checked against its termination.
+        They are sorted and disjoint, so a timestamp is in a window when an odd number of bounds are at or
+        before it.
+
+        Parameters:
+        - first_year (int): The first year of the range.
+        - last_year (int): The last year of the range, included.
+        - window (int): The rolling window size in days (defaults to 2).
+        - tz_info (str): The timezone information (defaults to "UTC").
+
+        Returns:
+        - np.ndarray: The window bounds in UTC nanoseconds.
+        """
+        months = sorted({month.value for month in self.expr_months})
+        key = (
+            self.term_day_rule,
+            tuple(months),
+            first_year,
+            last_year,
+            window,
+            tz_info,
+        )
+        if key in self._roll_windows:
+            return self._roll_windows[key]
+
+        bounds = []
+        for year in range(first_year, last_year + 1):
+            for month in months:
+                termination_date = self.expiration_date(month, year).date()
+                month_start = date(year, month, 1)
+                month_end = (month_start + timedelta(days=32)).replace(day=1)
+                bounds.append(
+                    max(termination_date - timedelta(days=window), month_start)
+                )
+                bounds.append(
+                    min(
+                        termination_date + timedelta(days=window + 1),
+                        month_end,
+                    )
+                )
+
+        instants = (
+            pd.DatetimeIndex(bounds)
+            .tz_localize(
+                tz_info,
+                ambiguous=np.ones(len(bounds), dtype=bool),
+                nonexistent="shift_forward",
+            )
+            .as_unit("ns")
+            .asi8
+        )
+        # Windows touching at a month boundary are merged
+        instants, counts = np.unique(instants, return_counts=True)
+        self._roll_windows[key] = instants[counts % 2 == 1]
+        return self._roll_windows[key]
+
+    def expiration_date(self, month: int, year: int) -> datetime:
+        """
+        Determine the expiration date of a contract month with the day rule, cached per rule.
+
+        Parameters:
+        - month (int): The contract month.
+        - year (int): The contract year.
+
+        Returns:
+        - datetime: The expiration date.
+        """
+        key = (self.term_day_rule, month, year)
+        if key not in self._expirations:
+            self._expirations[key] = self.apply_day_rule(month, year)
+        return self._expirations[key]
+
     def apply_day_rule(self, month: int, year: int) -> datetime:
         """
         Apply the user-friendly day rule to determine the expiration date.
@@ -559,18 +918,9 @@ class Future(Symbol):
         """
         Get the nth business day of the specified month and year.
         """
-        start_date = pd.Timestamp(year, month, 1)
-        year = year if month < 12 else year + 1
-        month = month if month < 12 else 0
-
-        end_date = pd.Timestamp(year, month + 1, 1) - pd.Timedelta(days=1)
-
         # Get the valid trading days for the given month
-        calendar = mcal.get_calendar(market_calendar)
-        trading_days = calendar.valid_days(
-            start_date=start_date,
-            end_date=end_date,
-        )
+        trading_days = _valid_days(market_calendar, year)
+        trading_days = trading_days[trading_days.month == month]
         return trading_days[nth_day - 1]  # Return the nth trading day
 
     @staticmethod
@@ -583,18 +933,8 @@ class Future(Symbol):
         """
         Get the nth last business day of the specified month and year.
         """
-        start_date = pd.Timestamp(year, month, 1)
-        year = year if month < 12 else year + 1
-        month = month if month < 12 else 0
-
-        end_date = pd.Timestamp(year, month + 1, 1) - pd.Timedelta(days=1)
-
-        calendar = mcal.get_calendar(market_calendar)
-        trading_days = calendar.valid_days(
-            start_date=start_date,
-            end_date=end_date,
-        )
-
+        trading_days = _valid_days(market_calendar, year)
+        trading_days = trading_days[trading_days.month == month]
         return trading_days[-nth_last_day]
 
     @staticmethod
@@ -608,14 +948,10 @@ class Future(Symbol):
         """
         Get the nth business day before the specified target day in the given month and year.
         """
-        start_date = pd.Timestamp(year, month, 1)
-        end_date = pd.Timestamp(year, month, nth_day)
-
-        calendar = mcal.get_calendar(market_calendar)
-        trading_days = calendar.valid_days(
-            start_date=start_date,
-            end_date=end_date,
-        )
+        trading_days = _valid_days(market_calendar, year)
+        trading_days = trading_days[
+            (trading_days.month == month) & (trading_days.day <= nth_day)
+        ]
         return trading_days[-target_day]
 
 
@@ -851,6 +1187,15 @@ class SymbolMap:
         self.data_map: Dict[str, int] = {}
         self.midas_map: Dict[str, int] = {}
 
+        # Any ticker to its instrument ID, resolved as broker, data then midas
+        self._ids: Dict[str, int] = {}
+
+        # Dense slot 0..N-1 per instrument ID, in order of addition
+        self._slots: Dict[int, int] = {}
+
+        # Immutable views, rebuilt on first access after a symbol is added
+        self._views: Dict[str, Union[tuple, frozenset]] = {}
+
     def add_symbol(
         self,
         symbol: Symbol,
@@ -871,8 +1216,22 @@ class SymbolMap:
         self.data_map[symbol.data_ticker] = symbol.instrument_id
         self.midas_map[symbol.midas_ticker] = symbol.instrument_id
 
+        # Only the tickers of the symbol can resolve differently
+        for ticker in (
+            symbol.broker_ticker,
+            symbol.data_ticker,
+            symbol.midas_ticker,
+        ):
+            self._ids[ticker] = (
+                self.broker_map.get(ticker)
+                or self.data_map.get(ticker)
+                or self.midas_map.get(ticker)
+            )
+
         # Associate the instrument ID with the symbol
         self.map[symbol.instrument_id] = symbol
+        self._slots.setdefault(symbol.instrument_id, len(self._slots))
+        self._views.clear()
 
     def get_symbol(self, ticker: str) -> Symbol:
         """
@@ -884,37 +1243,62 @@ class SymbolMap:
         Returns:
         - Symbol: The symbol associated with the provided ticker, or None if not found.
         """
-        instrument_id = self.get_id(ticker)
+        instrument_id = self._ids.get(ticker)
         return self.map.get(instrument_id)
 
     def get_id(self, ticker: str) -> int:
-        instrument_id = (
-            self.broker_map.get(ticker)
-            or self.data_map.get(ticker)
-            or self.midas_map.get(ticker)
-        )
-        return instrument_id
+        return self._ids.get(ticker)
+
+    def get_slot(self, instrument_id: int) -> Optional[int]:
+        """
+        Retrieve the dense slot of an instrument, stable for the life of the map.
+
+        Parameters:
+        - instrument_id (int): The universal instrument ID.
+
+        Returns:
+        - Optional[int]: The slot in 0..N-1, or None if not found.
+        """
+        return self._slots.get(instrument_id)
+
+    @property
+    def slots(self) -> MappingProxyType:
+        # Read-only view of the slot of each instrument ID
+        return MappingProxyType(self._slots)
+
+    def _view(self, name: str, build) -> Union[tuple, frozenset]:
+        view = self._views.get(name)
+        if view is None:
+            view = self._views[name] = build()
+        return view
 
     @property
-    def symbols(self) -> List[Symbol]:
-        # Return the list of all unique symbols
-        return list(self.map.values())
+    def symbols(self) -> Tuple[Symbol, ...]:
+        # Return all unique symbols
+        return self._view("symbols", lambda: tuple(self.map.values()))
 
     @property
-    def instrument_ids(self) -> List[int]:
-        return list(self.map.keys())
+    def instrument_ids(self) -> Tuple[int, ...]:
+        return self._view("instrument_ids", lambda: tuple(self.map.keys()))
 
     @property
-    def broker_tickers(self) -> List[str]:
+    def broker_tickers(self) -> Tuple[str, ...]:
         # Return just the broker tickers
-        return list(self.broker_map.keys())
+        return self._view("broker_tickers", lambda: tuple(self.broker_map))
+
+    @property
+    def broker_ticker_set(self) -> FrozenSet[str]:
+        # Broker tickers for membership checks
+        return self._view(
+            "broker_ticker_set", lambda: frozenset(self.broker_map)
+        )
 
     @property
-    def data_tickers(self) -> List[str]:
+    def data_tickers(self) -> Tuple[str, ...]:
         # Return just the data tickers
-        return list(self.data_map.keys())
+        return self._view("data_tickers", lambda: tuple(self.data_map))
 
     @property
-    def midas_tickers(self) -> List[str]:
+    def midas_tickers(self) -> Tuple[str, ...]:
         # Return just the midas tickers
-        return list(self.midas_map.keys())
+        return self._view("midas_tickers", lambda: tuple(self.midas_map))
@@ -1,5 +1,141 @@
 import os
+import queue
+import atexit
 import logging
+from time import time
+from collections import deque
+from typing import Dict, List, Optional, Union
+from logging.handlers import QueueHandler, QueueListener
+
+
+class SampledLogger(logging.LoggerAdapter):
+    """
+    Logger passing one in every N calls below WARNING, counted per message template.
+
+    Calls are sampled before a record is created, so dropped calls cost a counter update. Sampled messages must be
+    %-style templates with the values passed as arguments, so calls of the same message share a counter. Counters
+    are kept for the most recently used templates only, pre-formatted messages evict each other instead of growing
+    the counters without bound. Dropped calls are kept in the ring buffer, if given, to be written out when an
+    error is logged.
+
+    Parameters:
+    - logger (logging.Logger): The component logger.
+    - rate (int): Sampling rate N.
+    - ring (Optional[deque]): Holds the dropped calls.
+    - max_templates (int): Number of templates counted at once.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        rate: int,
+        ring: Optional[deque] = None,
+        max_templates: int = 1024,
+    ):
+        if not isinstance(rate, int) or rate < 1:
+            raise ValueError("'rate' must be a positive integer.")
+        if not isinstance(max_templates, int) or max_templates < 1:
+            raise ValueError("'max_templates' must be a positive integer.")
+
+        super().__init__(logger, None)
+        self.rate = rate
+        self.ring = ring
+        self.max_templates = max_templates
+        self._counts: Dict[str, int] = {}
+
+    def log(self, level: int, msg, *args, **kwargs) -> None:
+        if not self.logger.isEnabledFor(level):
+            return
+
+        if level < logging.WARNING:
+            # Reinserting keeps the dict in least recently used order
+            count = self._counts.pop(msg, 0)
+            self._counts[msg] = count + 1
+            if len(self._counts) > self.max_templates:
+                del self._counts[next(iter(self._counts))]
+            if count % self.rate:
+                if self.ring is not None:
+                    self.ring.append((self.logger, level, msg, args, time()))
+                return
+
+        self.logger.log(level, msg, *args, **kwargs)
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    Forwards records to the output handlers, writing out the calls held in the ring buffer before any error.
+
+    The ring buffer is filled by SampledLogger with the calls dropped by sampling, so the output carries the full
+    context leading up to the error.
+
+    Parameters:
+    - targets (List[logging.Handler]): The output handlers.
+    - ring (deque): Dropped calls, the oldest are discarded once full.
+    - flush_level (int): Level of the records triggering a flush.
+    """
+
+    def __init__(
+        self,
+        targets: List[logging.Handler],
+        ring: deque,
+        flush_level: int = logging.ERROR,
+    ):
+        super().__init__()
+        self.targets = targets
+        self.ring = ring
+        self.flush_level = flush_level
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.levelno >= self.flush_level:
+            self.flush_buffer()
+        self._forward(record)
+
+    def flush_buffer(self) -> None:
+        """
+        Writes the held back calls to the output handlers.
+        """
+        while self.ring:
+            try:
+                logger, level, msg, args, created = self.ring.popleft()
+            except IndexError:
+                break
+            record = logger.makeRecord(
+                logger.name, level, "(sampled)", 0, msg, args, None
+            )
+            record.created = created
+            record.msecs = int(created * 1000) % 1000
+            self._forward(record)
+
+    def flush(self) -> None:
+        for target in self.targets:
+            target.flush()
+
+    def close(self) -> None:
+        for target in self.targets:
+            target.close()
+        super().close()
+
+    def _forward(self, record: logging.LogRecord) -> None:
+        for target in self.targets:
+            if record.levelno >= target.level:
+                target.handle(record)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler passing records to the listener unformatted, so message formatting happens on the listener thread.
+
+    Arguments of deferred records are read when the record is formatted and should not be mutated after logging.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info:
+            # Tracebacks cannot be pickled or formatted later
+            record.exc_text = logging.Formatter().formatException(
+                record.exc_info
+            )
+            record.exc_info = None
+        return record
 
 
 class SystemLogger:
@@ -11,17 +147,42 @@ class SystemLogger:
         output_format="file",
         output_file_path="output/",
         level=logging.INFO,
+        async_mode=False,
+        component_levels=None,
+        sample_rates=None,
+        buffer_size=0,
     ):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._initialize(
-                name, output_format, output_file_path, level
+                name,
+                output_format,
+                output_file_path,
+                level,
+                async_mode,
+                component_levels or {},
+                sample_rates or {},
+                buffer_size,
             )
         return cls._instance
 
-    def _initialize(self, name, output_format, output_file_path, level):
+    def _initialize(
+        self,
+        name,
+        output_format,
+        output_file_path,
+        level,
+        async_mode,
+        component_levels,
+        sample_rates,
+        buffer_size,
+    ):
         self.logger = logging.getLogger(f"{name}_logger")
         self.logger.setLevel(level)
+        self.listener = None
+        self.sampled: Dict[str, SampledLogger] = {}
+
+        handlers = []
         if output_format in ["file", "both"]:
             if not os.path.exists(output_file_path):
                 os.makedirs(output_file_path, exist_ok=True)
@@ -32,18 +193,69 @@ class SystemLogger:
                     "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
                 )
             )
-            self.logger.addHandler(file_handler)
+            handlers.append(file_handler)
         if output_format in ["terminal", "both"]:
             stream_handler = logging.StreamHandler()
             stream_handler.setFormatter(
                 logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
             )
-            self.logger.addHandler(stream_handler)
+            handlers.append(stream_handler)
+
+        # Per-component levels, e.g. {"order_book": "WARNING"}
+        for component, component_level in component_levels.items():
+            self.logger.getChild(component).setLevel(component_level)
+
+        # Sampled components, dropped calls are held for an error flush
+        if sample_rates:
+            ring = deque(maxlen=buffer_size)
+            for component, rate in sample_rates.items():
+                self.sampled[component] = SampledLogger(
+                    self.logger.getChild(component), rate, ring
+                )
+            handlers = [RingBufferHandler(handlers, ring)]
+
+        if async_mode:
+            log_queue = queue.SimpleQueue()
+            self.listener = QueueListener(
+                log_queue,
+                *handlers,
+                respect_handler_level=True,
+            )
+            self.listener.start()
+            atexit.register(self.stop)
+            handlers = [DeferredQueueHandler(log_queue)]
+
+        for handler in handlers:
+            self.logger.addHandler(handler)
+
+    def stop(self) -> None:
+        """
+        Writes out the records still queued in async mode and stops the listener thread.
+        """
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
 
     @classmethod
-    def get_logger(cls):
+    def get_logger(
+        cls,
+        component: Optional[str] = None,
+    ) -> Union[logging.Logger, SampledLogger]:
+        """
+        Returns the system logger, or the child logger of a component.
+
+        Component loggers share the system logger's output and can be given their own level and sampling rate,
+        components with a sampling rate get a SampledLogger.
+
+        Parameters:
+        - component (Optional[str]): Component name, e.g. "order_book".
+        """
         if cls._instance is None:
             raise RuntimeError(
                 "SystemLogger is not initialized. Call the constructor first."
             )
-        return cls._instance.logger
+        if component is None:
+            return cls._instance.logger
+        if component in cls._instance.sampled:
+            return cls._instance.sampled[component]
+        return cls._instance.logger.getChild(component)
@@ -1,5 +1,7 @@
 import pytz
+import numpy as np
 import pandas as pd
+from typing import Iterable
 from datetime import datetime, timezone
 
 
@@ -116,53 +118,119 @@ def unix_to_date(unix_timestamp: int, tz_info="UTC") -> datetime.date:
         return dt_utc.date()
 
 
+def unix_to_datetime(
+    timestamps: Iterable[int], tz_info: str = "UTC"
+) -> pd.DatetimeIndex:
+    """
+    Converts UNIX timestamps in nanoseconds to timezone-aware datetimes, as a whole array.
+
+    Parameters:
+    - timestamps (Iterable[int]): UNIX timestamps in nanoseconds since the epoch.
+    - tz_info (str): The timezone of the resulting datetimes. Defaults to 'UTC'.
+
+    Returns:
+    - pd.DatetimeIndex: The datetimes in the specified timezone, exact to the nanosecond.
+    """
+    return pd.to_datetime(
+        np.asarray(timestamps, dtype=np.int64), unit="ns", utc=True
+    ).tz_convert(tz_info)
+
+
+def unix_to_iso_array(
+    timestamps: Iterable[int], tz_info: str = "UTC"
+) -> np.ndarray:
+    """
+    Converts UNIX timestamps in nanoseconds to ISO 8601 strings, as a whole array.
+
+    The strings are formatted like unix_to_iso, with microseconds only when they are not zero.
+
+    Parameters:
+    - timestamps (Iterable[int]): UNIX timestamps in nanoseconds since the epoch.
+    - tz_info (str): The timezone of the resulting strings. Defaults to 'UTC'.
+
+    Returns:
+    - np.ndarray: The ISO 8601 strings.
+    """
+    utc = np.asarray(timestamps, dtype=np.int64).astype("datetime64[ns]")
+    local = unix_to_datetime(utc.astype(np.int64), tz_info)
+    local = local.tz_localize(None).to_numpy()
+
+    # Offset of each local time from UTC, in minutes
+    offsets = (local - utc) // np.timedelta64(1, "m")
+    hours, minutes = np.divmod(np.abs(offsets), 60)
+    suffix = np.char.add(
+        np.char.add(
+            np.where(offsets < 0, "-", "+"),
+            np.char.zfill(hours.astype(str), 2),
+        ),
+        np.char.add(":", np.char.zfill(minutes.astype(str), 2)),
+    )
+
+    micros = local.astype("datetime64[us]")
+    body = np.where(
+        micros == local.astype("datetime64[s]"),
+        np.datetime_as_string(micros, unit="s"),
+        np.datetime_as_string(micros, unit="us"),
+    )
+    return np.char.add(body, suffix)
+
+
+def unix_to_date_array(
+    timestamps: Iterable[int], tz_info: str = "UTC"
+) -> np.ndarray:
+    """
+    Converts UNIX timestamps in nanoseconds to calendar dates in a timezone, as a whole array.
+
+    Parameters:
+    - timestamps (Iterable[int]): UNIX timestamps in nanoseconds since the epoch.
+    - tz_info (str): The timezone of the dates. Defaults to 'UTC'.
+
+    Returns:
+    - np.ndarray: The dates as datetime64[D].
+    """
+    local = unix_to_datetime(timestamps, tz_info).tz_localize(None)
+    return local.to_numpy().astype("datetime64[D]")
+
+
 def _convert_timestamp(
     df: pd.DataFrame,
     column: str = "timestamp",
     tz_info: str = "UTC",
 ) -> None:
-    """Converts a dataframe column to iso from unix."""
-    df[column] = pd.to_datetime(
-        df[column].map(lambda x: unix_to_iso(x, tz_info))
-    )
+    """Converts a dataframe column to timezone-aware datetimes from unix."""
+    df[column] = unix_to_datetime(df[column], tz_info)
 
 
 def resample_timestamp(df: pd.DataFrame, interval: str = "D", tz_info="UTC"):
     """
     Converts a DataFrame with UNIX timestamp index to default daily resolution.
 
+    Each interval keeps the last value of each column, indexed by the UNIX timestamp of its last row. Intervals are
+    in the given timezone, e.g. days start at local midnight.
+
     Parameters:
     - df (pd.DataFrame): DataFrame with UNIX timestamp index.
-    - value_column (str): Name of the column to resample.
+    - interval (str): Pandas offset alias of the intervals.
     - tz_info (str): Timezone information for conversion.
 
     Returns:
     - pd.DataFrame: Resampled DataFrame with daily frequency.
     """
-    utc = True
-
-    if tz_info != "UTC":
-        utc = False
-
-    # Convert index to readable datetime
-    df.index = pd.to_datetime(
-        df.index.map(lambda x: unix_to_iso(x, tz_info)), utc=utc
+    timestamps = df.index.to_numpy(dtype=np.int64)
+    local = df.set_axis(unix_to_datetime(timestamps, tz_info))
+
+    # Position of the last row of each interval, to restore its timestamp
+    last_rows = (
+        pd.Series(np.arange(len(df)), index=local.index)
+        .resample(interval)
+        .last()
     )
+    filled = last_rows.notna().to_numpy()
 
-    # Store original UNIX timestamps before resampling
-    original_timestamps = df.index.to_series().resample(interval).last()
-    original_timestamps.dropna(inplace=True)
-
-    # Resample to daily frequency, using the last value of each day
-    daily_df = df.resample(interval).last()
-
-    # Optionally, fill NaN values if necessary, depending on your specific needs
-    daily_df.dropna(inplace=True)
-
-    # Restore original UNIX timestamps
-    daily_df.index = original_timestamps.map(
-        lambda x: iso_to_unix(x.isoformat())
+    # Resample using the last value of each interval
+    resampled = local.resample(interval).last()[filled]
+    resampled.index = pd.Index(
+        timestamps[last_rows[filled].to_numpy(dtype=np.int64)],
+        name="timestamp",
     )
-    daily_df.index.name = "timestamp"
-
-    return daily_df
+    return resampled.dropna()
@@ -26,11 +26,17 @@ live() {
 	python -m unittest discover tests.integration.live
 }
 
+benchmark() {
+	echo "Running benchmarks..."
+	python -m unittest discover tests.benchmark
+}
+
 options() {
 	echo "Which tests would you like to run?"
 	echo "1 - Unit"
 	echo "2 - Backtest Integration"
 	echo "3 - Live Integration"
+	echo "4 - Benchmarks"
 }
 
 # Main
@@ -52,6 +58,10 @@ while true; do
 		live
 		break
 		;;
+	4)
+		benchmark
+		break
+		;;
 	*) echo "Please choose a different one." ;;
 	esac
 done
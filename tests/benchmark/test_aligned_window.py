@@ -0,0 +1,134 @@
+import time
+import unittest
+import numpy as np
+import pandas as pd
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from mbn import OhlcvMsg
+from midas.utils.logger import SystemLogger
+from midas.engine.components.gateways.backtest.data_client import DataClient
+from tests.benchmark.test_dummy_broker import build_symbols_map
+
+LOOKBACK = 365 * 23 * 60  # One year of one minute bars
+LEGACY_ROWS = 2_000
+INSTRUMENTS = 2
+MINUTE = 60_000_000_000
+
+
+class ColumnarStore:
+    """
+    In-memory stand-in for a BufferStore whose decode_to_df returns the columns decoded in one pass.
+    """
+
+    def __init__(self, records: list, columns: dict, mappings: dict):
+        self.records = records
+        self.columns = columns
+        self.position = 0
+        self.metadata = SimpleNamespace(
+            mappings=SimpleNamespace(get_ticker=mappings.get)
+        )
+
+    def replay(self):
+        if self.position >= len(self.records):
+            return None
+        record = self.records[self.position]
+        self.position += 1
+        return record
+
+    def decode_to_df(self, pretty_ts: bool = False, pretty_px: bool = False):
+        columns = dict(self.columns)
+        if pretty_px:
+            columns["close"] = columns["close"] / 1e9
+        return pd.DataFrame(columns, copy=False)
+
+
+def legacy_primer(data_client: DataClient, rows: int) -> pd.DataFrame:
+    # Cointegrationzscore.primer before the aligned window
+    keys = range(1, INSTRUMENTS + 1)
+    current_price = pd.DataFrame(
+        [{**{f"{k}": 0 for k in keys}, **{f"{k}_log": 0 for k in keys}}]
+    )
+    last_update_time = {k: None for k in keys}
+    data = pd.DataFrame()
+    while len(data) < rows:
+        record = data_client.next_record()
+        key = record.instrument_id
+        current_price[f"{key}"] = record.close / 1e9
+        current_price[f"{key}_log"] = np.log(record.close / 1e9)
+        last_update_time[key] = record.ts_event
+        timestamps = set(last_update_time.values())
+        if len(timestamps) == 1 and None not in timestamps:
+            new_row = current_price.copy()
+            new_row["timestamp"] = record.ts_event
+            new_row.set_index("timestamp", inplace=True)
+            data = pd.concat([data, new_row], ignore_index=False)
+    return data
+
+
+class TestAlignedWindowBenchmark(unittest.TestCase):
+    def setUp(self) -> None:
+        logger = SystemLogger()
+        logger.get_logger = MagicMock()
+
+        bars = LOOKBACK + 1_000
+        timestamps = np.repeat(
+            1704205800000000000 + np.arange(bars) * MINUTE, INSTRUMENTS
+        )
+        native_ids = np.tile(np.arange(INSTRUMENTS), bars)
+        closes = (100 + (np.arange(len(timestamps)) % 50) * 0.25) * 1e9
+        closes = closes.astype(np.int64)
+        self.records = [
+            OhlcvMsg(
+                instrument_id=int(native_id),
+                ts_event=int(ts),
+                open=int(close),
+                high=int(close),
+                low=int(close),
+                close=int(close),
+                volume=100,
+            )
+            for native_id, ts, close in zip(
+                native_ids.tolist(), timestamps.tolist(), closes.tolist()
+            )
+        ]
+        self.columns = {
+            "instrument_id": native_ids,
+            "ts_event": timestamps,
+            "close": closes,
+        }
+        self.mappings = {i: f"MIDAS{i}" for i in range(INSTRUMENTS)}
+
+    def _data_client(self) -> DataClient:
+        data_client = DataClient(MagicMock(), build_symbols_map(INSTRUMENTS))
+        data_client.data = ColumnarStore(
+            self.records, self.columns, self.mappings
+        )
+        data_client._index_data()
+        return data_client
+
+    def test_primer(self):
+        data_client = self._data_client()
+        start = time.perf_counter()
+        expected = legacy_primer(data_client, LEGACY_ROWS)
+        legacy = (time.perf_counter() - start) / LEGACY_ROWS
+
+        data_client = self._data_client()
+        start = time.perf_counter()
+        window = data_client.get_aligned_window(LOOKBACK)
+        aligned = time.perf_counter() - start
+
+        np.testing.assert_allclose(
+            window.iloc[:LEGACY_ROWS].to_numpy(),
+            expected[["1", "2"]].to_numpy(),
+        )
+        self.assertEqual(data_client._cursor, LOOKBACK * INSTRUMENTS)
+        print(
+            f"\n{LOOKBACK:,} row lookback: record loop "
+            f"{legacy * 1e3:,.2f} ms/row over {LEGACY_ROWS:,} rows "
+            f"({legacy * LOOKBACK / 60:,.0f} min extrapolated, at least), "
+            f"aligned window {aligned * 1e3:,.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import time
+import unittest
+from midas.orders import Action
+from midas.cost_models import FixedCostModel
+from tests.benchmark.test_dummy_broker import build_symbols_map
+
+BASKET_SIZES = (10, 500, 3000)
+ROUNDS = 50
+
+
+class TestCostModelBenchmark(unittest.TestCase):
+    def _basket(self, size: int):
+        symbols = build_symbols_map(size).symbols
+        quantities = [(i % 7 + 1) * (1 if i % 2 else -1) for i in range(size)]
+        prices = [100 + (i % 50) * 0.25 for i in range(size)]
+        return symbols, quantities, prices
+
+    def test_basket_costs(self):
+        for size in BASKET_SIZES:
+            symbols, quantities, prices = self._basket(size)
+            model = FixedCostModel(build_symbols_map(size))
+            instrument_ids = [symbol.instrument_id for symbol in symbols]
+
+            start = time.perf_counter()
+            for _ in range(ROUNDS):
+                scalar = 0.0
+                for symbol, quantity, price in zip(
+                    symbols, quantities, prices
+                ):
+                    action = Action.LONG if quantity > 0 else Action.SELL
+                    fill_price = symbol.slippage_price(price, action)
+                    symbol.commission_fees(quantity)
+                    scalar += symbol.cost(quantity, fill_price)
+            legacy = (time.perf_counter() - start) / ROUNDS
+
+            start = time.perf_counter()
+            for _ in range(ROUNDS):
+                fill_prices, _ = model.fills(
+                    instrument_ids, quantities, prices
+                )
+                vectorized = model.cost(
+                    instrument_ids, quantities, fill_prices
+                ).sum()
+            batched = (time.perf_counter() - start) / ROUNDS
+
+            self.assertAlmostEqual(scalar, vectorized, places=4)
+            print(
+                f"\n{size} legs: per-leg calls {legacy * 1e6:,.0f} us, "
+                f"one batch {batched * 1e6:,.0f} us "
+                f"({legacy / batched:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
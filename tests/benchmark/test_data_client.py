@@ -0,0 +1,356 @@
+import time
+import resource
+import unittest
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from bisect import bisect_left
+from typing import Tuple
+from types import SimpleNamespace
+from datetime import time as dt_time
+from unittest.mock import MagicMock, patch
+from mbn import OhlcvMsg
+from midas.utils.unix import iso_to_unix
+from midas.utils.logger import SystemLogger
+from midas.engine.components.gateways.backtest.data_client import DataClient
+from midas.symbol import (
+    Equity,
+    Currency,
+    Venue,
+    Industry,
+    SecurityType,
+    SymbolMap,
+    TradingSession,
+)
+
+RECORDS = 200_000
+INSTRUMENTS = 20
+REPLAY_START = "2024-01-01"
+REPLAY_END = "2024-03-01"
+
+
+class ReplayStore:
+    """
+    In-memory stand-in for a BufferStore exposing the replay, metadata and decode interface used by the DataClient.
+    """
+
+    def __init__(self, records: list, mappings: dict):
+        self.records = records
+        self.position = 0
+        self.metadata = SimpleNamespace(
+            mappings=SimpleNamespace(get_ticker=mappings.get)
+        )
+
+    def replay(self):
+        if self.position >= len(self.records):
+            return None
+        record = self.records[self.position]
+        self.position += 1
+        return record
+
+    def decode_to_df(self, pretty_ts: bool = False, pretty_px: bool = False):
+        return pd.DataFrame(
+            {
+                "instrument_id": [r.hd.instrument_id for r in self.records],
+                "ts_event": [r.hd.ts_event for r in self.records],
+            }
+        )
+
+
+def build_symbols_map() -> SymbolMap:
+    symbols_map = SymbolMap()
+    for i in range(INSTRUMENTS):
+        symbols_map.add_symbol(
+            Equity(
+                instrument_id=i + 1,
+                broker_ticker=f"BRK{i}",
+                data_ticker=f"DATA{i}",
+                midas_ticker=f"MIDAS{i}",
+                security_type=SecurityType.STOCK,
+                currency=Currency.USD,
+                exchange=Venue.NASDAQ,
+                fees=0.1,
+                initial_margin=0,
+                quantity_multiplier=1,
+                price_multiplier=1,
+                company_name=f"Company {i}",
+                industry=Industry.TECHNOLOGY,
+                market_cap=10000000000.99,
+                shares_outstanding=1937476363,
+                slippage_factor=10,
+                trading_sessions=TradingSession(
+                    day_open=dt_time(9, 30), day_close=dt_time(16, 0)
+                ),
+            )
+        )
+    return symbols_map
+
+
+def build_store(records: int = RECORDS) -> ReplayStore:
+    start = 1704205800000000000  # 2024-01-02 14:30 UTC
+    bars = [
+        OhlcvMsg(
+            instrument_id=100 + (i % INSTRUMENTS),
+            ts_event=start + (i // INSTRUMENTS) * 60_000_000_000,
+            open=int(100 * 1e9),
+            high=int(101 * 1e9),
+            low=int(99 * 1e9),
+            close=int(100.5 * 1e9),
+            volume=100,
+        )
+        for i in range(records)
+    ]
+    mappings = {100 + i: f"MIDAS{i}" for i in range(INSTRUMENTS)}
+    return ReplayStore(bars, mappings)
+
+
+def build_window(start_date: str, end_date: str) -> ReplayStore:
+    # One-minute bars for every instrument during the day session of each day in [start, end)
+    days = pd.date_range(
+        start_date,
+        end_date,
+        freq="D",
+        inclusive="left",
+        tz="America/New_York",
+    )
+    minutes = pd.timedelta_range("09:30:00", "15:59:00", freq="min")
+    timestamps = (
+        np.add.outer(days.asi8, minutes.asi8).ravel()
+        if len(days)
+        else np.array([], dtype=np.int64)
+    )
+    bars = [
+        OhlcvMsg(
+            instrument_id=100 + i,
+            ts_event=int(ts),
+            open=int(100 * 1e9),
+            high=int(101 * 1e9),
+            low=int(99 * 1e9),
+            close=int(100.5 * 1e9),
+            volume=100,
+        )
+        for ts in timestamps
+        for i in range(INSTRUMENTS)
+    ]
+    mappings = {100 + i: f"MIDAS{i}" for i in range(INSTRUMENTS)}
+    return ReplayStore(bars, mappings)
+
+
+def replay_peak_rss(chunk_days: int) -> Tuple[int, int]:
+    """
+    Replays the synthetic range in a fresh process, returning the record count and peak RSS (KB).
+    """
+    logger = SystemLogger()
+    logger.get_logger = MagicMock()
+
+    data_client = DataClient(MagicMock(), build_symbols_map())
+    data_client.get_data = lambda tickers, start, end, schema, path=None: (
+        build_window(start, end)
+    )
+    data_client.notify = lambda *args: None
+    data_client.load_backtest_data(
+        [],
+        REPLAY_START,
+        REPLAY_END,
+        None,
+        chunk_days=chunk_days,
+    )
+
+    count = 0
+    while data_client.data_stream():
+        count += 1
+    return count, peak_rss()
+
+
+def peak_rss() -> int:
+    """
+    Peak RSS (KB) of the current process image; ru_maxrss also counts the parent at fork.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+class LatencyDatabase:
+    """
+    Stand-in database whose retrievals cost a fixed latency per request plus a transfer time per record.
+    """
+
+    def __init__(self, request_latency: float, record_latency: float):
+        self.request_latency = request_latency
+        self.record_latency = record_latency
+        self.historical = SimpleNamespace(get_records=self.get_records)
+        self.mappings = {100 + i: f"MIDAS{i}" for i in range(INSTRUMENTS)}
+
+        store = build_window(REPLAY_START, REPLAY_END)
+        self.records = {ticker: [] for ticker in self.mappings.values()}
+        for record in store.records:
+            self.records[self.mappings[record.hd.instrument_id]].append(record)
+        self.timestamps = {
+            ticker: [r.hd.ts_event for r in records]
+            for ticker, records in self.records.items()
+        }
+
+    def get_records(self, params) -> ReplayStore:
+        start = iso_to_unix(params.start)
+        end = iso_to_unix(params.end)
+
+        records = []
+        for ticker in params.tickers:
+            timestamps = self.timestamps[ticker]
+            records.extend(
+                self.records[ticker][
+                    bisect_left(timestamps, start) : bisect_left(
+                        timestamps, end
+                    )
+                ]
+            )
+        if len(params.tickers) > 1:
+            records.sort(key=lambda r: (r.hd.ts_event, r.hd.instrument_id))
+
+        time.sleep(self.request_latency + self.record_latency * len(records))
+        return ReplayStore(records, self.mappings)
+
+
+class TestDataClientBenchmark(unittest.TestCase):
+    def setUp(self) -> None:
+        logger = SystemLogger()
+        logger.get_logger = MagicMock()
+        self.symbols_map = build_symbols_map()
+
+    def _replay_per_record_lookup(self, data_client: DataClient) -> int:
+        # Id resolution as done before the remap table (ticker + symbol map lookup per record)
+        count = 0
+        while True:
+            record = data_client.data.replay()
+            if record is None:
+                return count
+            ticker = data_client.data.metadata.mappings.get_ticker(
+                record.hd.instrument_id
+            )
+            record.instrument_id = self.symbols_map.get_symbol(
+                ticker
+            ).instrument_id
+            count += 1
+
+    def _replay_id_table(self, data_client: DataClient) -> int:
+        count = 0
+        while data_client.next_record() is not None:
+            count += 1
+        return count
+
+    def test_next_record_throughput(self):
+        # Per-record lookup
+        data_client = DataClient(MagicMock(), self.symbols_map)
+        data_client.data = build_store()
+        start = time.perf_counter()
+        count = self._replay_per_record_lookup(data_client)
+        before = count / (time.perf_counter() - start)
+
+        # Remap table
+        data_client = DataClient(MagicMock(), self.symbols_map)
+        data_client.data = build_store()
+        data_client._index_data()
+        start = time.perf_counter()
+        count = self._replay_id_table(data_client)
+        after = count / (time.perf_counter() - start)
+
+        print(
+            f"\nnext_record: per-record lookup {before:,.0f} records/sec, "
+            f"id table {after:,.0f} records/sec ({after / before:.2f}x)"
+        )
+        self.assertEqual(count, RECORDS)
+
+    def test_check_eod_throughput(self):
+        # Per-record timestamp conversion
+        data_client = DataClient(MagicMock(), self.symbols_map)
+        data_client.data = build_store()
+        data_client._index_data()
+        data_client.notify = MagicMock()
+        start = time.perf_counter()
+        while (record := data_client.next_record()) is not None:
+            data_client._check_eod_record(record)
+        before = RECORDS / (time.perf_counter() - start)
+        expected = data_client.notify.call_args_list
+
+        # Boundary index
+        data_client = DataClient(MagicMock(), self.symbols_map)
+        data_client.data = build_store()
+        data_client._index_data()
+        data_client.notify = MagicMock()
+        start = time.perf_counter()
+        while (record := data_client.next_record()) is not None:
+            data_client._check_eod(record)
+        after = RECORDS / (time.perf_counter() - start)
+
+        print(
+            f"\n_check_eod: per-record {before:,.0f} records/sec, "
+            f"boundary index {after:,.0f} records/sec ({after / before:.2f}x)"
+        )
+        self.assertGreater(len(expected), 0)
+        self.assertEqual(data_client.notify.call_args_list, expected)
+
+    def test_windowed_replay_peak_rss(self):
+        results = {}
+        for chunk_days in (0, 5):
+            with ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=get_context("spawn"),
+            ) as executor:
+                results[chunk_days] = executor.submit(
+                    replay_peak_rss,
+                    chunk_days,
+                ).result()
+
+        full_count, full_rss = results[0]
+        chunk_count, chunk_rss = results[5]
+        print(
+            f"\nreplay {full_count:,} records: full load peak RSS "
+            f"{full_rss / 1024:,.0f} MB, 5 day windows peak RSS "
+            f"{chunk_rss / 1024:,.0f} MB"
+        )
+        self.assertEqual(full_count, chunk_count)
+        self.assertLess(chunk_rss, full_rss)
+
+    @patch(
+        "midas.engine.components.gateways.backtest.data_client.RetrieveParams",
+        lambda tickers, start, end, schema: SimpleNamespace(
+            tickers=tickers, start=start, end=end, schema=schema
+        ),
+    )
+    def test_sharded_fetch_wall_clock(self):
+        database_client = LatencyDatabase(0.05, 2e-6)
+        tickers = [f"MIDAS{i}" for i in range(INSTRUMENTS)]
+
+        timings = []
+        for shard_by, workers in (
+            ("", 1),
+            ("ticker_month", 1),
+            ("ticker_month", 4),
+            ("ticker_month", 16),
+        ):
+            data_client = DataClient(
+                database_client,
+                self.symbols_map,
+                None,
+                shard_by,
+                workers,
+            )
+            start = time.perf_counter()
+            data_client.get_data(tickers, REPLAY_START, REPLAY_END, None)
+            timings.append(
+                f"{shard_by or 'single'}/{workers} workers "
+                f"{time.perf_counter() - start:.2f}s"
+            )
+
+        print(f"\nget_data: {', '.join(timings)}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import time
+import unittest
+from datetime import time as dt_time
+from unittest.mock import MagicMock
+from mbn import OhlcvMsg
+from midas.utils.logger import SystemLogger
+from midas.positions import EquityPosition
+from midas.engine.components.order_book import OrderBook
+from midas.engine.components.gateways.backtest.dummy_broker import DummyBroker
+from midas.symbol import (
+    Equity,
+    Currency,
+    Venue,
+    Industry,
+    SecurityType,
+    SymbolMap,
+    TradingSession,
+)
+
+TICKS = 20_000
+PORTFOLIO_SIZES = (10, 100, 500)
+
+
+def build_symbols_map(size: int) -> SymbolMap:
+    symbols_map = SymbolMap()
+    for i in range(size):
+        symbols_map.add_symbol(
+            Equity(
+                instrument_id=i + 1,
+                broker_ticker=f"BRK{i}",
+                data_ticker=f"DATA{i}",
+                midas_ticker=f"MIDAS{i}",
+                security_type=SecurityType.STOCK,
+                currency=Currency.USD,
+                exchange=Venue.NASDAQ,
+                fees=0.1,
+                initial_margin=0,
+                quantity_multiplier=1,
+                price_multiplier=1,
+                company_name=f"Company {i}",
+                industry=Industry.TECHNOLOGY,
+                market_cap=10000000000.99,
+                shares_outstanding=1937476363,
+                slippage_factor=0,
+                trading_sessions=TradingSession(
+                    day_open=dt_time(9, 30), day_close=dt_time(16, 0)
+                ),
+            )
+        )
+    return symbols_map
+
+
+def bar(instrument_id: int, i: int) -> OhlcvMsg:
+    close = 100 + (i % 50) * 0.25
+    return OhlcvMsg(
+        instrument_id=instrument_id,
+        ts_event=1704205800000000000 + i * 60_000_000_000,
+        open=int(close * 1e9),
+        high=int(close * 1e9),
+        low=int(close * 1e9),
+        close=int(close * 1e9),
+        volume=100,
+    )
+
+
+class TestDummyBrokerBenchmark(unittest.TestCase):
+    def setUp(self) -> None:
+        # Mock Logger
+        logger = SystemLogger()
+        logger.get_logger = MagicMock()
+
+    def _build(self, size: int) -> DummyBroker:
+        symbols_map = build_symbols_map(size)
+        order_book = OrderBook(symbols_map)
+        broker = DummyBroker(symbols_map, order_book, 1_000_000)
+
+        for symbol in symbols_map.symbols:
+            order_book.update_book(bar(symbol.instrument_id, 0))
+            broker.positions[symbol.contract] = EquityPosition(
+                action="BUY",
+                avg_price=100,
+                quantity=10,
+                quantity_multiplier=1,
+                price_multiplier=1,
+                market_price=100,
+            )
+        broker._update_account()
+        return broker
+
+    def _ticks_per_sec(self, broker: DummyBroker, size: int, mark) -> float:
+        ticks = [bar(1 + i % size, i) for i in range(TICKS)]
+
+        start = time.perf_counter()
+        for record in ticks:
+            broker.order_book.update_book(record)
+            mark(record.instrument_id)
+        return TICKS / (time.perf_counter() - start)
+
+    def test_equity_update(self):
+        for size in PORTFOLIO_SIZES:
+            full_broker = self._build(size)
+            full = self._ticks_per_sec(
+                full_broker,
+                size,
+                lambda _: full_broker._update_account(),
+            )
+
+            broker = self._build(size)
+            incremental = self._ticks_per_sec(
+                broker,
+                size,
+                broker.mark_instrument,
+            )
+
+            self.assertTrue(broker._reconcile())
+            self.assertEqual(
+                broker.account.net_liquidation,
+                full_broker.account.net_liquidation,
+            )
+            print(
+                f"\n{size} positions: full re-mark {full:,.0f} ticks/sec, "
+                f"incremental {incremental:,.0f} ticks/sec "
+                f"({incremental / full:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
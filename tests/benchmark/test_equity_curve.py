@@ -0,0 +1,70 @@
+import sys
+import time
+import unittest
+import numpy as np
+import pandas as pd
+from midas.engine.components.performance.equity_curve import (
+    EquityCurveBuffer,
+)
+
+SAMPLES = 1_000_000
+MINUTE = 60_000_000_000
+
+
+def list_bytes(samples: list) -> int:
+    # The list, its dicts and their int and float values
+    return sys.getsizeof(samples) + sum(
+        sys.getsizeof(sample)
+        + sys.getsizeof(sample["timestamp"])
+        + sys.getsizeof(sample["equity_value"])
+        for sample in samples
+    )
+
+
+class TestEquityCurveBenchmark(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(3)
+        self.timestamps = (
+            1704205800000000000 + np.arange(SAMPLES) * MINUTE
+        ).tolist()
+        self.values = np.round(
+            1_000_000 * np.cumprod(1 + rng.normal(0, 0.0005, SAMPLES)), 2
+        ).tolist()
+
+    def test_curve(self):
+        start = time.perf_counter()
+        samples = []
+        for timestamp, value in zip(self.timestamps, self.values):
+            samples.append({"timestamp": timestamp, "equity_value": value})
+        list_append = time.perf_counter() - start
+
+        start = time.perf_counter()
+        df = pd.DataFrame(samples).set_index("timestamp")
+        df.groupby("timestamp").last()
+        list_frame = time.perf_counter() - start
+
+        start = time.perf_counter()
+        buffer = EquityCurveBuffer()
+        for timestamp, value in zip(self.timestamps, self.values):
+            buffer.append(timestamp, value)
+        buffer_append = time.perf_counter() - start
+
+        start = time.perf_counter()
+        timestamps, values = buffer.last_per_timestamp()
+        pd.DataFrame({"timestamp": timestamps, "equity_value": values})
+        buffer_frame = time.perf_counter() - start
+
+        self.assertEqual(values.tolist(), self.values)
+        print(
+            f"\n{SAMPLES:,} samples: list of dicts "
+            f"{list_bytes(samples) / 2**20:,.0f} MiB, "
+            f"append {list_append * 1e3:,.0f} ms, "
+            f"to DataFrame {list_frame * 1e3:,.0f} ms; "
+            f"buffer {buffer.nbytes / 2**20:,.0f} MiB, "
+            f"append {buffer_append * 1e3:,.0f} ms, "
+            f"to DataFrame {buffer_frame * 1e3:,.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import time
+import logging
+import tracemalloc
+import unittest
+from unittest.mock import MagicMock
+from midas.utils.logger import SystemLogger
+from midas.positions import EquityPosition
+from midas.engine.events import MarketEvent
+from midas.engine.components.order_book import OrderBook
+from midas.engine.components.performance.managers import EquityManager
+from midas.engine.components.gateways.backtest.dummy_broker import DummyBroker
+from midas.engine.components.gateways.backtest.broker_client import (
+    BrokerClient,
+)
+from tests.benchmark.test_dummy_broker import bar, build_symbols_map
+
+INSTRUMENTS = 20
+RECORDS = 10_000
+POLICIES = (("record", 0), ("bar", 0), ("interval", 3600), ("trades", 0))
+
+
+def legacy_update_equity(manager: EquityManager, equity_details) -> None:
+    # EquityManager.update_equity with a scan of every sample
+    if equity_details not in manager.equity_value:
+        manager.equity_value.append(equity_details)
+        manager.logger.info(
+            f"\nEQUITY UPDATED: \n  {manager.equity_value[-1]}\n"
+        )
+
+
+class TestEquitySamplingBenchmark(unittest.TestCase):
+    def setUp(self) -> None:
+        # Mock Logger
+        logger = SystemLogger()
+        logger.get_logger = MagicMock()
+
+        # One record per instrument per minute
+        self.records = [
+            bar(1 + i % INSTRUMENTS, i // INSTRUMENTS) for i in range(RECORDS)
+        ]
+
+    def _replay(self, policy: str, interval: int, legacy: bool = False):
+        symbols_map = build_symbols_map(INSTRUMENTS)
+        order_book = OrderBook(symbols_map)
+        broker = DummyBroker(symbols_map, order_book, 1_000_000)
+        for i, symbol in enumerate(symbols_map.symbols):
+            order_book.update_book(self.records[i])
+            broker.positions[symbol.contract] = EquityPosition(
+                action="BUY",
+                avg_price=100,
+                quantity=10 + i,
+                quantity_multiplier=1,
+                price_multiplier=1,
+                market_price=100,
+            )
+        broker._update_account()
+
+        manager = EquityManager(logging.getLogger("benchmark"))
+        update = manager.update_equity
+        if legacy:
+            update = lambda equity: legacy_update_equity(manager, equity)
+        broker_client = BrokerClient(broker, symbols_map, policy, interval)
+        broker_client.notify = lambda event_type, equity: update(equity)
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        for record in self.records:
+            order_book.update_book(record)
+            broker_client.handle_order_book(
+                MarketEvent(record.ts_event, record)
+            )
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return elapsed, peak, len(manager.equity_value)
+
+    def test_sampling_policies(self):
+        elapsed, peak, samples = self._replay("record", 0, legacy=True)
+        print(
+            f"\n{RECORDS:,} records, scan dedup: {elapsed * 1e3:,.0f} ms, "
+            f"peak {peak / 1024:,.0f} KiB, {samples:,} samples"
+        )
+
+        for policy, interval in POLICIES:
+            elapsed, peak, samples = self._replay(policy, interval)
+            print(
+                f"{RECORDS:,} records, '{policy}': {elapsed * 1e3:,.0f} ms, "
+                f"peak {peak / 1024:,.0f} KiB, {samples:,} samples"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import time
+import unittest
+import numpy as np
+import pandas as pd
+from unittest.mock import Mock
+from quantAnalytics.backtest.metrics import Metrics
+from midas.utils.unix import resample_timestamp
+from midas.engine.components.performance.managers import EquityManager
+from midas.engine.components.performance.statistics import EquityStatistics
+
+SAMPLES = 100_000
+MINUTE = 60_000_000_000
+
+
+def legacy_statistics(manager: EquityManager) -> float:
+    # Equity statistics of EquityManager.calculate_equity_statistics
+    df = pd.DataFrame(manager.equity_value)
+    df.set_index("timestamp", inplace=True)
+    # Last equity value per timestamp
+    df = df.groupby("timestamp").last()
+    daily = resample_timestamp(df.copy(), interval="D", tz_info="EST")
+    period = manager._calculate_return_and_drawdown(df.copy())
+    daily = manager._calculate_return_and_drawdown(daily.copy())
+    daily_returns = daily["period_return"].to_numpy()
+    Metrics.max_drawdown(period["period_return"].to_numpy())
+    Metrics.standard_deviation(daily_returns)
+    Metrics.sortino_ratio(daily_returns, 0.04)
+    return Metrics.sharpe_ratio(daily_returns, 0.04)
+
+
+class TestEquityStatisticsBenchmark(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(11)
+        equity = 1_000_000 * np.cumprod(1 + rng.normal(0, 0.0005, SAMPLES))
+        self.samples = [
+            {
+                "timestamp": 1704205800000000000 + i * MINUTE,
+                "equity_value": round(float(value), 2),
+            }
+            for i, value in enumerate(equity)
+        ]
+
+    def test_end_of_run(self):
+        manager = EquityManager(Mock())
+        manager.equity_value = self.samples
+
+        start = time.perf_counter()
+        expected = legacy_statistics(manager)
+        legacy = time.perf_counter() - start
+
+        statistics = EquityStatistics(0.04)
+        start = time.perf_counter()
+        for sample in self.samples:
+            statistics.update(sample["timestamp"], sample["equity_value"])
+        streaming = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = statistics.summary()
+        summary = time.perf_counter() - start
+
+        self.assertAlmostEqual(result["sharpe_ratio"], expected, places=6)
+        print(
+            f"\n{SAMPLES:,} samples: DataFrame and Metrics at end of run "
+            f"{legacy * 1e3:,.0f} ms, streaming updates "
+            f"{streaming / SAMPLES * 1e9:,.0f} ns/sample, "
+            f"summary {summary * 1e6:,.0f} us"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
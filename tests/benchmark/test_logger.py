@@ -0,0 +1,87 @@
+import time
+import logging
+import tempfile
+import unittest
+from mbn import OhlcvMsg
+from midas.utils.logger import SystemLogger
+from midas.engine.components.order_book import OrderBook
+from midas.engine.components.observer.base import Subject, EventType
+from tests.benchmark.test_data_client import INSTRUMENTS, build_symbols_map
+from tests.benchmark.test_observer import TypedCountingStrategy
+
+RECORDS = 100_000
+
+
+class TestLoggerBenchmark(unittest.TestCase):
+    def setUp(self) -> None:
+        self.previous = SystemLogger._instance
+        self.output_dir = tempfile.TemporaryDirectory()
+        self.records = [
+            OhlcvMsg(
+                instrument_id=1 + i % INSTRUMENTS,
+                ts_event=1704205800000000000 + i * 60_000_000_000,
+                open=int(100 * 1e9),
+                high=int(101 * 1e9),
+                low=int(99 * 1e9),
+                close=int(100.5 * 1e9),
+                volume=100,
+            )
+            for i in range(RECORDS)
+        ]
+
+    def tearDown(self) -> None:
+        SystemLogger._instance = self.previous
+        self.output_dir.cleanup()
+
+    def _run(self, name: str, level: int, **kwargs) -> float:
+        # Replay through MARKET_DATA -> ORDER_BOOK -> strategy
+        SystemLogger._instance = None
+        system_logger = SystemLogger(
+            name,
+            "file",
+            self.output_dir.name,
+            level,
+            **kwargs,
+        )
+        system_logger.logger.propagate = False
+
+        data_client = Subject()
+        order_book = OrderBook(build_symbols_map())
+        strategy = TypedCountingStrategy()
+        data_client.attach(order_book, EventType.MARKET_DATA)
+        order_book.attach(strategy, EventType.ORDER_BOOK)
+
+        start = time.perf_counter()
+        for record in self.records:
+            data_client.notify(EventType.MARKET_DATA, record)
+        elapsed = time.perf_counter() - start
+        system_logger.stop()
+
+        for handler in list(system_logger.logger.handlers):
+            system_logger.logger.removeHandler(handler)
+            handler.close()
+
+        self.assertEqual(strategy.count, RECORDS)
+        return RECORDS / elapsed
+
+    def test_replay_throughput(self):
+        off = self._run("bench_off", logging.WARNING)
+        sync = self._run("bench_sync", logging.INFO)
+        queued = self._run("bench_async", logging.INFO, async_mode=True)
+        sampled = self._run(
+            "bench_sampled",
+            logging.INFO,
+            async_mode=True,
+            sample_rates={"order_book": 1000},
+        )
+
+        print(
+            f"\nreplay: logging off {off:,.0f} records/sec, "
+            f"INFO sync {sync:,.0f} ({sync / off:.2f}x), "
+            f"INFO async {queued:,.0f} ({queued / off:.2f}x), "
+            f"INFO async sampled {sampled:,.0f} ({sampled / off:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import time
+import random
+import unittest
+from mbn import OhlcvMsg
+from midas.orders import Action, LimitOrder, StopLoss
+from midas.engine.components.gateways.backtest.matching_engine import (
+    MatchingEngine,
+)
+from tests.benchmark.test_dummy_broker import build_symbols_map
+
+INSTRUMENTS = 200
+ORDERS = 10_000
+RECORDS = 5_000
+
+
+def linear_match(resting: list, record: OhlcvMsg) -> list:
+    # Scan every resting order against the record, as a flat list would
+    crossed = []
+    kept = []
+    for order in resting:
+        if order.symbol.instrument_id != record.instrument_id:
+            kept.append(order)
+            continue
+        buy = order.order.order.action == "BUY"
+        if order.is_limit:
+            hit = (
+                order.price >= record.low
+                if buy
+                else order.price <= record.high
+            )
+        else:
+            hit = (
+                order.price <= record.high
+                if buy
+                else order.price >= record.low
+            )
+        (crossed if hit else kept).append(order)
+    resting[:] = kept
+    return crossed
+
+
+class TestMatchingEngineBenchmark(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = random.Random(7)
+        symbols = build_symbols_map(INSTRUMENTS).symbols
+        self.engine = MatchingEngine()
+
+        # Resting orders placed far from the market, a few cross per bar
+        for i in range(ORDERS):
+            symbol = symbols[i % INSTRUMENTS]
+            offset = rng.uniform(1, 50)
+            if i % 4 == 0:
+                action = Action.LONG
+                order = LimitOrder(action, 10, 100 - offset)
+            elif i % 4 == 1:
+                action = Action.SELL
+                order = LimitOrder(action, 10, 100 + offset)
+            elif i % 4 == 2:
+                action = Action.COVER
+                order = StopLoss(action, 10, 100 + offset)
+            else:
+                action = Action.SELL
+                order = StopLoss(action, 10, 100 - offset)
+            self.engine.add(0, i, 1, action, symbol, order)
+
+        self.records = []
+        for i in range(RECORDS):
+            width = rng.uniform(0, 2)
+            self.records.append(
+                OhlcvMsg(
+                    instrument_id=1 + i % INSTRUMENTS,
+                    ts_event=i,
+                    open=int(100 * 1e9),
+                    high=int((100 + width) * 1e9),
+                    low=int((100 - width) * 1e9),
+                    close=int(100 * 1e9),
+                    volume=100,
+                )
+            )
+
+    def test_match(self):
+        resting = list(self.engine.orders.values())
+
+        start = time.perf_counter()
+        linear_crossed = sum(
+            len(linear_match(resting, record)) for record in self.records
+        )
+        linear = RECORDS / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        heap_crossed = sum(
+            len(self.engine.match(record)) for record in self.records
+        )
+        heap = RECORDS / (time.perf_counter() - start)
+
+        self.assertEqual(heap_crossed, linear_crossed)
+        print(
+            f"\n{ORDERS:,} resting orders over {INSTRUMENTS} instruments: "
+            f"linear scan {linear:,.0f} records/sec, "
+            f"heaps {heap:,.0f} records/sec ({heap / linear:.0f}x), "
+            f"{heap_crossed} fills"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import time
+import logging
+import unittest
+from unittest.mock import MagicMock, patch
+from mbn import OhlcvMsg
+from midas.utils.logger import SystemLogger
+from midas.engine.components.order_book import OrderBook
+from midas.engine.components.observer.base import Subject, Observer, EventType
+from midas.engine.components.observer.profiler import EventBusProfiler
+from tests.benchmark.test_data_client import INSTRUMENTS, build_symbols_map
+
+NOTIFICATIONS = 200_000
+
+
+def legacy_notify(self, event_type: EventType, *args, **kwargs):
+    # Subject.notify before compiled dispatch
+    if event_type in self._observers:
+        for observer in self._observers[event_type]:
+            observer.handle_event(self, event_type, *args, **kwargs)
+
+
+class CountingStrategy(Observer):
+    """
+    Strategy stand-in counting ORDER_BOOK events through handle_event.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def handle_event(self, subject, event_type: EventType, event):
+        if event_type == EventType.ORDER_BOOK:
+            self.count += 1
+
+
+class TypedCountingStrategy(CountingStrategy):
+    """
+    Strategy stand-in counting ORDER_BOOK events through a typed handler.
+    """
+
+    def event_handlers(self):
+        return {EventType.ORDER_BOOK: self.handle_order_book}
+
+    def handle_order_book(self, event):
+        self.count += 1
+
+
+class TestObserverBenchmark(unittest.TestCase):
+    def setUp(self) -> None:
+        # Mock Logger
+        logger = SystemLogger()
+        logger.get_logger = MagicMock()
+
+        self.records = [
+            OhlcvMsg(
+                instrument_id=1 + i % INSTRUMENTS,
+                ts_event=1704205800000000000 + i * 60_000_000_000,
+                open=int(100 * 1e9),
+                high=int(101 * 1e9),
+                low=int(99 * 1e9),
+                close=int(100.5 * 1e9),
+                volume=100,
+            )
+            for i in range(NOTIFICATIONS)
+        ]
+
+    def _run(
+        self,
+        strategy: CountingStrategy,
+        profiler: EventBusProfiler = None,
+    ) -> float:
+        # MARKET_DATA -> ORDER_BOOK -> strategy
+        data_client = Subject()
+        order_book = OrderBook(build_symbols_map())
+        data_client.profiler = profiler
+        order_book.profiler = profiler
+        order_book.logger = logging.getLogger("benchmark")
+        order_book.logger.setLevel(logging.WARNING)
+        data_client.attach(order_book, EventType.MARKET_DATA)
+        order_book.attach(strategy, EventType.ORDER_BOOK)
+
+        start = time.perf_counter()
+        for record in self.records:
+            data_client.notify(EventType.MARKET_DATA, record)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(strategy.count, NOTIFICATIONS)
+        return NOTIFICATIONS / elapsed
+
+    def test_notify_throughput(self):
+        with patch.object(Subject, "notify", legacy_notify):
+            legacy = self._run(CountingStrategy())
+        fallback = self._run(CountingStrategy())
+        typed = self._run(TypedCountingStrategy())
+
+        print(
+            f"\nnotify: legacy {legacy:,.0f} events/sec, "
+            f"compiled handle_event {fallback:,.0f} events/sec "
+            f"({fallback / legacy:.2f}x), "
+            f"typed handlers {typed:,.0f} events/sec "
+            f"({typed / legacy:.2f}x)"
+        )
+
+    def test_profiled_notify_throughput(self):
+        plain = self._run(TypedCountingStrategy())
+        profiler = EventBusProfiler()
+        profiled = self._run(TypedCountingStrategy(), profiler)
+        summary = profiler.summary()
+
+        print(
+            f"\nnotify: profiling off {plain:,.0f} events/sec, "
+            f"profiling on {profiled:,.0f} events/sec "
+            f"({profiled / plain:.2f}x)\n{summary}"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import time
+import logging
+import unittest
+import tracemalloc
+from unittest.mock import MagicMock, patch
+from mbn import OhlcvMsg
+from midas.utils.logger import SystemLogger
+from midas.engine.events import MarketEvent
+from midas.engine.components.order_book import OrderBook
+from midas.engine.components.observer.base import Subject, EventType
+from tests.benchmark.test_data_client import INSTRUMENTS, build_symbols_map
+from tests.benchmark.test_observer import TypedCountingStrategy
+
+RECORDS = 200_000
+TRACED_RECORDS = 20_000
+
+
+def legacy_handle_market_data(self, record):
+    # OrderBook.handle_market_data before the reused event view
+    self.update_book(record)
+    market_event = MarketEvent(timestamp=record.ts_event, data=record)
+    self.logger.info(market_event)
+    if not self.tickers_loaded:
+        self.tickers_loaded = set(self.symbol_map.instrument_ids) == set(
+            self.book.keys()
+        )
+    self.notify(EventType.ORDER_BOOK, market_event)
+
+
+class TestOrderBookBenchmark(unittest.TestCase):
+    def setUp(self) -> None:
+        # Mock Logger
+        logger = SystemLogger()
+        logger.get_logger = MagicMock()
+
+        # One instrument never trades, books stay not ready
+        self.records = [
+            OhlcvMsg(
+                instrument_id=1 + i % (INSTRUMENTS - 1),
+                ts_event=1704205800000000000 + i * 60_000_000_000,
+                open=int(100 * 1e9),
+                high=int(101 * 1e9),
+                low=int(99 * 1e9),
+                close=int(100.5 * 1e9),
+                volume=100,
+            )
+            for i in range(RECORDS)
+        ]
+
+    def _build(self):
+        data_client = Subject()
+        order_book = OrderBook(build_symbols_map())
+        order_book.logger = logging.getLogger("benchmark")
+        order_book.logger.setLevel(logging.WARNING)
+        strategy = TypedCountingStrategy()
+        data_client.attach(order_book, EventType.MARKET_DATA)
+        order_book.attach(strategy, EventType.ORDER_BOOK)
+        return data_client, strategy
+
+    def _throughput(self) -> float:
+        data_client, strategy = self._build()
+
+        start = time.perf_counter()
+        for record in self.records:
+            data_client.notify(EventType.MARKET_DATA, record)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(strategy.count, RECORDS)
+        return RECORDS / elapsed
+
+    def _allocated_per_record(self) -> float:
+        # Peak bytes allocated while a record is in flight
+        data_client, _ = self._build()
+        records = self.records[:TRACED_RECORDS]
+        data_client.notify(EventType.MARKET_DATA, records[0])
+
+        total = 0
+        tracemalloc.start()
+        try:
+            for record in records:
+                tracemalloc.reset_peak()
+                current, _ = tracemalloc.get_traced_memory()
+                data_client.notify(EventType.MARKET_DATA, record)
+                total += tracemalloc.get_traced_memory()[1] - current
+        finally:
+            tracemalloc.stop()
+        return total / len(records)
+
+    def test_market_data_path(self):
+        with patch.object(
+            OrderBook, "handle_market_data", legacy_handle_market_data
+        ):
+            legacy = self._throughput()
+            legacy_bytes = self._allocated_per_record()
+        lean = self._throughput()
+        lean_bytes = self._allocated_per_record()
+
+        print(
+            f"\norder book: legacy {legacy:,.0f} records/sec, "
+            f"{legacy_bytes:,.0f} B allocated/record; "
+            f"view {lean:,.0f} records/sec ({lean / legacy:.2f}x), "
+            f"{lean_bytes:,.0f} B allocated/record"
+        )
+        self.assertLess(lean_bytes, legacy_bytes)
+
+
+if __name__ == "__main__":
+    unittest.main()
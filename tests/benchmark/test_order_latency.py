@@ -0,0 +1,76 @@
+import time
+import unittest
+from unittest.mock import MagicMock
+from midas.orders import Action, MarketOrder
+from midas.utils.logger import SystemLogger
+from midas.engine.events import MarketEvent
+from midas.engine.components.order_book import OrderBook
+from midas.engine.components.gateways.backtest.dummy_broker import DummyBroker
+from midas.engine.components.gateways.backtest.broker_client import (
+    BrokerClient,
+)
+from tests.benchmark.test_dummy_broker import bar, build_symbols_map
+
+INSTRUMENTS = 20
+RECORDS = 100_000
+ORDER_EVERY = 20
+ROUNDS = 3
+
+
+class TestOrderLatencyBenchmark(unittest.TestCase):
+    def setUp(self) -> None:
+        # Mock Logger
+        logger = SystemLogger()
+        logger.get_logger = MagicMock()
+
+        self.records = [bar(1 + i % INSTRUMENTS, i) for i in range(RECORDS)]
+
+    def _replay(self, order_latency) -> float:
+        symbols_map = build_symbols_map(INSTRUMENTS)
+        contracts = [symbol.contract for symbol in symbols_map.symbols]
+        order_book = OrderBook(symbols_map)
+        broker = DummyBroker(
+            symbols_map, order_book, 1_000_000, order_latency=order_latency
+        )
+        broker_client = BrokerClient(broker, symbols_map)
+        for record in self.records[:INSTRUMENTS]:
+            order_book.update_book(record)
+
+        start = time.perf_counter()
+        for i, record in enumerate(self.records):
+            order_book.update_book(record)
+            broker_client.handle_order_book(
+                MarketEvent(record.ts_event, record)
+            )
+            if i % ORDER_EVERY == 0:
+                action = Action.LONG if i % 40 == 0 else Action.SELL
+                broker.placeOrder(
+                    record.ts_event,
+                    i,
+                    1,
+                    action,
+                    contracts[i % INSTRUMENTS],
+                    MarketOrder(action, 10),
+                )
+        elapsed = time.perf_counter() - start
+
+        broker.release_orders(self.records[-1].ts_event + 10**12)
+        self.assertEqual(broker.pending_orders, [])
+        return RECORDS / elapsed
+
+    def test_replay_throughput(self):
+        immediate = max(self._replay(None) for _ in range(ROUNDS))
+        queued = max(
+            self._replay({"default": 150_000_000}) for _ in range(ROUNDS)
+        )
+
+        print(
+            f"\nreplay with an order every {ORDER_EVERY} records: "
+            f"immediate fills {immediate:,.0f} records/sec, "
+            f"150ms latency queue {queued:,.0f} records/sec "
+            f"({(1 - queued / immediate) * 100:+.1f}% cost)"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import time
+import unittest
+from unittest.mock import MagicMock
+from midas.utils.logger import SystemLogger
+from midas.positions import EquityPosition
+from midas.engine.components.order_book import OrderBook
+from midas.engine.components.gateways.backtest.dummy_broker import DummyBroker
+from tests.benchmark.test_dummy_broker import bar, build_symbols_map
+
+MARKS = 200
+PORTFOLIO_SIZES = (500, 3000)
+
+
+def legacy_update_account(broker: DummyBroker, positions: dict) -> float:
+    # DummyBroker._update_account over a dict of Position objects
+    unrealized_pnl = {}
+    margin_required = {}
+    liquidation_value = {}
+    for contract, position in positions.items():
+        symbol = broker.symbols_map.get_symbol(contract.symbol)
+        mkt_data = broker.order_book.retrieve(symbol.instrument_id)
+        position.market_price = mkt_data.pretty_price
+        impact = position.position_impact()
+        unrealized_pnl[contract] = impact.unrealized_pnl
+        margin_required[contract] = impact.margin_required
+        liquidation_value[contract] = impact.liquidation_value
+    sum(unrealized_pnl.values())
+    sum(margin_required.values())
+    return sum(liquidation_value.values())
+
+
+class TestPositionBookBenchmark(unittest.TestCase):
+    def setUp(self) -> None:
+        # Mock Logger
+        logger = SystemLogger()
+        logger.get_logger = MagicMock()
+
+    def _build(self, size: int):
+        symbols_map = build_symbols_map(size)
+        order_book = OrderBook(symbols_map)
+        broker = DummyBroker(symbols_map, order_book, 1_000_000)
+
+        positions = {}
+        for i, symbol in enumerate(symbols_map.symbols):
+            order_book.update_book(bar(symbol.instrument_id, i))
+            positions[symbol.contract] = EquityPosition(
+                action="BUY",
+                avg_price=100,
+                quantity=10,
+                quantity_multiplier=1,
+                price_multiplier=1,
+                market_price=100,
+            )
+            broker.positions[symbol.contract] = positions[symbol.contract]
+        return broker, positions
+
+    def test_mark_to_market(self):
+        for size in PORTFOLIO_SIZES:
+            broker, positions = self._build(size)
+
+            start = time.perf_counter()
+            for _ in range(MARKS):
+                legacy_value = legacy_update_account(broker, positions)
+            legacy = (time.perf_counter() - start) / MARKS
+
+            start = time.perf_counter()
+            for _ in range(MARKS):
+                broker._update_account()
+            columnar = (time.perf_counter() - start) / MARKS
+
+            self.assertAlmostEqual(
+                broker._liquidation_value_total, legacy_value, places=4
+            )
+            print(
+                f"\n{size} positions: Position objects "
+                f"{legacy * 1e6:,.0f} us/mark, "
+                f"position book {columnar * 1e6:,.0f} us/mark "
+                f"({legacy / columnar:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
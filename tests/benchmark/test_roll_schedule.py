@@ -0,0 +1,112 @@
+import time
+import unittest
+import numpy as np
+import pandas as pd
+import pandas_market_calendars as mcal
+from datetime import time as dt_time, timedelta
+from midas.utils.unix import unix_to_date
+from midas.symbol import (
+    Future,
+    TradingSession,
+    SecurityType,
+    Currency,
+    Venue,
+    Industry,
+    ContractUnits,
+    FuturesMonth,
+)
+
+MINUTE = 60_000_000_000
+LEGACY_SAMPLE = 200
+
+
+def legacy_in_rolling_window(future: Future, ts: int, window: int = 2):
+    # Future.in_rolling_window before the valid days and expiration caches
+    event_date = unix_to_date(ts, "UTC")
+    month = event_date.month
+    if month not in [m.value for m in future.expr_months]:
+        return False
+    calendar = mcal.get_calendar(future.market_calendar)
+    start = pd.Timestamp(event_date.year, month, 1)
+    trading_days = calendar.valid_days(
+        start_date=start, end_date=start + pd.offsets.MonthEnd(0)
+    )
+    termination_date = trading_days[9].date()
+    return (
+        termination_date - timedelta(days=window)
+        <= event_date
+        <= termination_date + timedelta(days=window)
+    )
+
+
+def build_future() -> Future:
+    return Future(
+        instrument_id=1,
+        broker_ticker="HEJ4",
+        data_ticker="HE",
+        midas_ticker="HE.n.0",
+        security_type=SecurityType.FUTURE,
+        currency=Currency.USD,
+        exchange=Venue.CME,
+        fees=0.85,
+        initial_margin=5627.17,
+        quantity_multiplier=40000,
+        price_multiplier=0.01,
+        product_code="HE",
+        product_name="Lean Hogs",
+        industry=Industry.AGRICULTURE,
+        contract_size=40000,
+        contract_units=ContractUnits.POUNDS,
+        tick_size=0.00025,
+        min_price_fluctuation=10,
+        continuous=True,
+        lastTradeDateOrContractMonth="202412",
+        slippage_factor=0,
+        trading_sessions=TradingSession(
+            day_open=dt_time(9, 30), day_close=dt_time(14, 5)
+        ),
+        expr_months=[FuturesMonth(m) for m in (2, 4, 5, 6, 7, 8, 10, 12)],
+        term_day_rule="nth_business_day_10",
+        market_calendar="CMEGlobex_Lean_Hog",
+    )
+
+
+class TestRollScheduleBenchmark(unittest.TestCase):
+    def setUp(self) -> None:
+        # Ten years of one minute bars
+        self.timestamps = np.arange(
+            1420070400000000000,  # 2015-01-01 00:00:00 UTC
+            1735689600000000000,  # 2025-01-01 00:00:00 UTC
+            MINUTE,
+        )
+
+    def test_in_rolling_window(self):
+        future = build_future()
+        sample = self.timestamps[:: len(self.timestamps) // LEGACY_SAMPLE]
+
+        start = time.perf_counter()
+        expected = [legacy_in_rolling_window(future, ts) for ts in sample]
+        legacy = (time.perf_counter() - start) / len(sample)
+
+        start = time.perf_counter()
+        future.in_rolling_window_array(self.timestamps)
+        first = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = future.in_rolling_window_array(self.timestamps)
+        cached = time.perf_counter() - start
+
+        self.assertEqual(
+            result[:: len(self.timestamps) // LEGACY_SAMPLE].tolist(),
+            expected,
+        )
+        print(
+            f"\n{len(self.timestamps):,} timestamps: per call "
+            f"{legacy * 1e6:,.0f} us ({legacy * len(self.timestamps):,.0f} s "
+            f"extrapolated), array {first * 1e3:,.0f} ms building the "
+            f"schedule, {cached * 1e3:,.0f} ms cached"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import time
+import logging
+import threading
+import unittest
+from functools import partial
+from unittest.mock import MagicMock
+from mbn import OhlcvMsg
+from midas.utils.logger import SystemLogger
+from midas.engine.components.order_book import OrderBook
+from midas.engine.components.observer.base import Subject, EventType
+from midas.engine.components.gateways.live.runtime import LiveRuntime
+from tests.benchmark.test_data_client import INSTRUMENTS, build_symbols_map
+from tests.benchmark.test_observer import TypedCountingStrategy
+
+IDLE_SECONDS = 1.0
+CALLBACKS = 5_000
+
+
+class TestLiveRuntimeBenchmark(unittest.TestCase):
+    def setUp(self) -> None:
+        # Mock Logger
+        logger = SystemLogger()
+        logger.get_logger = MagicMock()
+
+    def test_idle_cpu(self):
+        # Busy-wait loop
+        running = True
+
+        def stop():
+            nonlocal running
+            running = False
+
+        threading.Timer(IDLE_SECONDS, stop).start()
+        start = time.process_time()
+        while running:
+            continue
+        busy = time.process_time() - start
+
+        # Runtime
+        runtime = LiveRuntime()
+        runtime.loop.call_later(IDLE_SECONDS, runtime.stop)
+        start = time.process_time()
+        runtime.run()
+        idle = time.process_time() - start
+
+        print(
+            f"\nidle CPU over {IDLE_SECONDS:.0f}s: busy-wait {busy:.3f}s, "
+            f"runtime {idle:.3f}s"
+        )
+        self.assertLess(idle, busy)
+
+    def test_callback_to_strategy_latency(self):
+        # IB client thread -> runtime loop -> OrderBook -> strategy
+        runtime = LiveRuntime()
+        source = Subject()
+        order_book = OrderBook(build_symbols_map())
+        order_book.logger = logging.getLogger("benchmark")
+        order_book.logger.setLevel(logging.WARNING)
+        strategy = TypedCountingStrategy()
+        source.attach(order_book, EventType.MARKET_DATA)
+        order_book.attach(strategy, EventType.ORDER_BOOK)
+        records = self._records()
+
+        def client_thread():
+            for record in records:
+                runtime.call_soon(
+                    partial(source.notify, EventType.MARKET_DATA, record)
+                )
+                time.sleep(0.0001)
+            runtime.stop()
+
+        thread = threading.Thread(target=client_thread)
+        runtime.loop.call_soon(thread.start)
+        runtime.run()
+        thread.join()
+
+        print(f"\n{runtime.latency_summary()}")
+        self.assertEqual(strategy.count, CALLBACKS)
+
+    def _records(self) -> list:
+        return [
+            OhlcvMsg(
+                instrument_id=1 + i % INSTRUMENTS,
+                ts_event=1704205800000000000 + i * 60_000_000_000,
+                open=int(100 * 1e9),
+                high=int(101 * 1e9),
+                low=int(99 * 1e9),
+                close=int(100.5 * 1e9),
+                volume=100,
+            )
+            for i in range(CALLBACKS)
+        ]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import time
+import unittest
+import numpy as np
+from datetime import datetime, time as dt_time
+from midas.utils.unix import unix_to_iso
+from midas.symbol import SessionTable, TradingSession
+
+TIMESTAMPS = 10_000_000
+LEGACY_SAMPLE = 100_000
+SECOND = 1_000_000_000
+
+
+def legacy_after_day_session(session: TradingSession, ts: int) -> bool:
+    # Symbol.after_day_session before the session table
+    dt = datetime.fromisoformat(unix_to_iso(ts, tz_info="America/New_York"))
+    return session.day_close < dt.time()
+
+
+class TestSessionTableBenchmark(unittest.TestCase):
+    def setUp(self) -> None:
+        self.session = TradingSession(
+            day_open=dt_time(9, 30), day_close=dt_time(14, 5)
+        )
+        # Sorted over two years, as replayed
+        rng = np.random.default_rng(13)
+        self.timestamps = 1704067200000000000 + np.sort(
+            rng.integers(0, 2 * 365 * 86_400, TIMESTAMPS) * SECOND
+        )
+
+    def test_after_day_session(self):
+        sample = self.timestamps[:: TIMESTAMPS // LEGACY_SAMPLE].tolist()
+        start = time.perf_counter()
+        expected = [
+            legacy_after_day_session(self.session, ts) for ts in sample
+        ]
+        legacy = (time.perf_counter() - start) / len(sample)
+
+        table = SessionTable(self.session)
+        timestamps = self.timestamps.tolist()
+        start = time.perf_counter()
+        after_close = table.after_close
+        scalar_result = [after_close(ts) for ts in timestamps]
+        scalar = (time.perf_counter() - start) / TIMESTAMPS
+
+        table = SessionTable(self.session, "CMEGlobex_Lean_Hog")
+        start = time.perf_counter()
+        table.after_close_array(self.timestamps)
+        array = time.perf_counter() - start
+
+        self.assertEqual(
+            scalar_result[:: TIMESTAMPS // LEGACY_SAMPLE], expected
+        )
+        print(
+            f"\n{TIMESTAMPS:,} timestamps: ISO parsing "
+            f"{legacy * 1e9:,.0f} ns/call ({legacy * TIMESTAMPS:,.0f} s "
+            f"extrapolated), session table {scalar * 1e9:,.0f} ns/call "
+            f"({scalar * TIMESTAMPS:,.1f} s), array with calendar "
+            f"{array * 1e3:,.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import time
+import unittest
+from tests.benchmark.test_dummy_broker import build_symbols_map
+
+SIZES = (10, 100, 1000)
+LOOKUPS = 200_000
+
+
+class TestSymbolMapBenchmark(unittest.TestCase):
+    def test_lookups(self):
+        for size in SIZES:
+            symbols_map = build_symbols_map(size)
+            tickers = [f"BRK{i % size}" for i in range(LOOKUPS)]
+
+            # Membership as checked per BrokerApp callback
+            start = time.perf_counter()
+            for ticker in tickers:
+                ticker in list(symbols_map.broker_map.keys())
+            legacy_member = (time.perf_counter() - start) / LOOKUPS
+
+            start = time.perf_counter()
+            for ticker in tickers:
+                ticker in symbols_map.broker_ticker_set
+            member = (time.perf_counter() - start) / LOOKUPS
+
+            # Data tickers probed through each map in turn
+            data_tickers = [f"MIDAS{i % size}" for i in range(LOOKUPS)]
+            start = time.perf_counter()
+            for ticker in data_tickers:
+                (
+                    symbols_map.broker_map.get(ticker)
+                    or symbols_map.data_map.get(ticker)
+                    or symbols_map.midas_map.get(ticker)
+                )
+            legacy_id = (time.perf_counter() - start) / LOOKUPS
+
+            start = time.perf_counter()
+            for ticker in data_tickers:
+                symbols_map.get_id(ticker)
+            get_id = (time.perf_counter() - start) / LOOKUPS
+
+            print(
+                f"\n{size:,} symbols: membership list scan "
+                f"{legacy_member * 1e9:,.0f} ns, frozenset "
+                f"{member * 1e9:,.0f} ns; get_id chained "
+                f"{legacy_id * 1e9:,.0f} ns, merged {get_id * 1e9:,.0f} ns"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import time
+import unittest
+import numpy as np
+import pandas as pd
+from midas.utils.unix import unix_to_iso, _convert_timestamp
+
+ROWS = 2_000_000
+SECOND = 1_000_000_000
+
+
+def legacy_convert(df: pd.DataFrame, column: str) -> None:
+    # Per row conversion of PerformanceManager export before vectorizing
+    df[column] = pd.to_datetime(df[column].map(lambda x: unix_to_iso(x)))
+    df[column] = df[column].dt.tz_convert("America/New_York")
+    df[column] = df[column].dt.tz_localize(None)
+
+
+class TestUnixBenchmark(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(5)
+        self.timestamps = 1704205800000000000 + np.sort(
+            rng.integers(0, 365 * 86_400, ROWS) * SECOND
+        )
+
+    def test_export_conversion(self):
+        legacy = pd.DataFrame({"ts_event": self.timestamps})
+        start = time.perf_counter()
+        legacy_convert(legacy, "ts_event")
+        legacy_time = time.perf_counter() - start
+
+        vectorized = pd.DataFrame({"ts_event": self.timestamps})
+        start = time.perf_counter()
+        _convert_timestamp(vectorized, "ts_event", "America/New_York")
+        vectorized["ts_event"] = vectorized["ts_event"].dt.tz_localize(None)
+        vectorized_time = time.perf_counter() - start
+
+        pd.testing.assert_series_equal(
+            legacy["ts_event"], vectorized["ts_event"], check_dtype=False
+        )
+        print(
+            f"\n{ROWS:,} timestamps: per row map {legacy_time:,.2f} s, "
+            f"vectorized {vectorized_time * 1e3:,.0f} ms "
+            f"({legacy_time / vectorized_time:,.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
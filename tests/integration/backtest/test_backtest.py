@@ -6,6 +6,9 @@ class MidasBacktestIntegration(unittest.TestCase):
     def test_backtest(self):
         run("tests/integration/strategy/config.toml", "backtest")
 
+    def test_backtest_time_slices(self):
+        run("tests/integration/strategy/config_time_slices.toml", "backtest")
+
 
 if __name__ == "__main__":
     unittest.main()
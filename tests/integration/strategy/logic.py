@@ -2,14 +2,14 @@ import math
 import numpy as np
 import pandas as pd
 from enum import Enum, auto
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Union
 from mbn import BufferStore, OhlcvMsg
 from midas.engine.components.order_book import OrderBook
 from midas.engine.components.base_strategy import BaseStrategy
 from midas.engine.components.portfolio_server import PortfolioServer
 from midas.signal import SignalInstruction, OrderType, Action
 from midas.symbol import SymbolMap
-from midas.engine.events.market_event import MarketEvent
+from midas.engine.events import MarketEvent, TimeSliceEvent
 from quantAnalytics.data.handler import DataHandler
 from midas.engine.components.observer.base import Subject, EventType
 from midas.engine.components.gateways.backtest import DataClient
@@ -58,31 +58,18 @@ class Cointegrationzscore(BaseStrategy):
         }
 
     def primer(self) -> None:
-        self.data = pd.DataFrame()
-        self.initialize_current_price()
-
-        while True:
-            record = self.hist_data_client.next_record()
-
-            if not record:
-                raise RuntimeError("Not enough records to prime strategy.")
-
-            # if record:
-            key = record.instrument_id
-            self.current_price[f"{key}"] = record.close / 1e9
-            self.current_price[f"{key}_log"] = np.log(record.close / 1e9)
-            self.last_update_time[key] = record.ts_event
-
-            # Check if all tickers have the same timestamp
-            if self.check_timestamps_aligned():
-                # Create new row
-                new_row = self.current_price.copy()
-                new_row["timestamp"] = record.ts_event
-                new_row.set_index("timestamp", inplace=True)
-                self.data = pd.concat([self.data, new_row], ignore_index=False)
+        # Closes of the legs at their first aligned timestamps
+        self.data = self.hist_data_client.get_aligned_window(
+            self.zscore_lookback, instrument_ids=list(self.weights.keys())
+        )
+        self.data.index.name = "timestamp"
+        self.data.columns = self.data.columns.astype(str)
+        self.data = self._log_transform(self.data)
 
-            if len(self.data) == self.zscore_lookback:
-                break
+        self.current_price = self.data.iloc[[-1]].copy(deep=True)
+        self.last_update_time = {
+            key: int(self.data.index[-1]) for key in self.weights.keys()
+        }
 
         # Spread
         self.update_spread(self.data)
@@ -182,10 +169,14 @@ class Cointegrationzscore(BaseStrategy):
         self,
         subject: Subject,
         event_type: EventType,
-        event: MarketEvent,
+        event: Union[MarketEvent, TimeSliceEvent],
     ):
 
         if event_type == EventType.ORDER_BOOK:
+            if isinstance(event, TimeSliceEvent):
+                self.handle_time_slice(event)
+                return
+
             # prinst(event.data)
             if isinstance(event.data, OhlcvMsg):
                 # Update the respective columns in `self.current_price`
@@ -202,6 +193,21 @@ class Cointegrationzscore(BaseStrategy):
             if self.check_timestamps_aligned():
                 self.process_data(event.data.ts_event)
 
+    def handle_time_slice(self, event: TimeSliceEvent) -> None:
+        """
+        Update prices from a time slice, processing it when every leg has a bar at its timestamp.
+        """
+        updated = set()
+        for record in event.data:
+            if isinstance(record, OhlcvMsg):
+                key = record.instrument_id
+                self.current_price[f"{key}"] = record.close / 1e9
+                self.current_price[f"{key}_log"] = np.log(record.close / 1e9)
+                updated.add(key)
+
+        if updated.issuperset(self.weights.keys()):
+            self.process_data(event.timestamp)
+
     def check_timestamps_aligned(self) -> bool:
         """
         Check if the last update time for all tickers is the same.
@@ -0,0 +1,189 @@
+import unittest
+import numpy as np
+from datetime import time
+from midas.orders import Action
+from midas.symbol import (
+    SecurityType,
+    Venue,
+    Currency,
+    Industry,
+    Equity,
+    Future,
+    Option,
+    Right,
+    ContractUnits,
+    TradingSession,
+    FuturesMonth,
+    SymbolMap,
+)
+from midas.cost_models import (
+    FixedCostModel,
+    TieredCostModel,
+    SpreadCostModel,
+    cost_model_factory,
+)
+
+
+class TestCostModels(unittest.TestCase):
+    def setUp(self) -> None:
+        sessions = TradingSession(day_open=time(9, 0), day_close=time(14, 0))
+        self.equity = Equity(
+            instrument_id=7,
+            broker_ticker="AAPL",
+            data_ticker="AAPL2",
+            midas_ticker="AAPL",
+            security_type=SecurityType.STOCK,
+            currency=Currency.USD,
+            exchange=Venue.NASDAQ,
+            fees=0.1,
+            initial_margin=0,
+            quantity_multiplier=1,
+            price_multiplier=1,
+            company_name="Apple Inc.",
+            industry=Industry.TECHNOLOGY,
+            market_cap=10000000000.99,
+            shares_outstanding=1937476363,
+            slippage_factor=0.05,
+            trading_sessions=sessions,
+        )
+        self.future = Future(
+            instrument_id=3,
+            broker_ticker="HEJ4",
+            data_ticker="HE",
+            midas_ticker="HE.n.0",
+            security_type=SecurityType.FUTURE,
+            currency=Currency.USD,
+            exchange=Venue.CME,
+            fees=0.85,
+            initial_margin=4564.17,
+            quantity_multiplier=40000,
+            price_multiplier=0.01,
+            product_code="HE",
+            product_name="Lean Hogs",
+            industry=Industry.AGRICULTURE,
+            contract_size=40000,
+            contract_units=ContractUnits.POUNDS,
+            tick_size=0.00025,
+            min_price_fluctuation=10,
+            continuous=False,
+            lastTradeDateOrContractMonth="202406",
+            slippage_factor=0.25,
+            trading_sessions=sessions,
+            expr_months=[FuturesMonth.G, FuturesMonth.J],
+            term_day_rule="nth_business_day_10",
+            market_calendar="CMEGlobex_Lean_Hog",
+        )
+        self.option = Option(
+            instrument_id=11,
+            broker_ticker="AAPLP",
+            data_ticker="AAPLP",
+            midas_ticker="AAPLP",
+            security_type=SecurityType.OPTION,
+            currency=Currency.USD,
+            exchange=Venue.NASDAQ,
+            fees=0.65,
+            initial_margin=0,
+            quantity_multiplier=100,
+            price_multiplier=1,
+            strike_price=109.99,
+            expiration_date="2024-01-01",
+            option_type=Right.CALL,
+            contract_size=100,
+            underlying_name="AAPL",
+            lastTradeDateOrContractMonth="20240201",
+            slippage_factor=0.01,
+            trading_sessions=sessions,
+        )
+        self.symbols_map = SymbolMap()
+        for symbol in (self.equity, self.future, self.option):
+            self.symbols_map.add_symbol(symbol)
+
+        # Legs
+        self.symbols = [self.option, self.equity, self.future, self.equity]
+        self.instrument_ids = [s.instrument_id for s in self.symbols]
+        self.quantities = [3, -100, -2, 250]
+        self.prices = [4.5, 150.25, 80.5, 149.75]
+
+    def test_fixed_matches_symbol(self):
+        model = FixedCostModel(self.symbols_map)
+
+        # Test
+        fees = model.commission_fees(
+            self.instrument_ids, self.quantities, self.prices
+        )
+        slippage = model.slippage_prices(
+            self.instrument_ids, self.quantities, self.prices
+        )
+        value = model.value(self.instrument_ids, self.quantities, self.prices)
+        cost = model.cost(self.instrument_ids, self.quantities, self.prices)
+
+        # Expected
+        legs = list(zip(self.symbols, self.quantities, self.prices))
+        actions = [
+            Action.LONG if q > 0 else Action.SELL for q in self.quantities
+        ]
+
+        # Validate
+        self.assertEqual(
+            fees.tolist(), [s.commission_fees(q) for s, q, _ in legs]
+        )
+        self.assertEqual(
+            slippage.tolist(),
+            [s.slippage_price(p, a) for (s, _, p), a in zip(legs, actions)],
+        )
+        np.testing.assert_allclose(value, [s.value(q, p) for s, q, p in legs])
+        np.testing.assert_allclose(cost, [s.cost(q, p) for s, q, p in legs])
+
+    def test_tiered(self):
+        model = TieredCostModel(
+            self.symbols_map, tiers=[(100, 0.01), (1000, 0.005)], minimum=1
+        )
+
+        # Test
+        fees = model.commission_fees(
+            [7, 7, 7, 7], [50, -500, 5000, 0], [1] * 4
+        )
+
+        # Validate
+        self.assertEqual(fees.tolist(), [-1.0, -2.5, -25.0, 0.0])
+
+    def test_tiered_invalid(self):
+        with self.assertRaises(ValueError):
+            TieredCostModel(self.symbols_map, tiers=[])
+        with self.assertRaises(ValueError):
+            TieredCostModel(self.symbols_map, tiers=[(100, 0.1), (50, 0.2)])
+
+    def test_spread(self):
+        model = SpreadCostModel(self.symbols_map, spread=0.002)
+
+        # Test
+        prices = model.slippage_prices([7, 7], [10, -10], [100, 100])
+
+        # Validate
+        np.testing.assert_allclose(prices, [100.1, 99.9])
+
+    def test_unknown_instrument(self):
+        model = FixedCostModel(self.symbols_map)
+
+        with self.assertRaises(ValueError):
+            model.cost([7, 8], [1, 1], [10, 10])
+        with self.assertRaises(ValueError):
+            model.cost([12], [1], [10])
+
+    def test_factory(self):
+        # Test
+        model = cost_model_factory(
+            self.symbols_map, model="tiered", tiers=[[100, 0.01]]
+        )
+
+        # Validate
+        self.assertIsInstance(model, TieredCostModel)
+        self.assertIsInstance(
+            cost_model_factory(self.symbols_map), FixedCostModel
+        )
+        with self.assertRaises(ValueError):
+            cost_model_factory(self.symbols_map, model="percent")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,11 +11,13 @@ from midas.symbol import (
     ContractUnits,
     TradingSession,
     FuturesMonth,
+    SymbolMap,
 )
 from midas.positions import (
     FuturePosition,
     EquityPosition,
     OptionPosition,
+    PositionBook,
     position_factory,
     Impact,
 )
@@ -1181,5 +1183,183 @@ class TestPositionfactory(unittest.TestCase):
         self.assertIsInstance(result, OptionPosition)
 
 
+class TestPositionBook(unittest.TestCase):
+    def setUp(self) -> None:
+        sessions = TradingSession(day_open=time(9, 0), day_close=time(14, 0))
+        self.equity = Equity(
+            instrument_id=1,
+            broker_ticker="AAPL",
+            data_ticker="AAPL2",
+            midas_ticker="AAPL",
+            security_type=SecurityType.STOCK,
+            currency=Currency.USD,
+            exchange=Venue.NASDAQ,
+            fees=0.1,
+            initial_margin=0,
+            quantity_multiplier=1,
+            price_multiplier=1,
+            company_name="Apple Inc.",
+            industry=Industry.TECHNOLOGY,
+            market_cap=10000000000.99,
+            shares_outstanding=1937476363,
+            slippage_factor=1,
+            trading_sessions=sessions,
+        )
+        self.future = Future(
+            instrument_id=2,
+            broker_ticker="HEJ4",
+            data_ticker="HE",
+            midas_ticker="HE.n.0",
+            security_type=SecurityType.FUTURE,
+            currency=Currency.USD,
+            exchange=Venue.CME,
+            fees=0.1,
+            initial_margin=4000.598,
+            quantity_multiplier=40000,
+            price_multiplier=0.01,
+            product_code="HE",
+            product_name="Lean Hogs",
+            industry=Industry.AGRICULTURE,
+            contract_size=40000,
+            contract_units=ContractUnits.POUNDS,
+            tick_size=0.00025,
+            min_price_fluctuation=10,
+            continuous=False,
+            lastTradeDateOrContractMonth="202406",
+            slippage_factor=1,
+            trading_sessions=sessions,
+            expr_months=[FuturesMonth.G, FuturesMonth.J],
+            term_day_rule="nth_business_day_10",
+            market_calendar="CMEGlobex_Lean_Hog",
+        )
+        self.option = Option(
+            instrument_id=3,
+            broker_ticker="AAPLP",
+            data_ticker="AAPLP",
+            midas_ticker="AAPLP",
+            security_type=SecurityType.OPTION,
+            currency=Currency.USD,
+            exchange=Venue.NASDAQ,
+            fees=0.1,
+            initial_margin=0,
+            quantity_multiplier=100,
+            price_multiplier=1,
+            strike_price=109.99,
+            expiration_date="2024-01-01",
+            option_type=Right.CALL,
+            contract_size=100,
+            underlying_name="AAPL",
+            lastTradeDateOrContractMonth="20240201",
+            slippage_factor=1,
+            trading_sessions=sessions,
+        )
+        self.symbols_map = SymbolMap()
+        for symbol in (self.equity, self.future, self.option):
+            self.symbols_map.add_symbol(symbol)
+
+        self.positions = {
+            self.equity.contract: EquityPosition(
+                action="SELL",
+                avg_price=150.25,
+                quantity=-100,
+                quantity_multiplier=1,
+                price_multiplier=1,
+                market_price=150.25,
+            ),
+            self.future.contract: FuturePosition(
+                action="BUY",
+                avg_price=80.5,
+                quantity=5,
+                quantity_multiplier=40000,
+                price_multiplier=0.01,
+                market_price=80.5,
+                initial_margin=4000.598,
+            ),
+            self.option.contract: OptionPosition(
+                action="SELL",
+                avg_price=4.5,
+                quantity=-3,
+                quantity_multiplier=100,
+                price_multiplier=1,
+                market_price=4.5,
+                type=Right.CALL,
+                strike_price=109.99,
+                expiration_date="2024-01-01",
+            ),
+        }
+        self.book = PositionBook(self.symbols_map, capacity=1)
+        for contract, position in self.positions.items():
+            self.book[contract] = position
+
+    def test_materialize(self):
+        # Validate
+        self.assertEqual(len(self.book), 3)
+        self.assertEqual(self.book.copy(), self.positions)
+        self.assertEqual(self.book.instrument_ids(), [1, 2, 3])
+        self.assertTrue(self.book.has_instrument(2))
+        self.assertIn(self.future.contract, self.book)
+
+    def test_delete(self):
+        # Test
+        del self.book[self.future.contract]
+
+        # Validate
+        self.assertEqual(len(self.book), 2)
+        self.assertNotIn(self.future.contract, self.book)
+        self.assertFalse(self.book.has_instrument(2))
+        self.assertEqual(self.book.instrument_ids(), [1, 3])
+        with self.assertRaises(KeyError):
+            self.book[self.future.contract]
+
+    def test_mark(self):
+        prices = [148.75, 82.125, 6.25]
+
+        # Test
+        totals = self.book.mark(prices)
+
+        # Expected
+        unrealized_pnl = margin_required = liquidation_value = 0
+        for position, price in zip(self.positions.values(), prices):
+            position.market_price = price
+            position.calculate_market_value()
+            position.calculate_unrealized_pnl()
+            position.calculate_liquidation_value()
+            unrealized_pnl += position.unrealized_pnl
+            margin_required += position.margin_required
+            liquidation_value += position.liquidation_value
+
+        # Validate
+        for result, expected in zip(
+            totals, (unrealized_pnl, margin_required, liquidation_value)
+        ):
+            self.assertAlmostEqual(result, expected, places=6)
+        self.assertEqual(
+            self.book[self.option.contract].unrealized_pnl,
+            self.positions[self.option.contract].unrealized_pnl,
+        )
+
+    def test_mark_instrument(self):
+        start = self.book.mark([150, 80, 5])
+
+        # Test
+        change = self.book.mark_instrument(2, 83.5)
+
+        # Validate
+        end = self.book.mark([150, 83.5, 5])
+        for a, b, delta in zip(start, end, change):
+            self.assertAlmostEqual(b - a, delta, places=6)
+        with self.assertRaises(KeyError):
+            self.book.mark_instrument(4, 10)
+
+    def test_unsupported(self):
+        with self.assertRaises(TypeError):
+            self.book[self.equity.contract] = object()
+
+        contract = self.equity.contract
+        contract.symbol = "MSFT"
+        with self.assertRaises(ValueError):
+            self.book[contract] = self.positions[self.future.contract]
+
+
 if __name__ == "__main__":
     unittest.main()
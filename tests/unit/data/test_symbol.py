@@ -1,4 +1,6 @@
 import unittest
+from unittest.mock import Mock, patch
+import numpy as np
 import pandas as pd
 from ibapi.contract import Contract
 from datetime import time
@@ -17,10 +19,17 @@ from midas.symbol import (
     FuturesMonth,
     Right,
     ContractUnits,
+    SessionTable,
 )
 
 
 class TestEquity(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.session_table = SessionTable(
+            TradingSession(day_open=time(9, 0), day_close=time(14, 0))
+        )
+
     def setUp(self) -> None:
         # Mock equity data
         self.instrument_id = 1
@@ -64,6 +73,9 @@ class TestEquity(unittest.TestCase):
             trading_sessions=self.trading_sessions,
         )
 
+        # Session table built once for the class
+        self.equity_obj.__dict__["session_table"] = self.session_table
+
     # Basic Validation
     def test_construction(self):
         # Test
@@ -620,6 +632,13 @@ class TestEquity(unittest.TestCase):
 
 
 class TestFuture(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.session_table = SessionTable(
+            TradingSession(day_open=time(9, 0), day_close=time(14, 0)),
+            "CMEGlobex_Lean_Hog",
+        )
+
     def setUp(self) -> None:
         # Mock future data
         self.instrument_id = 1
@@ -680,6 +699,9 @@ class TestFuture(unittest.TestCase):
             market_calendar=self.market_calendar,
         )
 
+        # Session table built once for the class
+        self.future_obj.__dict__["session_table"] = self.session_table
+
     # Basic Validation
     def test_contstruction(self):
         # Test
@@ -859,6 +881,56 @@ class TestFuture(unittest.TestCase):
         timestamp = 1734362358000000000  # 2024-12-16 10:19:18
         self.assertFalse(self.future_obj.in_rolling_window(timestamp, window))
 
+    def test_in_rolling_window_array(self):
+        # Consecutive expiration months with windows touching at month end
+        self.future_obj.expr_months = [FuturesMonth.F, FuturesMonth.Z]
+        timestamps = np.arange(
+            1701388800000000000,  # 2023-12-01 00:00:00 UTC
+            1739577600000000000,  # 2025-02-15 00:00:00 UTC
+            3 * 3_600_000_000_000 + 17 * 60_000_000_000,
+        )
+
+        for window, tz_info in [(2, "UTC"), (20, "America/New_York")]:
+            # Test
+            result = self.future_obj.in_rolling_window_array(
+                timestamps, window, tz_info
+            )
+
+            # Validate
+            expected = [
+                self.future_obj.in_rolling_window(ts, window, tz_info)
+                for ts in timestamps.tolist()
+            ]
+            self.assertEqual(result.tolist(), expected)
+            self.assertTrue(result.any())
+
+    def test_expiration_date_cached(self):
+        timestamps = np.arange(
+            1704067200000000000,  # 2024-01-01 00:00:00 UTC
+            1735689600000000000,  # 2025-01-01 00:00:00 UTC
+            60_000_000_000,
+        )
+
+        with patch.object(
+            self.future_obj,
+            "apply_day_rule",
+            wraps=self.future_obj.apply_day_rule,
+        ) as apply_day_rule:
+            # Test
+            self.future_obj.in_rolling_window_array(timestamps)
+            self.future_obj.in_rolling_window_array(timestamps)
+            self.future_obj.in_rolling_window(1733930358000000000)
+
+            # Validate
+            self.assertEqual(apply_day_rule.call_count, 3)
+
+        # Changing the rule recomputes the expiration date
+        self.future_obj.term_day_rule = "nth_last_business_day_2"
+        self.assertEqual(
+            self.future_obj.expiration_date(12, 2024),
+            pd.Timestamp("2024-12-30 00:00:00+0000"),
+        )
+
     def test_apply_day_rule_nth_day(self):
         month = 12
         year = 2024
@@ -1576,6 +1648,130 @@ class TestOption(unittest.TestCase):
             )
 
 
+class TestSessionTable(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Calendar table shared by the tests that only read it
+        cls.trading_session = TradingSession(
+            day_open=time(9, 0), day_close=time(14, 0)
+        )
+        cls.table = SessionTable(cls.trading_session, "CMEGlobex_Lean_Hog")
+
+    def _ns(self, iso: str) -> int:
+        return pd.Timestamp(iso).value
+
+    def test_daylight_saving(self):
+        table = SessionTable(self.trading_session)
+
+        # Validate
+        # 13:30 UTC is 08:30 EST in January and 09:30 EDT in July
+        self.assertFalse(table.in_session(self._ns("2024-01-02T13:30:00Z")))
+        self.assertTrue(table.in_session(self._ns("2024-07-02T13:30:00Z")))
+        self.assertFalse(table.after_close(self._ns("2024-01-02T18:30:00Z")))
+        self.assertTrue(table.after_close(self._ns("2024-07-02T18:30:00Z")))
+
+    def test_calendar(self):
+        # Validate
+        # 2024-11-29 closes early at 13:05 New York
+        self.assertTrue(
+            self.table.after_close(self._ns("2024-11-29T13:30:00-05:00"))
+        )
+        self.assertFalse(
+            self.table.in_session(self._ns("2024-11-29T13:30:00-05:00"))
+        )
+        # 2024-12-25 holiday and 2024-12-28 Saturday have no session
+        self.assertFalse(
+            self.table.in_session(self._ns("2024-12-25T10:00:00-05:00"))
+        )
+        self.assertFalse(
+            self.table.in_session(self._ns("2024-12-28T10:00:00-05:00"))
+        )
+        self.assertTrue(
+            self.table.after_close(self._ns("2024-12-25T15:00:00-05:00"))
+        )
+
+    def test_day(self):
+        # Test
+        day = self.table.day(self._ns("2024-09-30T23:30:00-04:00"))
+
+        # Validate
+        self.assertEqual(
+            pd.Timestamp(day, unit="D"), pd.Timestamp("2024-09-30")
+        )
+
+    def test_extend(self):
+        table = SessionTable(self.trading_session, "CMEGlobex_Lean_Hog")
+
+        # Test
+        table.day(self._ns("2024-06-01T12:00:00Z"))
+        table.day(self._ns("2022-06-01T12:00:00Z"))
+
+        # Validate
+        self.assertEqual(len(table), 366 + 365 + 365)
+        self.assertFalse(
+            table.in_session(self._ns("2023-01-02T10:00:00-05:00"))
+        )
+        self.assertTrue(
+            table.in_session(self._ns("2023-01-03T10:00:00-05:00"))
+        )
+
+    def test_calendar_second_resolution(self):
+        # Calendars may return non-nanosecond instants under pandas >= 2
+        dates = pd.DatetimeIndex(["2030-11-28", "2030-11-29"]).as_unit("s")
+        early_close = pd.Timestamp("2030-11-29T18:05:00Z")
+        calendar = Mock()
+        calendar.schedule.return_value = pd.DataFrame(index=dates)
+        calendar.early_closes.return_value = pd.DataFrame(
+            {"market_close": pd.DatetimeIndex([early_close]).as_unit("s")},
+            index=dates[1:],
+        )
+        with patch("midas.symbol.mcal.get_calendar", return_value=calendar):
+            table = SessionTable(self.trading_session, "SecondResolution")
+
+            # Test
+            before = table.in_session(self._ns("2030-11-29T12:30:00-05:00"))
+            after = table.after_close(self._ns("2030-11-29T13:30:00-05:00"))
+            days = table.days(np.array([self._ns("2030-11-29T12:00:00Z")]))
+
+        # Validate
+        self.assertTrue(before)
+        self.assertTrue(after)
+        self.assertEqual(
+            pd.Timestamp(int(days[0]), unit="D"), pd.Timestamp("2030-11-29")
+        )
+
+    def test_arrays_match_scalar(self):
+        timestamps = np.arange(
+            self._ns("2023-12-30T00:00:00Z"),
+            self._ns("2025-01-03T00:00:00Z"),
+            37 * 60_000_000_000,
+        )
+
+        # Test
+        days = self.table.days(timestamps)
+        after = self.table.after_close_array(timestamps)
+
+        # Validate
+        self.assertEqual(
+            days.tolist(), [self.table.day(ts) for ts in timestamps.tolist()]
+        )
+        self.assertEqual(
+            after.tolist(),
+            [self.table.after_close(ts) for ts in timestamps.tolist()],
+        )
+
+    def test_no_day_session(self):
+        with self.assertRaises(ValueError):
+            SessionTable(
+                TradingSession(
+                    day_open=None,
+                    day_close=None,
+                    night_open=time(18, 0),
+                    night_close=time(5, 0),
+                )
+            )
+
+
 class TestSymbolFactory(unittest.TestCase):
     def setUp(self) -> None:
         self.future_dict = {
@@ -1645,7 +1841,7 @@ class TestSymbolMap(unittest.TestCase):
             "term_day_rule": "nth_business_day_10",
             "market_calendar": "CMEGlobex_Lean_Hog",
         }
-        self.symbol = SymbolFactory.from_dict(self.future_dict)
+        self.symbol = SymbolFactory.from_dict(dict(self.future_dict))
         self.symbols_map = SymbolMap()
 
     def test_add_symbol(self):
@@ -1705,11 +1901,75 @@ class TestSymbolMap(unittest.TestCase):
         midas = self.symbols_map.midas_tickers
 
         # Validate
-        self.assertEqual(symbols, [self.symbol])
-        self.assertEqual(ids, [43])
-        self.assertEqual(broker, ["HE"])
-        self.assertEqual(data, ["HE"])
-        self.assertEqual(midas, ["HE.n.0"])
+        self.assertEqual(symbols, (self.symbol,))
+        self.assertEqual(ids, (43,))
+        self.assertEqual(broker, ("HE",))
+        self.assertEqual(data, ("HE",))
+        self.assertEqual(midas, ("HE.n.0",))
+        self.assertEqual(self.symbols_map.broker_ticker_set, frozenset({"HE"}))
+        self.assertIs(self.symbols_map.symbols, symbols)
+
+    def test_views_refreshed(self):
+        self.symbols_map.add_symbol(self.symbol)
+        symbols = self.symbols_map.symbols
+        other = SymbolFactory.from_dict(
+            {
+                **self.future_dict,
+                "instrument_id": 44,
+                "broker_ticker": "ZC",
+                "data_ticker": "ZC",
+                "midas_ticker": "ZC.n.0",
+            }
+        )
+
+        # Test
+        self.symbols_map.add_symbol(other)
+
+        # Validate
+        self.assertEqual(len(symbols), 1)
+        self.assertEqual(self.symbols_map.symbols, (self.symbol, other))
+        self.assertIn("ZC", self.symbols_map.broker_ticker_set)
+        self.assertEqual(self.symbols_map.midas_tickers, ("HE.n.0", "ZC.n.0"))
+
+    def test_slots(self):
+        self.symbols_map.add_symbol(self.symbol)
+        other = SymbolFactory.from_dict(
+            {**self.future_dict, "instrument_id": 7, "broker_ticker": "ZC"}
+        )
+
+        # Test
+        self.symbols_map.add_symbol(other)
+        self.symbols_map.add_symbol(self.symbol)
+
+        # Validate
+        self.assertEqual(self.symbols_map.get_slot(43), 0)
+        self.assertEqual(self.symbols_map.get_slot(7), 1)
+        self.assertIsNone(self.symbols_map.get_slot(8))
+        self.assertEqual(dict(self.symbols_map.slots), {43: 0, 7: 1})
+        with self.assertRaises(TypeError):
+            self.symbols_map.slots[8] = 2
+
+    def test_get_id_priority(self):
+        # Broker tickers resolve before data and midas tickers
+        self.symbols_map.add_symbol(self.symbol)
+        other = SymbolFactory.from_dict(
+            {
+                **self.future_dict,
+                "instrument_id": 44,
+                "broker_ticker": "HE.n.0",
+                "data_ticker": "ZC",
+                "midas_ticker": "HE",
+            }
+        )
+
+        # Test
+        self.symbols_map.add_symbol(other)
+
+        # Validate
+        self.assertEqual(self.symbols_map.get_id("HE"), 43)
+        self.assertEqual(self.symbols_map.get_id("HE.n.0"), 44)
+        self.assertEqual(self.symbols_map.get_id("ZC"), 44)
+        self.assertIsNone(self.symbols_map.get_id("CL"))
 
 
 # class TestIndex(unittest.TestCase):
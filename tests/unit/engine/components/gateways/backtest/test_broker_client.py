@@ -1,13 +1,14 @@
 import unittest
 from datetime import time, datetime
 from ibapi.order import Order
-from midas.engine.events import MarketEvent
+from midas.engine.events import MarketEvent, TimeSliceEvent
 from mbn import OhlcvMsg
 from midas.engine.events import EODEvent
 from ibapi.contract import Contract
 from midas.trade import Trade
 from unittest.mock import Mock, MagicMock
 from midas.positions import EquityPosition
+from midas.active_orders import ActiveOrder
 from midas.orders import Action, MarketOrder
 from midas.engine.components.observer.base import EventType
 from midas.account import Account, EquityDetails
@@ -210,6 +211,117 @@ class TestBrokerClient(unittest.TestCase):
         # Validate
         self.assertEqual(self.broker_client.update_equity_value.call_count, 1)
 
+    def test_handle_event_time_slice(self):
+        bars = [
+            OhlcvMsg(
+                instrument_id=instrument_id,
+                ts_event=12345432,
+                open=int(80.90 * 1e9),
+                close=int(9000.90 * 1e9),
+                high=int(75.90 * 1e9),
+                low=int(8800.09 * 1e9),
+                volume=880000,
+            )
+            for instrument_id in (1, 2)
+        ]
+
+        event = TimeSliceEvent(12345432, bars)
+
+        # Test
+        self.broker_client.update_equity_value = Mock()
+        self.broker_client.handle_event(
+            Mock(),
+            EventType.ORDER_BOOK,
+            event,
+        )
+
+        # Validate
+        self.assertEqual(self.broker_client.update_equity_value.call_count, 1)
+
+    def _sampled_equity(self, broker_client, timestamps) -> list:
+        self.dummy_broker.matching_engine = None
+        self.dummy_broker.pending_orders = []
+        self.dummy_broker.return_equity_value.side_effect = lambda: {
+            "timestamp": self.dummy_broker.mark_instrument.call_count
+        }
+        broker_client.notify = Mock()
+        for timestamp in timestamps:
+            bar = OhlcvMsg(
+                instrument_id=1,
+                ts_event=timestamp,
+                open=int(80.90 * 1e9),
+                close=int(9000.90 * 1e9),
+                high=int(75.90 * 1e9),
+                low=int(8800.09 * 1e9),
+                volume=880000,
+            )
+            broker_client.handle_order_book(MarketEvent(timestamp, bar))
+        return [c.args[1] for c in broker_client.notify.call_args_list]
+
+    def test_equity_sampling_record(self):
+        # Test
+        samples = self._sampled_equity(self.broker_client, [1, 1, 2])
+
+        # Validate
+        self.assertEqual(samples, [{"timestamp": i} for i in (1, 2, 3)])
+
+    def test_equity_sampling_bar(self):
+        broker_client = BrokerClient(
+            self.dummy_broker, self.symbols_map, "bar"
+        )
+
+        # Test
+        samples = self._sampled_equity(broker_client, [1, 1, 2, 3, 3])
+
+        # Validate
+        self.assertEqual(samples, [{"timestamp": 2}, {"timestamp": 3}])
+        self.assertEqual(self.dummy_broker.mark_instrument.call_count, 5)
+
+    def test_equity_sampling_interval(self):
+        broker_client = BrokerClient(
+            self.dummy_broker, self.symbols_map, "interval", 2
+        )
+        second = 1_000_000_000
+
+        # Test
+        samples = self._sampled_equity(
+            broker_client, [0, second, 2 * second, 3 * second, 7 * second]
+        )
+
+        # Validate
+        self.assertEqual(samples, [{"timestamp": 2}, {"timestamp": 4}])
+
+    def test_equity_sampling_trades(self):
+        broker_client = BrokerClient(
+            self.dummy_broker, self.symbols_map, "trades"
+        )
+
+        # Test
+        samples = self._sampled_equity(broker_client, [1, 2, 3])
+
+        # Validate
+        self.assertEqual(samples, [])
+        self.assertEqual(self.dummy_broker.mark_instrument.call_count, 3)
+
+    def test_equity_sampling_eod(self):
+        broker_client = BrokerClient(
+            self.dummy_broker, self.symbols_map, "eod"
+        )
+        broker_client.update_equity_value = Mock()
+
+        # Test
+        broker_client.handle_eod(EODEvent(datetime(2024, 10, 1)))
+
+        # Validate
+        self.assertEqual(broker_client.update_equity_value.call_count, 1)
+        self.assertEqual(self._sampled_equity(broker_client, [1, 2]), [])
+
+    def test_equity_sampling_invalid(self):
+        with self.assertRaises(ValueError):
+            BrokerClient(self.dummy_broker, self.symbols_map, "tick")
+        with self.assertRaises(ValueError):
+            BrokerClient(self.dummy_broker, self.symbols_map, "interval")
+
     def test_handle_order(self):
         # Order data
         self.valid_timestamp = 1651500000
@@ -236,6 +348,79 @@ class TestBrokerClient(unittest.TestCase):
         # Validate
         self.assertEqual(self.dummy_broker.placeOrder.call_count, 1)
 
+    def test_handle_order_book_matches(self):
+        event = MarketEvent(
+            123454323,
+            OhlcvMsg(
+                instrument_id=1,
+                ts_event=12345432,
+                open=int(80.90 * 1e9),
+                close=int(9000.90 * 1e9),
+                high=int(75.90 * 1e9),
+                low=int(8800.09 * 1e9),
+                volume=880000,
+            ),
+        )
+        self.broker_client.notify = Mock()
+
+        # Test
+        self.broker_client.handle_order_book(event)
+
+        # Validate
+        self.dummy_broker.match_orders.assert_called_once_with(event.data)
+        self.dummy_broker.mark_instrument.assert_called_once_with(1)
+
+    def test_handle_order_book_releases_orders(self):
+        event = MarketEvent(
+            123454323,
+            OhlcvMsg(
+                instrument_id=1,
+                ts_event=123454323,
+                open=int(80.90 * 1e9),
+                close=int(9000.90 * 1e9),
+                high=int(75.90 * 1e9),
+                low=int(8800.09 * 1e9),
+                volume=880000,
+            ),
+        )
+        self.dummy_broker.pending_orders = []
+
+        # Test
+        self.broker_client.handle_order_book(event)
+        self.dummy_broker.pending_orders = [(123454000,)]
+        self.broker_client.handle_order_book(event)
+
+        # Validate
+        self.dummy_broker.release_orders.assert_called_once_with(123454323)
+
+    def test_cancel_order(self):
+        self.dummy_broker.cancel_order.return_value = True
+
+        # Test
+        result = self.broker_client.cancel_order(3)
+
+        # Validate
+        self.assertTrue(result)
+        self.dummy_broker.cancel_order.assert_called_once_with(3)
+
+    def test_handle_event_order_update(self):
+        order = ActiveOrder(
+            permId=1,
+            clientId=0,
+            orderId=1,
+            parentId=0,
+            status="Submitted",
+        )
+        self.broker_client.notify = Mock()
+
+        # Test
+        self.broker_client.handle_event(Mock(), EventType.ORDER_UPDATE, order)
+
+        # Validate
+        self.broker_client.notify.assert_called_once_with(
+            EventType.ORDER_UPDATE, order
+        )
+
     def test_update_positions(self):
         # Position data
         ticker = "HEJ4"
@@ -0,0 +1,221 @@
+import pickle
+import shutil
+import tempfile
+import unittest
+import pandas as pd
+from types import SimpleNamespace
+from unittest.mock import Mock, MagicMock, patch
+from midas.utils.unix import iso_to_unix
+from midas.utils.logger import SystemLogger
+from midas.symbol import SymbolMap
+from midas.engine.components.gateways.backtest.data_client import DataClient
+from midas.engine.components.gateways.backtest.cache import (
+    HistoricalCache,
+    BufferStoreSlice,
+)
+
+DAY = 86_400_000_000_000
+
+
+class StubStore:
+    """
+    Stand-in for a BufferStore holding one record per hour.
+    """
+
+    def __init__(self, start: str, end: str):
+        self.records = [
+            SimpleNamespace(ts_event=ts, instrument_id=1)
+            for ts in range(iso_to_unix(start), iso_to_unix(end), DAY // 24)
+        ]
+        self.position = 0
+        self.metadata = None
+
+    def replay(self):
+        if self.position >= len(self.records):
+            return None
+        self.position += 1
+        return self.records[self.position - 1]
+
+    def decode_to_df(self, pretty_ts: bool = False, pretty_px: bool = False):
+        return pd.DataFrame(
+            {
+                "instrument_id": [r.instrument_id for r in self.records],
+                "ts_event": [r.ts_event for r in self.records],
+            }
+        )
+
+
+class StubDatabaseClient:
+    """
+    Stand-in database client returning a fixed range of records.
+    """
+
+    def __init__(self, start: str, end: str):
+        self.historical = Mock()
+        self.historical.get_records.side_effect = lambda params: StubStore(
+            start, end
+        )
+
+
+@patch(
+    "midas.engine.components.gateways.backtest.cache.store_from_bytes",
+    pickle.loads,
+)
+@patch(
+    "midas.engine.components.gateways.backtest.cache.store_to_bytes",
+    pickle.dumps,
+)
+class TestHistoricalCache(unittest.TestCase):
+    def setUp(self) -> None:
+        # Mock Logger
+        logger = SystemLogger()
+        logger.get_logger = MagicMock()
+
+        self.cache_dir = tempfile.mkdtemp()
+        self.tickers = ["HE.n.0", "ZC.n.0"]
+        self.schema = "ohlcv-1h"
+        self.db_client = StubDatabaseClient("2024-01-01", "2024-02-01")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.cache_dir)
+
+    def _data_client(self, cache: HistoricalCache) -> DataClient:
+        return DataClient(self.db_client, SymbolMap(), cache)
+
+    def _get(self, data_client: DataClient, start: str, end: str):
+        return data_client.get_data(self.tickers, start, end, self.schema)
+
+    def test_memory_hit(self):
+        cache = HistoricalCache(self.cache_dir)
+        data_client = self._data_client(cache)
+
+        # Test
+        first = self._get(data_client, "2024-01-01", "2024-02-01")
+        second = self._get(data_client, "2024-01-01", "2024-02-01")
+
+        # Validate
+        self.assertEqual(self.db_client.historical.get_records.call_count, 1)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.memory_hits, 1)
+        self.assertEqual(cache.disk_hits, 0)
+        self.assertIsNot(first, second)
+        self.assertEqual(
+            [r.ts_event for r in first.records],
+            [r.ts_event for r in second.records],
+        )
+        self.assertEqual(second.position, 0)
+
+    def test_disk_hit(self):
+        self._get(
+            self._data_client(HistoricalCache(self.cache_dir)),
+            "2024-01-01",
+            "2024-02-01",
+        )
+
+        # Test
+        cache = HistoricalCache(self.cache_dir)
+        data = self._get(
+            self._data_client(cache),
+            "2024-01-01",
+            "2024-02-01",
+        )
+
+        # Validate
+        self.assertEqual(self.db_client.historical.get_records.call_count, 1)
+        self.assertEqual(cache.disk_hits, 1)
+        self.assertEqual(cache.misses, 0)
+        self.assertEqual(len(data.records), 31 * 24)
+
+    def test_covered_range_sliced(self):
+        cache = HistoricalCache(self.cache_dir)
+        data_client = self._data_client(cache)
+        self._get(data_client, "2024-01-01", "2024-02-01")
+
+        # Test
+        data = self._get(data_client, "2024-01-10", "2024-01-12")
+
+        # Validate
+        self.assertIsInstance(data, BufferStoreSlice)
+        self.assertEqual(cache.memory_hits, 1)
+
+        timestamps = []
+        while (record := data.replay()) is not None:
+            timestamps.append(record.ts_event)
+
+        expected = list(
+            range(
+                iso_to_unix("2024-01-10"), iso_to_unix("2024-01-12"), DAY // 24
+            )
+        )
+        self.assertEqual(timestamps, expected)
+        self.assertEqual(data.decode_to_df()["ts_event"].tolist(), expected)
+
+    def test_uncovered_range_miss(self):
+        cache = HistoricalCache(self.cache_dir)
+        data_client = self._data_client(cache)
+        self._get(data_client, "2024-01-01", "2024-02-01")
+
+        # Test
+        self._get(data_client, "2024-01-20", "2024-02-10")
+
+        # Validate
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(self.db_client.historical.get_records.call_count, 2)
+
+    def test_memory_eviction(self):
+        size = len(pickle.dumps(StubStore("2024-01-01", "2024-01-02")))
+        cache = HistoricalCache(max_memory_bytes=int(size * 2.5))
+
+        # Test
+        for day in range(1, 4):
+            cache.put(
+                self.tickers,
+                f"2024-01-0{day}",
+                f"2024-01-0{day + 1}",
+                self.schema,
+                StubStore(f"2024-01-0{day}", f"2024-01-0{day + 1}"),
+            )
+
+        # Validate
+        self.assertIsNone(
+            cache.get(self.tickers, "2024-01-01", "2024-01-02", self.schema)
+        )
+        self.assertIsNotNone(
+            cache.get(self.tickers, "2024-01-03", "2024-01-04", self.schema)
+        )
+
+    def test_disk_eviction(self):
+        cache = HistoricalCache(self.cache_dir, max_memory_bytes=0)
+        cache.put(
+            self.tickers,
+            "2024-01-01",
+            "2024-01-02",
+            self.schema,
+            StubStore("2024-01-01", "2024-01-02"),
+        )
+        size = sum(entry["size"] for entry in cache._index.values())
+        cache.max_disk_bytes = int(size * 2.5)
+
+        # Test
+        for day in range(2, 5):
+            cache.put(
+                self.tickers,
+                f"2024-01-0{day}",
+                f"2024-01-0{day + 1}",
+                self.schema,
+                StubStore(f"2024-01-0{day}", f"2024-01-0{day + 1}"),
+            )
+
+        # Validate
+        reopened = HistoricalCache(self.cache_dir, max_memory_bytes=0)
+        self.assertEqual(len(reopened._index), 2)
+        self.assertIsNone(
+            reopened.get(self.tickers, "2024-01-02", "2024-01-03", self.schema)
+        )
+        self.assertIsNotNone(
+            reopened.get(self.tickers, "2024-01-04", "2024-01-05", self.schema)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
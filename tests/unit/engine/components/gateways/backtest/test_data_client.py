@@ -1,11 +1,14 @@
 import unittest
+import numpy as np
+import pandas as pd
 from midas.engine.components.observer.base import EventType
-from midas.engine.events import EODEvent
+from midas.engine.events import EODEvent, TimeSliceEvent
 from midas.utils.logger import SystemLogger
 from datetime import datetime, time
 from unittest.mock import Mock, MagicMock
 from mbn import OhlcvMsg, Schema, BufferStore
 from midas.symbol import SymbolMap
+from midas.constants import PRICE_FACTOR
 from midas.engine.components.gateways.backtest.data_client import DataClient
 from midas.symbol import (
     Equity,
@@ -97,6 +100,7 @@ class TestDataClient(unittest.TestCase):
 
         # Test
         self.data_client.get_data = Mock()
+        self.data_client._index_data = Mock()
         self.data_client.load_backtest_data(
             tickers,
             start_date,
@@ -106,6 +110,7 @@ class TestDataClient(unittest.TestCase):
 
         # Validate
         self.assertTrue(self.data_client.get_data.called)
+        self.assertTrue(self.data_client._index_data.called)
 
     def test_get_data_file(self):
         tickers = ["AAPL", "TSLA"]
@@ -209,6 +214,418 @@ class TestDataClient(unittest.TestCase):
         self.assertTrue(self.data_client._check_eod.called)
         self.assertTrue(self.data_client.notify.called)
 
+    def test_build_id_table(self):
+        self.data_client.data = Mock()
+        self.data_client.data.metadata.mappings.get_ticker.side_effect = (
+            lambda id: {3: "HE.n.0", 5: "AAPL"}[id]
+        )
+
+        # Test
+        self.data_client._build_id_table(np.array([3, 5]))
+
+        # Validate
+        self.assertEqual(
+            self.data_client._id_table, [None, None, None, 1, None, 2]
+        )
+
+    def test_next_record_id_table(self):
+        self.data_client.data = Mock()
+        self.data_client.data.replay.return_value = OhlcvMsg(
+            instrument_id=3,
+            ts_event=1707221160000000000,
+            open=int(80.90 * 1e9),
+            close=int(9000.90 * 1e9),
+            high=int(75.90 * 1e9),
+            low=int(8800.09 * 1e9),
+            volume=880000,
+        )
+        self.data_client._id_table = [None, None, None, 2]
+
+        # Test
+        record = self.data_client.next_record()
+
+        # Validate
+        self.assertEqual(record.instrument_id, 2)
+        self.assertFalse(
+            self.data_client.data.metadata.mappings.get_ticker.called
+        )
+
+    def test_resolve_id_unknown_ticker(self):
+        self.data_client.data = Mock()
+        self.data_client.data.metadata.mappings.get_ticker.return_value = (
+            "TSLA"
+        )
+
+        # Test
+        with self.assertRaises(ValueError):
+            self.data_client._resolve_id(1)
+
+    def _records(self) -> list:
+        # Two instruments every 45 minutes over eight days
+        start = 1727784000000000000  # 2024-10-01 12:00 UTC
+        step = 45 * 60 * 1_000_000_000
+        return [
+            OhlcvMsg(
+                instrument_id=native_id,
+                ts_event=start + i * step,
+                open=int(80.90 * 1e9),
+                close=int(9000.90 * 1e9),
+                high=int(75.90 * 1e9),
+                low=int(8800.09 * 1e9),
+                volume=880000,
+            )
+            for i in range(250)
+            for native_id in (3, 5)
+        ]
+
+    def _mock_store(self, records: list) -> Mock:
+        store = Mock()
+        store.replay.side_effect = records + [None]
+        store.metadata.mappings.get_ticker.side_effect = lambda id: {
+            3: "HE.n.0",
+            5: "AAPL",
+        }[id]
+        store.decode_to_df.return_value = pd.DataFrame(
+            {
+                "instrument_id": [r.hd.instrument_id for r in records],
+                "ts_event": [r.ts_event for r in records],
+                "close": [r.close for r in records],
+            }
+        )
+        return store
+
+    def _load_mock_data(self, records: list) -> None:
+        self.data_client.data = self._mock_store(records)
+
+    def _load_mock_windows(
+        self, records: list, windows: int, size: int = 0
+    ) -> None:
+        size = size or -(-len(records) // windows)
+        self.data_client.get_data = Mock(
+            side_effect=[
+                self._mock_store(records[i : i + size])
+                for i in range(0, len(records), size)
+            ]
+        )
+        self.data_client.load_backtest_data(
+            ["HE.n.0", "AAPL"],
+            "2024-10-01",
+            f"2024-10-{1 + windows:02d}",
+            Schema.OHLCV1_S,
+            chunk_days=1,
+        )
+
+    def _expected_eod_events(self, records: list, skip: int = 0) -> list:
+        # End-of-day events as produced by the per-record check
+        data_client = DataClient(self.db_client, self.symbols_map)
+        data_client.notify = Mock()
+        for record in records[skip:]:
+            record.instrument_id = {3: 1, 5: 2}.get(
+                record.instrument_id, record.instrument_id
+            )
+            data_client._check_eod_record(record)
+        return data_client.notify.call_args_list
+
+    def test_eod_index(self):
+        self._load_mock_data(self._records())
+        expected = self._expected_eod_events(self._records())
+
+        # Test
+        self.data_client._index_data()
+        self.data_client.notify = Mock()
+        while self.data_client.data_stream():
+            pass
+
+        # Validate
+        eod_calls = [
+            c
+            for c in self.data_client.notify.call_args_list
+            if c[0][0] == EventType.EOD_EVENT
+        ]
+        self.assertEqual(len(eod_calls), 8)
+        self.assertEqual(eod_calls, expected)
+
+    def test_date_windows(self):
+        # Test
+        windows = DataClient._date_windows("2024-01-01", "2024-01-08", 3)
+
+        # Validate
+        self.assertEqual(
+            windows,
+            [
+                ("2024-01-01", "2024-01-04"),
+                ("2024-01-04", "2024-01-07"),
+                ("2024-01-07", "2024-01-08"),
+            ],
+        )
+
+    def test_windowed_replay(self):
+        expected = self._expected_eod_events(self._records())
+        self._load_mock_windows(self._records(), 7)
+
+        # Test
+        self.data_client.notify = Mock()
+        count = 0
+        while self.data_client.data_stream():
+            count += 1
+
+        # Validate
+        eod_calls = [
+            c
+            for c in self.data_client.notify.call_args_list
+            if c[0][0] == EventType.EOD_EVENT
+        ]
+        self.assertEqual(count, 500)
+        self.assertEqual(self.data_client.get_data.call_count, 7)
+        self.assertEqual(eod_calls, expected)
+        self.assertIsNone(self.data_client.next_record())
+
+    def test_chunk_days_single_file(self):
+        self.data_client.get_data = Mock()
+
+        # Test
+        with self.assertRaises(ValueError):
+            self.data_client.load_backtest_data(
+                ["HE.n.0", "AAPL"],
+                "2024-10-01",
+                "2024-10-09",
+                Schema.OHLCV1_S,
+                data_file_path="data.bin",
+                chunk_days=1,
+            )
+
+        # Validate
+        self.data_client.get_data.assert_not_called()
+
+    def test_windowed_replay_after_primer(self):
+        expected = self._expected_eod_events(self._records(), skip=101)
+        self._load_mock_windows(self._records(), 7)
+
+        # Test
+        for _ in range(101):
+            self.data_client.next_record()
+
+        self.data_client.notify = Mock()
+        while self.data_client.data_stream():
+            pass
+
+        # Validate
+        eod_calls = [
+            c
+            for c in self.data_client.notify.call_args_list
+            if c[0][0] == EventType.EOD_EVENT
+        ]
+        self.assertEqual(eod_calls, expected)
+
+    def test_eod_index_after_primer(self):
+        self._load_mock_data(self._records())
+        expected = self._expected_eod_events(self._records(), skip=101)
+
+        # Test
+        self.data_client._index_data()
+        for _ in range(101):
+            self.data_client.next_record()
+
+        self.data_client.notify = Mock()
+        while self.data_client.data_stream():
+            pass
+
+        # Validate
+        eod_calls = [
+            c
+            for c in self.data_client.notify.call_args_list
+            if c[0][0] == EventType.EOD_EVENT
+        ]
+        self.assertEqual(eod_calls, expected)
+
+    def _gapped_records(self) -> list:
+        # Instrument 5 misses every third bar and bars carry their index as close
+        records = self._records()
+        for i, record in enumerate(records):
+            records[i] = OhlcvMsg(
+                instrument_id=record.hd.instrument_id,
+                ts_event=record.ts_event,
+                open=record.open,
+                close=i,
+                high=record.high,
+                low=record.low,
+                volume=record.volume,
+            )
+        return [
+            r
+            for i, r in enumerate(records)
+            if r.hd.instrument_id == 3 or (i // 2) % 3
+        ]
+
+    def _expected_window(
+        self, records: list, rows: int, scale: int = 1
+    ) -> pd.DataFrame:
+        # Aligned rows as read one record at a time by a primer
+        closes = {}
+        window = {}
+        for record in records:
+            closes.setdefault(record.ts_event, {})[
+                {3: 1, 5: 2}[record.hd.instrument_id]
+            ] = (record.close if scale == 1 else record.close / scale)
+            if len(closes[record.ts_event]) == 2:
+                window[record.ts_event] = closes[record.ts_event]
+            if len(window) == rows:
+                break
+        df = pd.DataFrame.from_dict(window, orient="index")[[1, 2]]
+        df.index.name = "ts_event"
+        return df
+
+    def test_get_aligned_window(self):
+        records = self._gapped_records()
+        self._load_mock_data(records)
+        self.data_client._index_data()
+        expected = self._expected_window(records, 40)
+
+        # Test
+        window = self.data_client.get_aligned_window(40, pretty_px=False)
+
+        # Validate
+        pd.testing.assert_frame_equal(window, expected)
+        last = expected.index[-1]
+        consumed = sum(1 for r in records if r.ts_event <= last)
+        self.assertEqual(self.data_client._cursor, consumed)
+        self.assertEqual(
+            self.data_client.next_record().ts_event,
+            records[consumed].ts_event,
+        )
+
+    def test_get_aligned_window_arrays(self):
+        records = self._gapped_records()
+        self._load_mock_data(records)
+        self.data_client._index_data()
+        expected = self._expected_window(records, 10)
+
+        # Test
+        timestamps, values = self.data_client.get_aligned_window(
+            10, instrument_ids=[2, 1], pretty_px=False, as_frame=False
+        )
+
+        # Validate
+        self.assertEqual(timestamps.tolist(), expected.index.tolist())
+        np.testing.assert_array_equal(values, expected[[2, 1]].to_numpy())
+
+    def test_get_aligned_window_across_windows(self):
+        records = self._gapped_records()
+        self._load_mock_windows(records, 7)
+        expected = self._expected_window(records, 120)
+
+        # Test
+        window = self.data_client.get_aligned_window(120, pretty_px=False)
+
+        # Validate
+        pd.testing.assert_frame_equal(window, expected)
+        last = expected.index[-1]
+        remaining = [r for r in records if r.ts_event > last]
+        count = 0
+        while self.data_client.next_record() is not None:
+            count += 1
+        self.assertEqual(count, len(remaining))
+
+    def test_get_aligned_window_pretty_px(self):
+        records = self._gapped_records()
+        self._load_mock_data(records)
+        self.data_client._index_data()
+        expected = self._expected_window(records, 10, scale=PRICE_FACTOR)
+
+        # Test
+        window = self.data_client.get_aligned_window(10)
+
+        # Validate
+        pd.testing.assert_frame_equal(window, expected)
+
+    def test_get_aligned_window_straddling_windows(self):
+        # The records of the 51st timestamp are split between both windows
+        records = self._records()
+        self._load_mock_windows(records, 2, size=101)
+        expected = self._expected_window(records, 60)
+
+        # Test
+        window = self.data_client.get_aligned_window(60, pretty_px=False)
+
+        # Validate
+        pd.testing.assert_frame_equal(window, expected)
+        self.assertEqual(window[1].dtype, np.int64)
+        self.assertEqual(
+            self.data_client.next_record().ts_event, records[120].ts_event
+        )
+
+    def test_get_aligned_window_reuses_decode(self):
+        records = self._gapped_records()
+        self._load_mock_data(records)
+        self.data_client._index_data()
+
+        # Test
+        self.data_client.get_aligned_window(5, pretty_px=False)
+        self.data_client.get_aligned_window(5, pretty_px=False)
+        self.data_client.next_record()
+
+        # Validate
+        self.assertEqual(self.data_client.data.decode_to_df.call_count, 1)
+        self.assertIsNone(self.data_client._decoded)
+
+    def test_get_aligned_window_not_enough(self):
+        self._load_mock_windows(self._gapped_records(), 3)
+
+        # Test
+        with self.assertRaises(RuntimeError):
+            self.data_client.get_aligned_window(1000, pretty_px=False)
+
+        with self.assertRaises(ValueError):
+            self.data_client.get_aligned_window(0)
+
+    def test_time_slice_stream(self):
+        expected = self._expected_eod_events(self._records())
+        self._load_mock_windows(self._records(), 3)
+        self.data_client.time_slices = True
+
+        # Test
+        self.data_client.notify = Mock()
+        count = 0
+        while self.data_client.data_stream():
+            count += 1
+
+        # Validate
+        calls = self.data_client.notify.call_args_list
+        slices = [c[0][1] for c in calls if c[0][0] == EventType.MARKET_DATA]
+        eod_calls = [c for c in calls if c[0][0] == EventType.EOD_EVENT]
+        self.assertEqual(count, 250)
+        self.assertEqual(len(slices), 250)
+        self.assertEqual(eod_calls, expected)
+        self.assertEqual(calls[-1][0][0], EventType.MARKET_DATA)
+        for event in slices:
+            self.assertIsInstance(event, TimeSliceEvent)
+            self.assertEqual([r.instrument_id for r in event.data], [1, 2])
+            self.assertEqual(
+                {r.ts_event for r in event.data}, {event.timestamp}
+            )
+
+    def test_time_slice_stream_after_primer(self):
+        expected = self._expected_eod_events(self._records(), skip=101)
+        self._load_mock_data(self._records())
+        self.data_client._index_data()
+        self.data_client.time_slices = True
+
+        # Test
+        for _ in range(101):
+            self.data_client.next_record()
+
+        self.data_client.notify = Mock()
+        while self.data_client.data_stream():
+            pass
+
+        # Validate
+        calls = self.data_client.notify.call_args_list
+        slices = [c[0][1] for c in calls if c[0][0] == EventType.MARKET_DATA]
+        eod_calls = [c for c in calls if c[0][0] == EventType.EOD_EVENT]
+        self.assertEqual(len(slices[0].data), 1)
+        self.assertEqual(sum(len(event.data) for event in slices), 399)
+        self.assertEqual(eod_calls, expected)
+
 
 if __name__ == "__main__":
     unittest.main()
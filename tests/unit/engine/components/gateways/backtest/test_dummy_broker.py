@@ -6,7 +6,7 @@ from midas.trade import Trade
 from unittest.mock import Mock, MagicMock
 from midas.account import Account
 from midas.engine.components.observer import EventType
-from midas.orders import Action, MarketOrder
+from midas.orders import Action, MarketOrder, LimitOrder, StopLoss
 from midas.engine.components.gateways.backtest.dummy_broker import DummyBroker
 from midas.symbol import SymbolMap
 from midas.utils.logger import SystemLogger
@@ -158,6 +158,141 @@ class TestDummyClient(unittest.TestCase):
         self.assertTrue(self.dummy_broker._update_trades.called)
         self.assertTrue(self.dummy_broker._set_execution.called)
 
+    def test_place_order_resting(self):
+        order = LimitOrder(Action.LONG, quantity=10, limit_price=85)
+        self.dummy_broker.notify = Mock()
+        self.dummy_broker._fill = Mock()
+
+        # Test
+        order_id = self.dummy_broker.placeOrder(
+            1655000000, 1, 1, Action.LONG, self.hogs.contract, order
+        )
+
+        # Validate
+        self.dummy_broker._fill.assert_not_called()
+        self.assertIn(order_id, self.dummy_broker.matching_engine.orders)
+        event_type, active_order = self.dummy_broker.notify.call_args[0]
+        self.assertEqual(event_type, EventType.ORDER_UPDATE)
+        self.assertEqual(active_order.orderId, order_id)
+        self.assertEqual(active_order.status, "Submitted")
+        self.assertEqual(active_order.instrument, 1)
+
+    def test_match_orders(self):
+        limit = LimitOrder(Action.LONG, quantity=10, limit_price=85)
+        stop = StopLoss(Action.SELL, quantity=10, aux_price=70)
+        self.dummy_broker.notify = Mock()
+        self.dummy_broker._fill = Mock()
+        self.dummy_broker.placeOrder(
+            1655000000, 1, 1, Action.LONG, self.hogs.contract, limit
+        )
+        self.dummy_broker.placeOrder(
+            1655000000, 2, 1, Action.SELL, self.hogs.contract, stop
+        )
+        bar = OhlcvMsg(
+            instrument_id=1,
+            ts_event=1707221160000000000,
+            open=int(90 * 1e9),
+            close=int(84 * 1e9),
+            high=int(90 * 1e9),
+            low=int(80 * 1e9),
+            volume=880000,
+        )
+
+        # Test
+        self.dummy_broker.match_orders(bar)
+
+        # Validate
+        self.dummy_broker._fill.assert_called_once_with(
+            1707221160000000000, 1, 1, Action.LONG, self.hogs, 10, 85, -8.5
+        )
+        self.assertEqual(
+            self.dummy_broker.notify.call_args[0][1].status, "Filled"
+        )
+        self.assertEqual(len(self.dummy_broker.matching_engine), 1)
+
+    def test_cancel_order(self):
+        order = LimitOrder(Action.LONG, quantity=10, limit_price=85)
+        self.dummy_broker.notify = Mock()
+        order_id = self.dummy_broker.placeOrder(
+            1655000000, 1, 1, Action.LONG, self.hogs.contract, order
+        )
+
+        # Test
+        cancelled = self.dummy_broker.cancel_order(order_id)
+        missing = self.dummy_broker.cancel_order(order_id)
+
+        # Validate
+        self.assertTrue(cancelled)
+        self.assertFalse(missing)
+        self.assertEqual(len(self.dummy_broker.matching_engine), 0)
+        self.assertEqual(
+            self.dummy_broker.notify.call_args[0][1].status, "Cancelled"
+        )
+
+    def test_place_order_latency(self):
+        self.dummy_broker.order_latency = {"CME": 500, "default": 100}
+        self.dummy_broker._fill = Mock()
+        self.order_book.retrieve.return_value = OhlcvMsg(
+            instrument_id=1,
+            ts_event=1707221160000000000,
+            open=int(80 * 1e9),
+            close=int(80 * 1e9),
+            high=int(80 * 1e9),
+            low=int(80 * 1e9),
+            volume=880000,
+        )
+        hogs_order = MarketOrder(Action.LONG, quantity=10)
+        aapl_order = MarketOrder(Action.SHORT, quantity=5)
+
+        # Test
+        self.dummy_broker.placeOrder(
+            1000, 1, 1, Action.LONG, self.hogs.contract, hogs_order
+        )
+        self.dummy_broker.placeOrder(
+            1000, 1, 2, Action.SHORT, self.aapl.contract, aapl_order
+        )
+        queued = len(self.dummy_broker.pending_orders)
+        self.dummy_broker.release_orders(1099)
+        early = self.dummy_broker._fill.call_count
+        self.dummy_broker.release_orders(1100)
+        self.dummy_broker.release_orders(1600)
+
+        # Validate
+        self.assertEqual(queued, 2)
+        self.assertEqual(early, 0)
+        self.assertEqual(self.dummy_broker.pending_orders, [])
+        fills = self.dummy_broker._fill.call_args_list
+        self.assertEqual(
+            [call[0][:3] for call in fills], [(1100, 1, 2), (1600, 1, 1)]
+        )
+
+    def test_release_orders_in_placement_order(self):
+        self.dummy_broker.order_latency = {"default": 100}
+        self.dummy_broker._fill_market_orders = Mock()
+        orders = [MarketOrder(Action.LONG, quantity=i) for i in (1, 2, 3)]
+
+        # Test
+        self.dummy_broker.placeOrder(
+            1050, 1, 1, Action.LONG, self.aapl.contract, orders[0]
+        )
+        self.dummy_broker.placeOrder(
+            1000, 2, 1, Action.LONG, self.aapl.contract, orders[1]
+        )
+        self.dummy_broker.placeOrder(
+            1000, 3, 1, Action.LONG, self.aapl.contract, orders[2]
+        )
+        self.dummy_broker.release_orders(2000)
+
+        # Validate
+        timestamp, released = self.dummy_broker._fill_market_orders.call_args[
+            0
+        ]
+        self.assertEqual(timestamp, 2000)
+        self.assertEqual(
+            [order for *_, order in released],
+            [orders[1], orders[2], orders[0]],
+        )
+
     def test_update_positions_update(self):
         symbol = self.symbols_map.get_symbol("AAPL")
         contract = symbol.contract
@@ -294,6 +429,82 @@ class TestDummyClient(unittest.TestCase):
         # Validate
         self.assertEqual(self.dummy_broker.account, expected_account)
 
+    def _set_marked_positions(self) -> dict:
+        prices = {1: 10, 2: 10}
+        self.order_book.retrieve.side_effect = lambda instrument_id: OhlcvMsg(
+            instrument_id=instrument_id,
+            ts_event=1777700000000000,
+            open=0,
+            close=int(prices[instrument_id] * 1e9),
+            high=0,
+            low=0,
+            volume=0,
+        )
+        self.order_book.last_updated = 1777700000000000
+
+        hogs_contract = self.symbols_map.get_symbol("HEJ4").contract
+        self.dummy_broker.positions[hogs_contract] = FuturePosition(
+            action="BUY",
+            avg_price=10,
+            quantity=80,
+            quantity_multiplier=400000,
+            price_multiplier=0.01,
+            market_price=10,
+            initial_margin=5000,
+        )
+        aapl_contract = self.symbols_map.get_symbol("AAPL").contract
+        self.dummy_broker.positions[aapl_contract] = EquityPosition(
+            action="SELL",
+            avg_price=10,
+            quantity=-100,
+            quantity_multiplier=1,
+            price_multiplier=1,
+            market_price=10,
+        )
+        self.dummy_broker._update_account()
+        return prices
+
+    def test_mark_instrument(self):
+        prices = self._set_marked_positions()
+        prices[1] = 90.25
+        prices[2] = 12.5
+
+        # Test
+        self.dummy_broker.mark_instrument(1)
+        self.dummy_broker.mark_instrument(2)
+        marked = Account(**vars(self.dummy_broker.account))
+
+        # Validate
+        self.assertTrue(self.dummy_broker._reconcile())
+        self.assertEqual(marked, self.dummy_broker.account)
+        self.assertNotEqual(marked.unrealized_pnl, 0)
+
+    def test_mark_instrument_without_position(self):
+        self._set_marked_positions()
+        self.dummy_broker.positions.clear()
+        self.order_book.last_updated = 1777700000000001
+        retrieved = self.order_book.retrieve.call_count
+
+        # Test
+        self.dummy_broker.mark_instrument(1)
+
+        # Validate
+        self.assertEqual(self.dummy_broker.account.timestamp, 1777700000000001)
+        self.assertEqual(self.order_book.retrieve.call_count, retrieved)
+
+    def test_mark_instrument_reconcile(self):
+        prices = self._set_marked_positions()
+        self.dummy_broker.reconcile_every = 2
+        self.dummy_broker._reconcile = Mock(return_value=True)
+
+        # Test
+        for price in (11, 12, 13, 14, 15):
+            prices[1] = price
+            self.dummy_broker.mark_instrument(1)
+
+        # Validate
+        self.assertEqual(self.dummy_broker._reconcile.call_count, 2)
+
     def test_update_trades(self):
         timestamp = 1651500000
         trade_id = 1
@@ -0,0 +1,171 @@
+import unittest
+from datetime import time
+from mbn import OhlcvMsg, BboMsg, Side, BidAskPair
+from midas.orders import Action, LimitOrder, StopLoss, MarketOrder
+from midas.engine.components.gateways.backtest.matching_engine import (
+    MatchingEngine,
+)
+from midas.symbol import (
+    Equity,
+    Currency,
+    Venue,
+    Industry,
+    SecurityType,
+    TradingSession,
+)
+
+
+def bar(low: float, high: float, instrument_id: int = 1) -> OhlcvMsg:
+    return OhlcvMsg(
+        instrument_id=instrument_id,
+        ts_event=1707221160000000000,
+        open=int(low * 1e9),
+        high=int(high * 1e9),
+        low=int(low * 1e9),
+        close=int(high * 1e9),
+        volume=100,
+    )
+
+
+class TestMatchingEngine(unittest.TestCase):
+    def setUp(self) -> None:
+        self.symbol = Equity(
+            instrument_id=1,
+            broker_ticker="AAPL",
+            data_ticker="AAPL2",
+            midas_ticker="AAPL",
+            security_type=SecurityType.STOCK,
+            currency=Currency.USD,
+            exchange=Venue.NASDAQ,
+            fees=0.1,
+            initial_margin=0,
+            quantity_multiplier=1,
+            price_multiplier=1,
+            company_name="Apple Inc.",
+            industry=Industry.TECHNOLOGY,
+            market_cap=10000000000.99,
+            shares_outstanding=1937476363,
+            slippage_factor=10,
+            trading_sessions=TradingSession(
+                day_open=time(9, 0), day_close=time(14, 0)
+            ),
+        )
+        self.engine = MatchingEngine()
+
+    def _add(self, order):
+        return self.engine.add(1, 1, 1, Action.LONG, self.symbol, order)
+
+    def test_add_assigns_ids(self):
+        # Test
+        first = self._add(LimitOrder(Action.LONG, 10, 99.5))
+        second = self._add(StopLoss(Action.SELL, 10, 95))
+
+        # Validate
+        self.assertEqual((first.order_id, second.order_id), (1, 2))
+        self.assertEqual(first.price, 99_500_000_000)
+        self.assertEqual(len(self.engine), 2)
+
+    def test_add_market_order(self):
+        with self.assertRaises(ValueError):
+            self._add(MarketOrder(Action.LONG, 10))
+
+    def test_match_limits(self):
+        buy_high = self._add(LimitOrder(Action.LONG, 10, 99))
+        buy_low = self._add(LimitOrder(Action.LONG, 10, 97))
+        sell = self._add(LimitOrder(Action.SELL, 10, 101))
+        sell_far = self._add(LimitOrder(Action.SELL, 10, 105))
+
+        # Test
+        untouched = self.engine.match(bar(99.5, 100.5))
+        first = self.engine.match(bar(98, 101))
+        second = self.engine.match(bar(96, 104))
+
+        # Validate
+        self.assertEqual(untouched, [])
+        self.assertEqual(first, [buy_high, sell])
+        self.assertEqual(second, [buy_low])
+        self.assertEqual(list(self.engine.orders), [sell_far.order_id])
+
+    def test_match_stops(self):
+        buy_stop = self._add(StopLoss(Action.COVER, 10, 102))
+        sell_stop = self._add(StopLoss(Action.SELL, 10, 98))
+
+        # Test
+        untouched = self.engine.match(bar(98.5, 101.5))
+        crossed = self.engine.match(bar(97, 103))
+
+        # Validate
+        self.assertEqual(untouched, [])
+        self.assertEqual(crossed, [buy_stop, sell_stop])
+
+    def test_match_bbo(self):
+        buy = self._add(LimitOrder(Action.LONG, 10, 100))
+        sell = self._add(LimitOrder(Action.SELL, 10, 101))
+        tick = BboMsg(
+            instrument_id=1,
+            ts_event=1707221160000000000,
+            price=int(100.5 * 1e9),
+            size=1,
+            side=Side.NONE,
+            flags=0,
+            ts_recv=1707221160000000000,
+            sequence=0,
+            levels=[
+                BidAskPair(
+                    bid_px=int(99.5 * 1e9),
+                    ask_px=int(100 * 1e9),
+                    bid_sz=1,
+                    ask_sz=1,
+                    bid_ct=1,
+                    ask_ct=1,
+                )
+            ],
+        )
+
+        # Test
+        crossed = self.engine.match(tick)
+
+        # Validate
+        self.assertEqual(crossed, [buy])
+        self.assertIn(sell.order_id, self.engine.orders)
+
+    def test_match_other_instrument(self):
+        self._add(LimitOrder(Action.LONG, 10, 99))
+
+        # Validate
+        self.assertEqual(self.engine.match(bar(90, 110, instrument_id=2)), [])
+
+    def test_cancel(self):
+        cancelled = self._add(LimitOrder(Action.LONG, 10, 99))
+        kept = self._add(LimitOrder(Action.LONG, 10, 98))
+
+        # Test
+        result = self.engine.cancel(cancelled.order_id)
+        missing = self.engine.cancel(cancelled.order_id)
+        crossed = self.engine.match(bar(90, 110))
+
+        # Validate
+        self.assertEqual(result, cancelled)
+        self.assertIsNone(missing)
+        self.assertEqual(crossed, [kept])
+        self.assertEqual(self.engine._stale, 0)
+
+    def test_cancel_compacts(self):
+        orders = [
+            self._add(LimitOrder(Action.LONG, 10, 50 + i * 0.01))
+            for i in range(3000)
+        ]
+
+        # Test
+        for resting in orders[:2000]:
+            self.engine.cancel(resting.order_id)
+
+        # Validate
+        heaps = self.engine._heaps[1]
+        self.assertLess(len(heaps[0]), 3000)
+        self.assertEqual(len(self.engine.match(bar(1, 1000))), 1000)
+        self.assertEqual(len(self.engine), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
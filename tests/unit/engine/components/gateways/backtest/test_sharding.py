@@ -0,0 +1,184 @@
+import unittest
+import pandas as pd
+from types import SimpleNamespace
+from unittest.mock import Mock, MagicMock, patch
+from mbn import OhlcvMsg
+from midas.utils.unix import iso_to_unix
+from midas.utils.logger import SystemLogger
+from midas.symbol import SymbolMap
+from midas.engine.components.gateways.backtest.data_client import DataClient
+from midas.engine.components.gateways.backtest.sharding import (
+    MergedStore,
+    shard_requests,
+)
+
+HOUR = 3_600_000_000_000
+DATABASE_IDS = {"HE.n.0": 43, "ZC.n.0": 70, "LE.n.0": 12}
+
+
+class StubStore:
+    """
+    Stand-in for a BufferStore over the given records.
+    """
+
+    def __init__(self, records: list, mappings: dict):
+        self.records = records
+        self.position = 0
+        self.metadata = SimpleNamespace(
+            mappings=SimpleNamespace(get_ticker=mappings.get)
+        )
+
+    def replay(self):
+        if self.position >= len(self.records):
+            return None
+        self.position += 1
+        return self.records[self.position - 1]
+
+    def decode_to_df(self, pretty_ts: bool = False, pretty_px: bool = False):
+        return pd.DataFrame(
+            {
+                "instrument_id": [r.instrument_id for r in self.records],
+                "ts_event": [r.ts_event for r in self.records],
+                "close": [r.close for r in self.records],
+            }
+        )
+
+
+def stub_records(params) -> StubStore:
+    # Bars every 2 hours per ticker, HE and ZC sharing timestamps, ordered by (ts_event, instrument_id)
+    records = []
+    for ticker in params.tickers:
+        offset = HOUR if ticker == "LE.n.0" else 0
+        for ts in range(
+            iso_to_unix(params.start) + offset,
+            iso_to_unix(params.end),
+            2 * HOUR,
+        ):
+            records.append(
+                OhlcvMsg(
+                    instrument_id=DATABASE_IDS[ticker],
+                    ts_event=ts,
+                    open=0,
+                    high=0,
+                    low=0,
+                    close=DATABASE_IDS[ticker] + ts // HOUR,
+                    volume=0,
+                )
+            )
+    records.sort(key=lambda r: (r.ts_event, r.instrument_id))
+    mappings = {DATABASE_IDS[t]: t for t in params.tickers}
+    return StubStore(records, mappings)
+
+
+@patch(
+    "midas.engine.components.gateways.backtest.data_client.RetrieveParams",
+    lambda tickers, start, end, schema: SimpleNamespace(
+        tickers=tickers, start=start, end=end, schema=schema
+    ),
+)
+class TestSharding(unittest.TestCase):
+    def setUp(self) -> None:
+        # Mock Logger
+        logger = SystemLogger()
+        logger.get_logger = MagicMock()
+
+        self.db_client = Mock()
+        self.db_client.historical.get_records.side_effect = stub_records
+        self.tickers = ["ZC.n.0", "HE.n.0", "LE.n.0"]
+
+    def _replay(self, store) -> list:
+        records = []
+        while (record := store.replay()) is not None:
+            records.append(
+                (
+                    record.ts_event,
+                    store.metadata.mappings.get_ticker(record.instrument_id),
+                    record.close,
+                )
+            )
+        return records
+
+    def _get_data(self, shard_by: str):
+        data_client = DataClient(self.db_client, SymbolMap(), None, shard_by)
+        return data_client.get_data(
+            self.tickers,
+            "2024-01-25",
+            "2024-03-05",
+            "ohlcv-1h",
+        )
+
+    def test_shard_requests(self):
+        # Test
+        shards = shard_requests(
+            ["HE", "ZC"],
+            "2024-01-25",
+            "2024-03-05",
+            "ticker_month",
+        )
+
+        # Validate
+        self.assertEqual(
+            shards,
+            [
+                (["HE"], "2024-01-25", "2024-02-01"),
+                (["ZC"], "2024-01-25", "2024-02-01"),
+                (["HE"], "2024-02-01", "2024-03-01"),
+                (["ZC"], "2024-02-01", "2024-03-01"),
+                (["HE"], "2024-03-01", "2024-03-05"),
+                (["ZC"], "2024-03-01", "2024-03-05"),
+            ],
+        )
+
+    def test_shard_requests_invalid(self):
+        with self.assertRaises(ValueError):
+            shard_requests(["HE"], "2024-01-01", "2024-02-01", "week")
+
+    def test_merged_matches_single_request(self):
+        expected = self._replay(self._get_data(""))
+        expected_df = self._get_data("").decode_to_df()
+
+        for shard_by in ("ticker", "month", "ticker_month"):
+            with self.subTest(shard_by=shard_by):
+                # Test
+                merged = self._get_data(shard_by)
+
+                # Validate
+                self.assertIsInstance(merged, MergedStore)
+                self.assertEqual(self._replay(merged), expected)
+                pd.testing.assert_frame_equal(
+                    merged.decode_to_df(),
+                    expected_df,
+                )
+
+    def test_conflicting_instrument_ids(self):
+        def bar(ts: int, close: int) -> OhlcvMsg:
+            return OhlcvMsg(
+                instrument_id=1,
+                ts_event=ts,
+                open=0,
+                high=0,
+                low=0,
+                close=close,
+                volume=0,
+            )
+
+        first = StubStore([bar(10, 1), bar(30, 3)], {1: "HE.n.0"})
+        second = StubStore([bar(20, 2), bar(30, 4)], {1: "ZC.n.0"})
+
+        # Test
+        merged = MergedStore([first, second])
+
+        # Validate
+        self.assertEqual(
+            self._replay(merged),
+            [
+                (10, "HE.n.0", 1),
+                (20, "ZC.n.0", 2),
+                (30, "HE.n.0", 3),
+                (30, "ZC.n.0", 4),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
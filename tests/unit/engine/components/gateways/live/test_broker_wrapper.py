@@ -15,6 +15,7 @@ from midas.utils.logger import SystemLogger
 from midas.engine.components.gateways.live.broker_client.wrapper import (
     BrokerApp,
 )
+from midas.engine.components.gateways.live.runtime import LiveRuntime
 from midas.symbol import (
     Equity,
     Currency,
@@ -240,6 +241,27 @@ class TestBrokerApp(unittest.TestCase):
         time.sleep(3)
         self.broker_app.process_account_updates.assert_called_once()
 
+    def test_updateAccountValue_runtime(self):
+        runtime = LiveRuntime()
+        self.broker_app.set_runtime(runtime)
+        observer = Mock()
+        self.broker_app.attach(observer, EventType.ACCOUNT_UPDATE)
+
+        # Test
+        for _ in range(3):
+            self.broker_app.updateAccountValue(
+                "UnrealizedPnL", "100.0", "USD", "DU12345"
+            )
+        runtime.loop.call_later(2.1, runtime.stop)
+        runtime.run()
+
+        # Validate
+        self.assertIsNone(self.broker_app.account_update_timer)
+        self.assertEqual(observer.handle_event.call_count, 1)
+        self.assertEqual(
+            observer.handle_event.call_args[0][1], EventType.ACCOUNT_UPDATE
+        )
+
     def test_process_account_updates(self):
         self.broker_app.account_update_timer = True
         self.broker_app.notify = Mock()
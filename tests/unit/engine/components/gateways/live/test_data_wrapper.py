@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import Mock, MagicMock
 from midas.engine.components.observer.base import EventType
 from midas.engine.components.gateways.live.data_client.wrapper import DataApp
+from midas.engine.components.gateways.live.runtime import LiveRuntime
 from midas.utils.logger import SystemLogger
 from mbn import OhlcvMsg, BboMsg, BidAskPair, Side
 
@@ -156,6 +157,43 @@ class TestDataApp(unittest.TestCase):
     def test_push_market_event(self):
         pass
 
+    def test_runtime_tick_push(self):
+        runtime = LiveRuntime()
+        self.data_app.update_interval = 0.01
+        self.data_app.set_runtime(runtime)
+        self.data_app.tick_data = {1: Mock()}
+        observer = Mock()
+        self.data_app.attach(observer, EventType.MARKET_DATA)
+
+        # Test
+        runtime.loop.call_later(0.055, runtime.stop)
+        runtime.run()
+
+        # Validate
+        self.assertGreaterEqual(observer.handle_event.call_count, 1)
+        observer.handle_event.assert_called_with(
+            self.data_app,
+            EventType.MARKET_DATA,
+            self.data_app.tick_data[1],
+        )
+
+    def test_runtime_notify_handoff(self):
+        runtime = LiveRuntime()
+        self.data_app.set_runtime(runtime)
+        observer = Mock()
+        self.data_app.attach(observer, EventType.MARKET_DATA)
+
+        # Test
+        self.data_app.notify(EventType.MARKET_DATA, 1)
+
+        # Validate
+        self.assertEqual(observer.handle_event.call_count, 0)
+        runtime.stop()
+        runtime.run()
+        observer.handle_event.assert_called_once_with(
+            self.data_app, EventType.MARKET_DATA, 1
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,89 @@
+import threading
+import unittest
+from unittest.mock import MagicMock
+from midas.utils.logger import SystemLogger
+from midas.engine.components.gateways.live.runtime import LiveRuntime
+
+
+class TestLiveRuntime(unittest.TestCase):
+    def setUp(self) -> None:
+        # Mock Logger
+        logger = SystemLogger()
+        logger.get_logger = MagicMock()
+
+        self.runtime = LiveRuntime()
+
+    def tearDown(self) -> None:
+        if not self.runtime.loop.is_closed():
+            self.runtime.loop.close()
+
+    def test_call_soon_from_thread(self):
+        threads = []
+
+        def producer():
+            for i in range(100):
+                self.runtime.call_soon(
+                    lambda i: threads.append((i, threading.get_ident())), i
+                )
+            self.runtime.stop()
+
+        # Test
+        thread = threading.Thread(target=producer)
+        self.runtime.loop.call_soon(thread.start)
+        self.runtime.run()
+        thread.join()
+
+        # Validate
+        self.assertEqual([i for i, _ in threads], list(range(100)))
+        self.assertEqual(
+            {ident for _, ident in threads}, {threading.get_ident()}
+        )
+        self.assertEqual(self.runtime.callback_latency.count, 100)
+        self.assertTrue(self.runtime.loop.is_closed())
+
+    def test_call_soon_before_run(self):
+        received = []
+
+        # Test
+        self.runtime.call_soon(received.append, 1)
+        self.runtime.stop()
+        self.runtime.run()
+
+        # Validate
+        self.assertEqual(received, [1])
+
+    def test_call_later_debounce(self):
+        received = []
+
+        # Test
+        for i in range(5):
+            self.runtime.call_later(
+                "account", 0.01, lambda: received.append(1)
+            )
+        self.runtime.loop.call_later(0.1, self.runtime.stop)
+        self.runtime.run()
+
+        # Validate
+        self.assertEqual(received, [1])
+
+    def test_every_and_shutdown(self):
+        ticks = []
+        shutdown = []
+
+        async def on_shutdown():
+            shutdown.append(len(ticks))
+
+        self.runtime.every(0.01, lambda: ticks.append(1))
+
+        # Test
+        self.runtime.loop.call_later(0.105, self.runtime.stop)
+        self.runtime.run(on_shutdown)
+
+        # Validate
+        self.assertGreaterEqual(len(ticks), 3)
+        self.assertLessEqual(len(ticks), 11)
+        self.assertEqual(shutdown, [len(ticks)])
+
+
+if __name__ == "__main__":
+    unittest.main()
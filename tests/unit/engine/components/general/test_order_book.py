@@ -2,7 +2,7 @@ import unittest
 from midas.utils.logger import SystemLogger
 from datetime import time
 from unittest.mock import Mock, MagicMock
-from midas.engine.events import MarketEvent
+from midas.engine.events import MarketEvent, TimeSliceEvent
 from midas.engine.components.order_book import OrderBook
 from midas.engine.components.observer import EventType
 from mbn import OhlcvMsg, BboMsg, Side, BidAskPair
@@ -152,6 +152,120 @@ class TestOrderBook(unittest.TestCase):
         self.assertEqual(args[0], EventType.ORDER_BOOK)
         self.assertEqual(args[1], market_event)
 
+    def test_handle_event_reuses_view(self):
+        received = []
+        self.order_book.notify = Mock(
+            side_effect=lambda event_type, event: received.append(
+                (id(event), event.timestamp, event.data)
+            )
+        )
+
+        # Test
+        self.order_book.handle_event(Mock(), EventType.MARKET_DATA, self.bar)
+        self.order_book.handle_event(Mock(), EventType.MARKET_DATA, self.tick)
+
+        # Validate
+        self.assertEqual(received[0][0], received[1][0])
+        self.assertEqual(received[0][1:], (self.timestamp, self.bar))
+        self.assertEqual(received[1][1:], (self.timestamp, self.tick))
+
+    def test_tickers_loaded(self):
+        unknown = OhlcvMsg(
+            instrument_id=99,
+            ts_event=self.timestamp,
+            open=1,
+            close=1,
+            high=1,
+            low=1,
+            volume=1,
+        )
+        self.order_book.notify = Mock()
+
+        # Test
+        self.order_book.handle_event(Mock(), EventType.MARKET_DATA, self.bar)
+        self.order_book.handle_event(Mock(), EventType.MARKET_DATA, self.bar)
+        self.order_book.handle_event(Mock(), EventType.MARKET_DATA, unknown)
+        partial = self.order_book.tickers_loaded
+        self.order_book.handle_event(Mock(), EventType.MARKET_DATA, self.tick)
+
+        # Validate
+        self.assertFalse(partial)
+        self.assertTrue(self.order_book.tickers_loaded)
+
+    def test_tickers_loaded_late_add(self):
+        symbols_map = SymbolMap()
+        symbols_map.add_symbol(self.symbols_map.map[1])
+        order_book = OrderBook(symbols_map)
+        order_book.notify = Mock()
+
+        # Test
+        order_book.handle_event(Mock(), EventType.MARKET_DATA, self.tick)
+        before_add = order_book.tickers_loaded
+        symbols_map.add_symbol(self.symbols_map.map[2])
+        order_book.handle_event(Mock(), EventType.MARKET_DATA, self.bar)
+
+        # Validate
+        self.assertFalse(before_add)
+        self.assertTrue(order_book.tickers_loaded)
+
+    def test_tickers_loaded_added_before_record(self):
+        symbols_map = SymbolMap()
+        symbols_map.add_symbol(self.symbols_map.map[1])
+        order_book = OrderBook(symbols_map)
+        order_book.notify = Mock()
+
+        # Test
+        symbols_map.add_symbol(self.symbols_map.map[2])
+        order_book.handle_event(Mock(), EventType.MARKET_DATA, self.bar)
+        partial = order_book.tickers_loaded
+        order_book.handle_event(Mock(), EventType.MARKET_DATA, self.tick)
+
+        # Validate
+        self.assertFalse(partial)
+        self.assertTrue(order_book.tickers_loaded)
+
+    def test_tickers_loaded_empty_map(self):
+        symbols_map = SymbolMap()
+        order_book = OrderBook(symbols_map)
+        order_book.notify = Mock()
+
+        # Test
+        empty = order_book.check_tickers_loaded()
+        order_book.handle_event(Mock(), EventType.MARKET_DATA, self.bar)
+        no_symbols = order_book.tickers_loaded
+        symbols_map.add_symbol(self.symbols_map.map[1])
+        order_book.handle_event(Mock(), EventType.MARKET_DATA, self.bar)
+
+        # Validate
+        self.assertFalse(empty)
+        self.assertFalse(no_symbols)
+        self.assertTrue(order_book.tickers_loaded)
+
+    def test_handle_event_time_slice(self):
+        time_slice = TimeSliceEvent(self.timestamp, [self.bar, self.tick])
+        self.order_book.notify = Mock()
+
+        # Test
+        self.order_book.handle_event(
+            Mock(),
+            EventType.MARKET_DATA,
+            time_slice,
+        )
+
+        # Validate
+        self.assertEqual(
+            self.order_book.book,
+            {
+                self.bar.instrument_id: self.bar,
+                self.tick.instrument_id: self.tick,
+            },
+        )
+        self.assertTrue(self.order_book.tickers_loaded)
+        self.order_book.notify.assert_called_once_with(
+            EventType.ORDER_BOOK,
+            time_slice,
+        )
+
     def test_retrieve(self):
         self.order_book.book = {
             self.bar.instrument_id: self.bar,
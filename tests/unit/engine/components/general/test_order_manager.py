@@ -210,7 +210,9 @@ class TestOrderManager(unittest.TestCase):
         self.mock_portfolio_server.account.full_init_margin_req = 1000
         self.mock_portfolio_server.account.full_available_funds = 50000
         self.order_manager._set_order = MagicMock()
-        self.mock_order_book.retrieve.return_value = 10  # current price
+        self.mock_order_book.retrieve.return_value = Mock(
+            pretty_price=10
+        )  # current price
 
         # Test Order Set b/c funds available
         self.order_manager._handle_signal(
@@ -227,7 +229,7 @@ class TestOrderManager(unittest.TestCase):
         self.mock_portfolio_server.account.full_init_margin_req = 1000
         self.mock_portfolio_server.account.full_available_funds = 100
         self.order_manager._set_order = MagicMock()
-        self.mock_order_book.retrieve.return_value = 10
+        self.mock_order_book.retrieve.return_value = Mock(pretty_price=10)
 
         # Test Order set b/c no funds currently available
         self.order_manager._handle_signal(
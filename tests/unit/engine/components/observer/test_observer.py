@@ -71,6 +71,21 @@ class ChildObserver(Observer):
             self.tester = 5
 
 
+class TypedObserver(Observer):
+    def __init__(self) -> None:
+        self.received = []
+        self.fallback = []
+
+    def event_handlers(self):
+        return {EventType.MARKET_DATA: self.handle_market_data}
+
+    def handle_market_data(self, value):
+        self.received.append(value)
+
+    def handle_event(self, subject, event_type: EventType, *args):
+        self.fallback.append((event_type, args))
+
+
 class ChildSubject(Subject):
     def __init__(self):
         super().__init__()
@@ -141,6 +156,32 @@ class TestSubject(unittest.TestCase):
         self.subject.notify(EventType.ACCOUNT_UPDATE)
         self.assertEqual(self.observer.tester, 3)
 
+    def test_notify_typed_handler(self):
+        observer = TypedObserver()
+        self.subject.attach(observer, EventType.MARKET_DATA)
+        self.subject.attach(observer, EventType.ACCOUNT_UPDATE)
+
+        # Test
+        self.subject.notify(EventType.MARKET_DATA, 1)
+        self.subject.notify(EventType.ACCOUNT_UPDATE, 2)
+
+        # Validate
+        self.assertEqual(observer.received, [1])
+        self.assertEqual(observer.fallback, [(EventType.ACCOUNT_UPDATE, (2,))])
+
+    def test_notify_after_detach(self):
+        observer = TypedObserver()
+        self.subject.attach(observer, EventType.MARKET_DATA)
+        self.subject.attach(self.observer, EventType.MARKET_DATA)
+        self.subject.detach(observer, EventType.MARKET_DATA)
+
+        # Test
+        self.subject.notify(EventType.MARKET_DATA)
+
+        # Validate
+        self.assertEqual(observer.received, [])
+        self.assertEqual(self.observer.tester, 4)
+
 
 if __name__ == "__main__":
     unittest.main()
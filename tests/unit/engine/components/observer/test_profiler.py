@@ -0,0 +1,118 @@
+import unittest
+from midas.engine.components.observer.base import EventType, Observer, Subject
+from midas.engine.components.observer.profiler import (
+    EventBusProfiler,
+    LatencyHistogram,
+)
+
+
+class Relay(Subject, Observer):
+    def __init__(self):
+        super().__init__()
+
+    def event_handlers(self):
+        return {EventType.MARKET_DATA: self.handle_market_data}
+
+    def handle_market_data(self, value):
+        self.notify(EventType.ORDER_BOOK, value)
+
+    def handle_event(self, subject, event_type: EventType, *args):
+        pass
+
+
+class Sink(Observer):
+    def __init__(self):
+        self.received = []
+
+    def handle_event(self, subject, event_type: EventType, value):
+        self.received.append(value)
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+
+        # Test
+        for value in range(1, 1001):
+            histogram.record(value * 1000)
+
+        # Validate
+        self.assertEqual(histogram.count, 1000)
+        self.assertEqual(histogram.max, 1_000_000)
+        self.assertAlmostEqual(histogram.percentile(50), 500_000, delta=31250)
+        self.assertAlmostEqual(histogram.percentile(99), 990_000, delta=61875)
+        self.assertEqual(histogram.percentile(100), 1_000_000)
+
+    def test_small_values_exact(self):
+        histogram = LatencyHistogram()
+
+        # Test
+        for value in (0, 3, 3, 15):
+            histogram.record(value)
+
+        # Validate
+        self.assertEqual(histogram.percentile(50), 3)
+        self.assertEqual(histogram.percentile(100), 15)
+
+    def test_empty(self):
+        self.assertEqual(LatencyHistogram().percentile(99), 0)
+
+
+class TestEventBusProfiler(unittest.TestCase):
+    def _build(self, profiler: EventBusProfiler = None):
+        source = Subject()
+        relay = Relay()
+        sink = Sink()
+        source.profiler = profiler
+        relay.profiler = profiler
+        source.attach(relay, EventType.MARKET_DATA)
+        relay.attach(sink, EventType.ORDER_BOOK)
+        return source, relay, sink
+
+    def test_records_edges(self):
+        profiler = EventBusProfiler()
+        source, _, sink = self._build(profiler)
+
+        # Test
+        for value in range(10):
+            source.notify(EventType.MARKET_DATA, value)
+
+        # Validate
+        edges = profiler.edges
+        relay_edge = edges[("Subject", "MARKET_DATA", "Relay")]
+        sink_edge = edges[("Relay", "ORDER_BOOK", "Sink")]
+        self.assertEqual(sink.received, list(range(10)))
+        self.assertEqual(relay_edge.calls, 10)
+        self.assertEqual(sink_edge.calls, 10)
+        self.assertEqual(
+            relay_edge.self_ns,
+            relay_edge.latency.total - sink_edge.latency.total,
+        )
+        self.assertIn("ORDER_BOOK", profiler.summary())
+
+    def test_disabled_not_wrapped(self):
+        source, relay, _ = self._build()
+
+        # Validate
+        self.assertEqual(
+            source._dispatch[EventType.MARKET_DATA],
+            (relay.handle_market_data,),
+        )
+
+    def test_profiler_per_subject(self):
+        profiler = EventBusProfiler()
+        self._build(profiler)
+
+        # Test
+        source, relay, _ = self._build()
+
+        # Validate
+        self.assertIsNone(source.profiler)
+        self.assertEqual(
+            source._dispatch[EventType.MARKET_DATA],
+            (relay.handle_market_data,),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
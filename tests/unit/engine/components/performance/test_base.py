@@ -6,7 +6,7 @@ from unittest.mock import Mock, MagicMock
 from midas.symbol import SymbolMap
 from midas.utils.logger import SystemLogger
 from midas.account import Account, EquityDetails
-from midas.engine.components.observer import EventType
+from midas.engine.components.observer import EventType, Subject
 from midas.engine.components.performance.base import PerformanceManager
 from midas.engine.config import Parameters, Mode, LiveDataType
 from midas.trade import Trade
@@ -272,6 +272,30 @@ class TestPerformanceManager(unittest.TestCase):
         data = self.manager.signal_manager.signals[-1]
         self.assertEqual(data, signal)
 
+    def test_manager_replaced_after_attach(self):
+        subject = Subject()
+        subject.attach(self.manager, EventType.EQUITY_VALUE_UPDATE)
+        subject.attach(self.manager, EventType.SIGNAL)
+        equity_data = EquityDetails(
+            timestamp=1709282000000000,
+            equity_value=123456765432,
+        )
+        signal = Mock()
+
+        # Test
+        self.manager.equity_manager = Mock()
+        self.manager.signal_manager = Mock()
+        subject.notify(EventType.EQUITY_VALUE_UPDATE, equity_data)
+        subject.notify(EventType.SIGNAL, signal)
+
+        # Validate
+        self.manager.equity_manager.update_equity.assert_called_once_with(
+            equity_data
+        )
+        self.manager.signal_manager.update_signals.assert_called_once_with(
+            signal
+        )
+
     def test_save_backtest(self):
         # Trades
         self.manager.trade_manager.trades = {
@@ -0,0 +1,79 @@
+import unittest
+from midas.engine.components.performance.equity_curve import (
+    EquityCurveBuffer,
+)
+
+HOUR = 3_600_000_000_000
+DAY_START = 1713931200000000000  # 2024-04-24 00:00 EST
+
+
+class TestEquityCurveBuffer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.buffer = EquityCurveBuffer(capacity=1)
+        self.samples = [
+            (DAY_START + HOUR, 100.0),
+            (DAY_START + HOUR, 101.0),
+            (DAY_START + 2 * HOUR, 102.5),
+            (DAY_START + 25 * HOUR, 99.0),
+            (DAY_START + 26 * HOUR, 98.0),
+        ]
+        for timestamp, equity_value in self.samples:
+            self.buffer.append(timestamp, equity_value)
+
+    def test_append(self):
+        # Validate
+        self.assertEqual(len(self.buffer), 5)
+        self.assertEqual(
+            self.buffer.timestamps.tolist()[3], self.samples[3][0]
+        )
+        self.assertEqual(
+            self.buffer[-1],
+            {"timestamp": DAY_START + 26 * HOUR, "equity_value": 98.0},
+        )
+        self.assertEqual(
+            [(s["timestamp"], s["equity_value"]) for s in self.buffer],
+            self.samples,
+        )
+        self.assertEqual(len(self.buffer[1:3]), 2)
+        with self.assertRaises(IndexError):
+            self.buffer[5]
+
+    def test_from_records(self):
+        # Test
+        buffer = EquityCurveBuffer.from_records(self.buffer)
+
+        # Validate
+        self.assertEqual(list(buffer), list(self.buffer))
+        self.assertEqual(len(EquityCurveBuffer.from_records([])), 0)
+
+    def test_is_last(self):
+        # Validate
+        self.assertTrue(self.buffer.is_last(DAY_START + 26 * HOUR, 98.0))
+        self.assertFalse(self.buffer.is_last(DAY_START + 26 * HOUR, 97.0))
+        self.assertFalse(EquityCurveBuffer().is_last(0, 0.0))
+
+    def test_last_per_timestamp(self):
+        # Test
+        timestamps, equity_values = self.buffer.last_per_timestamp()
+
+        # Validate
+        self.assertEqual(len(timestamps), 4)
+        self.assertEqual(equity_values.tolist(), [101.0, 102.5, 99.0, 98.0])
+
+    def test_last_per_day(self):
+        # Test
+        timestamps, equity_values = self.buffer.last_per_day("EST")
+
+        # Validate
+        self.assertEqual(
+            timestamps.tolist(), [DAY_START + 2 * HOUR, DAY_START + 26 * HOUR]
+        )
+        self.assertEqual(equity_values.tolist(), [102.5, 98.0])
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            EquityCurveBuffer(capacity=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -356,6 +356,18 @@ class TestEquityManager(unittest.TestCase):
         self.raw_equity_df = pd.DataFrame(self.manager.equity_value)
         self.raw_equity_df.set_index("timestamp", inplace=True)
 
+    def test_update_equity(self):
+        manager = EquityManager(Mock())
+        first = {"timestamp": 1713888000000000000, "equity_value": 100.0}
+        second = {"timestamp": 1713891600000000000, "equity_value": 101.0}
+
+        # Test
+        for equity in (first, first, second, second, first):
+            manager.update_equity(equity)
+
+        # Validate
+        self.assertEqual(list(manager.equity_value), [first, second, first])
+
     def test_calculate_return_and_drawdown(self):
         # Test
         result = self.manager._calculate_return_and_drawdown(
@@ -0,0 +1,130 @@
+import math
+import unittest
+import numpy as np
+import pandas as pd
+from unittest.mock import Mock
+from quantAnalytics.backtest.metrics import Metrics
+from midas.utils.unix import resample_timestamp
+from midas.engine.components.performance.managers import EquityManager
+from midas.engine.components.performance.statistics import (
+    EquityStatistics,
+    ReturnAccumulator,
+)
+
+HOUR = 3_600_000_000_000
+
+
+class TestEquityStatistics(unittest.TestCase):
+    def setUp(self) -> None:
+        # Hourly samples over several days, repeated timestamps replace the previous value
+        rng = np.random.default_rng(7)
+        start = 1713888000000000000
+        self.samples = []
+        equity = 100000.0
+        for i in range(300):
+            timestamp = start + (i // 2 if i % 5 == 0 else i) * HOUR
+            equity = round(equity * (1 + rng.normal(0, 0.01)), 2)
+            self.samples.append((timestamp, equity))
+        self.samples.sort(key=lambda sample: sample[0])
+
+    def _expected(self, risk_free_rate: float) -> dict:
+        df = pd.DataFrame(self.samples, columns=["timestamp", "equity_value"])
+        df.set_index("timestamp", inplace=True)
+        # Last equity value per timestamp
+        df = df.groupby("timestamp").last()
+        daily = resample_timestamp(df.copy(), interval="D", tz_info="EST")
+
+        period = df["equity_value"].to_numpy()
+        period_returns = np.insert(Metrics.simple_returns(period), 0, 0)
+        daily_returns = np.insert(
+            Metrics.simple_returns(daily["equity_value"].to_numpy()), 0, 0
+        )
+        return {
+            "net_profit": Metrics.net_profit(period),
+            "beginning_equity": period[0],
+            "ending_equity": period[-1],
+            "total_return": Metrics.total_return(period),
+            "daily_standard_deviation_percentage": (
+                Metrics.standard_deviation(daily_returns)
+            ),
+            "annual_standard_deviation_percentage": (
+                Metrics.annual_standard_deviation(daily_returns)
+            ),
+            "max_drawdown_percentage_period": Metrics.max_drawdown(
+                period_returns
+            ),
+            "max_drawdown_percentage_daily": Metrics.max_drawdown(
+                daily_returns
+            ),
+            "sharpe_ratio": Metrics.sharpe_ratio(
+                daily_returns, risk_free_rate
+            ),
+            "sortino_ratio": Metrics.sortino_ratio(
+                daily_returns, risk_free_rate
+            ),
+        }
+
+    def test_summary_matches_metrics(self):
+        statistics = EquityStatistics(0.04)
+
+        # Test
+        for timestamp, equity in self.samples:
+            statistics.update(timestamp, equity)
+        result = statistics.summary()
+
+        # Validate
+        for key, value in self._expected(0.04).items():
+            self.assertAlmostEqual(result[key], float(value), places=6)
+
+    def test_calculate_equity_statistics(self):
+        manager = EquityManager(Mock(), risk_free_rate=0.02)
+        manager.equity_value = [
+            {"timestamp": timestamp, "equity_value": equity}
+            for timestamp, equity in self.samples
+        ]
+
+        # Test
+        result = manager.calculate_equity_statistics(0.02)
+
+        # Validate
+        for key, value in self._expected(0.02).items():
+            self.assertAlmostEqual(result[key], float(value), places=6)
+        self.assertEqual(manager.statistics.samples, len(self.samples))
+
+    def test_replaced_sample(self):
+        accumulator = ReturnAccumulator()
+
+        # Test
+        accumulator.update(1, 100.0)
+        accumulator.update(1, 200.0)
+        accumulator.update(2, 100.0)
+        accumulator.update(2, 150.0)
+
+        # Validate
+        self.assertEqual(accumulator.first, 200.0)
+        self.assertEqual(accumulator.last, 150.0)
+        self.assertEqual(accumulator.count, 2)
+        self.assertAlmostEqual(accumulator.cumulative_return, -0.25)
+        self.assertAlmostEqual(accumulator.max_drawdown, -0.25)
+
+    def test_zero_equity(self):
+        statistics = EquityStatistics()
+
+        # Test
+        for i, equity in enumerate([100.0, 50.0, 0.0, 0.0, 10.0]):
+            statistics.update(i * 24 * HOUR, equity)
+        result = statistics.summary()
+
+        # Validate
+        self.assertAlmostEqual(statistics.period.max_drawdown, -1.0)
+        self.assertAlmostEqual(statistics.period.cumulative_return, -0.9)
+        for value in result.values():
+            self.assertTrue(math.isfinite(value))
+
+    def test_empty(self):
+        with self.assertRaises(ValueError):
+            EquityStatistics().summary()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,7 +7,7 @@ from midas.symbol import SymbolMap
 from midas.utils.logger import SystemLogger
 from midas.active_orders import ActiveOrder
 from midas.account import Account
-from midas.engine.components.observer import EventType
+from midas.engine.components.observer import EventType, Subject
 from midas.positions import EquityPosition
 from midas.engine.components.portfolio_server import (
     PortfolioServer,
@@ -194,6 +194,29 @@ class TestPortfolioServer(unittest.TestCase):
         account = self.portfolio_server.get_account
         self.assertEqual(account, account_data)
 
+    def test_manager_replaced_after_attach(self):
+        subject = Subject()
+        subject.attach(self.portfolio_server, EventType.ACCOUNT_UPDATE)
+        subject.attach(self.portfolio_server, EventType.POSITION_UPDATE)
+        account_data = Mock()
+        position_data = Mock()
+
+        # Test
+        self.portfolio_server.account_manager = Mock()
+        self.portfolio_server.position_manager = Mock()
+        subject.notify(EventType.ACCOUNT_UPDATE, account_data)
+        subject.notify(EventType.POSITION_UPDATE, 1, position_data)
+
+        # Validate
+        account_manager = self.portfolio_server.account_manager
+        account_manager.update_account_details.assert_called_once_with(
+            account_data
+        )
+        position_manager = self.portfolio_server.position_manager
+        position_manager.update_positions.assert_called_once_with(
+            1, position_data
+        )
+
 
 class TestPositionManager(unittest.TestCase):
     def setUp(self):
@@ -1,3 +1,4 @@
+import toml
 import random
 import unittest
 from datetime import datetime, time
@@ -30,6 +31,57 @@ class TestConfig(unittest.TestCase):
         self.assertTrue(config.risk != {})
         self.assertTrue(config.broker != {})
         self.assertTrue(config.data_source != {})
+        self.assertTrue(config.backtest != {})
+
+    def test_logging_defaults(self):
+        # Test
+        config = Config.from_toml("tests/unit/engine/config.toml")
+
+        # Validate
+        self.assertFalse(config.log_async)
+        self.assertEqual(config.log_levels, {})
+        self.assertEqual(config.log_sample, {})
+        self.assertEqual(config.log_buffer, 1000)
+
+    def test_chunk_days_single_file(self):
+        config_dict = toml.load("tests/unit/engine/config.toml")
+        config_dict["general"]["data_file"] = "data.bin"
+        config_dict["backtest"]["chunk_days"] = 7
+
+        # Test
+        with self.assertRaises(ValueError):
+            Config(config_dict)
+
+    def test_chunk_days_data_directory(self):
+        config_dict = toml.load("tests/unit/engine/config.toml")
+        config_dict["general"]["data_file"] = "tests"
+        config_dict["backtest"]["chunk_days"] = 7
+
+        # Test
+        config = Config(config_dict)
+
+        # Validate
+        self.assertEqual(config.chunk_days, 7)
+
+    def test_logging_options(self):
+        config_dict = toml.load("tests/unit/engine/config.toml")
+        config_dict["general"].update(
+            {
+                "log_async": True,
+                "log_levels": {"order_book": "WARNING"},
+                "log_sample": {"order_book": 1000},
+                "log_buffer": 50,
+            }
+        )
+
+        # Test
+        config = Config(config_dict)
+
+        # Validate
+        self.assertTrue(config.log_async)
+        self.assertEqual(config.log_levels, {"order_book": "WARNING"})
+        self.assertEqual(config.log_sample, {"order_book": 1000})
+        self.assertEqual(config.log_buffer, 50)
 
 
 class TestParameters(unittest.TestCase):
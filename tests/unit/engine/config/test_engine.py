@@ -1,5 +1,6 @@
+import asyncio
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from midas.engine.engine import EngineBuilder, Engine
 from midas.engine.config import Mode
 
@@ -62,6 +63,29 @@ class TestEngineBacktest(unittest.TestCase):
         # Validate
         self.assertTrue(self.engine._run_backtest_event_loop.call_count == 1)
 
+    def test_profiler_per_engine(self):
+        builder = EngineBuilder("tests/unit/engine/config.toml", Mode.BACKTEST)
+        builder.config.profile_events = True
+
+        # Test
+        engine = (
+            builder.create_logger()
+            .create_parameters()
+            .create_database_client()
+            .create_symbols_map()
+            .create_core_components()
+            .create_gateways()
+            .create_observers()
+            .build()
+        )
+
+        # Validate
+        self.assertIsNotNone(engine.profiler)
+        self.assertIs(engine.order_book.profiler, engine.profiler)
+        self.assertIs(engine.hist_data_client.profiler, engine.profiler)
+        self.assertIsNone(self.engine.profiler)
+        self.assertIsNone(self.engine.order_book.profiler)
+
 
 class TestEngineLive(unittest.TestCase):
     def setUp(self) -> None:
@@ -102,6 +126,20 @@ class TestEngineLive(unittest.TestCase):
         # Validate
         self.assertTrue(self.engine._run_live_event_loop.call_count == 1)
 
+    def test_shutdown_live_logs_profile(self):
+        self.engine.profiler = MagicMock()
+        self.engine.profiler.summary.return_value = "profile"
+        self.engine.broker_client = MagicMock()
+        self.engine.performance_manager = MagicMock()
+        self.engine.logger.info = MagicMock()
+
+        # Test
+        with patch("midas.engine.engine.asyncio.sleep", new=AsyncMock()):
+            asyncio.run(self.engine._shutdown_live())
+
+        # Validate
+        self.engine.logger.info.assert_called_with("profile")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,196 @@
+import logging
+import unittest
+from collections import deque
+from midas.utils.logger import (
+    SystemLogger,
+    SampledLogger,
+    RingBufferHandler,
+)
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def build_logger(name: str) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    return logger
+
+
+class TestSampledLogger(unittest.TestCase):
+    def setUp(self) -> None:
+        self.logger = build_logger("test_sampled")
+        self.target = ListHandler()
+        self.logger.addHandler(self.target)
+
+    def test_sampling_per_template(self):
+        sampled = SampledLogger(self.logger, 10)
+
+        # Test
+        for i in range(100):
+            sampled.info("%s", i)
+        for i in range(10):
+            sampled.info("x %s", i)
+
+        # Validate
+        messages = [record.getMessage() for record in self.target.records]
+        self.assertEqual(
+            messages, [str(i) for i in range(0, 100, 10)] + ["x 0"]
+        )
+
+    def test_warnings_not_sampled(self):
+        sampled = SampledLogger(self.logger, 10)
+
+        # Test
+        for i in range(10):
+            sampled.warning("%s", i)
+
+        # Validate
+        self.assertEqual(len(self.target.records), 10)
+
+    def test_disabled_level_not_held(self):
+        ring = deque(maxlen=10)
+        sampled = SampledLogger(self.logger, 10, ring)
+
+        # Test
+        for i in range(10):
+            sampled.debug("%s", i)
+
+        # Validate
+        self.assertEqual(len(self.target.records), 0)
+        self.assertEqual(len(ring), 0)
+
+    def test_formatted_messages_bounded(self):
+        sampled = SampledLogger(self.logger, 10, max_templates=100)
+
+        # Test
+        for i in range(10_000):
+            sampled.info(f"equity {i}")
+        for _ in range(20):
+            sampled.info("%s", "kept")
+
+        # Validate
+        self.assertEqual(len(sampled._counts), 100)
+        self.assertEqual(sampled._counts["%s"], 20)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            SampledLogger(self.logger, 0)
+
+    def test_invalid_max_templates(self):
+        with self.assertRaises(ValueError):
+            SampledLogger(self.logger, 10, max_templates=0)
+
+
+class TestRingBufferHandler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.logger = build_logger("test_ring")
+        self.target = ListHandler()
+        self.ring = deque(maxlen=5)
+        self.logger.addHandler(RingBufferHandler([self.target], self.ring))
+
+    def test_flush_on_error(self):
+        sampled = SampledLogger(self.logger, 100, self.ring)
+
+        # Test
+        for i in range(20):
+            sampled.info("%s", i)
+        written = [record.getMessage() for record in self.target.records]
+        sampled.error("failed")
+
+        # Validate
+        messages = [record.getMessage() for record in self.target.records]
+        self.assertEqual(written, ["0"])
+        self.assertEqual(
+            messages, ["0", "15", "16", "17", "18", "19", "failed"]
+        )
+        self.assertEqual(self.target.records[1].name, "test_ring")
+        self.assertEqual(len(self.ring), 0)
+
+    def test_target_level_respected(self):
+        self.target.setLevel(logging.WARNING)
+
+        # Test
+        self.logger.info("info")
+        self.logger.warning("warning")
+
+        # Validate
+        self.assertEqual(
+            [record.getMessage() for record in self.target.records],
+            ["warning"],
+        )
+
+
+class TestSystemLogger(unittest.TestCase):
+    def setUp(self) -> None:
+        self.previous = SystemLogger._instance
+        SystemLogger._instance = None
+
+    def tearDown(self) -> None:
+        SystemLogger._instance.stop()
+        SystemLogger._instance = self.previous
+
+    def test_async_mode(self):
+        system_logger = SystemLogger(
+            "test_async",
+            "none",
+            async_mode=True,
+            component_levels={"quiet": "WARNING"},
+            sample_rates={"order_book": 10},
+            buffer_size=100,
+        )
+        system_logger.logger.propagate = False  # pytest log capture
+        target = ListHandler()
+        system_logger.listener.handlers[0].targets.append(target)
+
+        # Test
+        for i in range(50):
+            SystemLogger.get_logger("order_book").info("%s", i)
+        SystemLogger.get_logger("quiet").info("dropped")
+        SystemLogger.get_logger().info("kept")
+        system_logger.stop()
+
+        # Validate
+        messages = [record.getMessage() for record in target.records]
+        self.assertEqual(messages, ["0", "10", "20", "30", "40", "kept"])
+        self.assertIsInstance(
+            SystemLogger.get_logger("order_book"), SampledLogger
+        )
+        self.assertEqual(
+            SystemLogger.get_logger("quiet").name, "test_async_logger.quiet"
+        )
+
+    def test_deferred_formatting(self):
+        class Event:
+            calls = 0
+
+            def __str__(self):
+                Event.calls += 1
+                return "event"
+
+        system_logger = SystemLogger("test_deferred", "none", async_mode=True)
+        system_logger.logger.propagate = False  # pytest log capture
+
+        # Test
+        handler = system_logger.logger.handlers[0]
+        record = system_logger.logger.makeRecord(
+            "test", logging.INFO, __file__, 0, "%s", (Event(),), None
+        )
+        handler.prepare(record)
+
+        # Validate
+        self.assertEqual(Event.calls, 0)
+        self.assertEqual(record.getMessage(), "event")
+
+
+if __name__ == "__main__":
+    unittest.main()
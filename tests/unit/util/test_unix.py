@@ -1,10 +1,15 @@
 import unittest
+import numpy as np
 import pandas as pd
 from midas.utils.unix import (
     unix_to_iso,
     iso_to_unix,
     unix_to_date,
+    unix_to_datetime,
+    unix_to_iso_array,
+    unix_to_date_array,
     resample_timestamp,
+    _convert_timestamp,
 )
 import datetime
 
@@ -55,6 +60,65 @@ class TestUtils(unittest.TestCase):
         # Validate
         self.assertEqual(datetime.date(2021, 11, 1), date)
 
+    def test_unix_to_datetime(self):
+        timestamps = [1679789200000000000, 1679789200000000001]
+
+        # Test
+        result = unix_to_datetime(timestamps, "US/Eastern")
+
+        # Validate
+        self.assertEqual(str(result.tz), "US/Eastern")
+        self.assertEqual(
+            result[0].isoformat(), unix_to_iso(timestamps[0], "US/Eastern")
+        )
+        self.assertEqual(result.asi8.tolist(), timestamps)
+
+    def test_unix_to_iso_array(self):
+        # Across a daylight saving change and with fractional seconds
+        timestamps = [
+            1635728461000000000,
+            1679789200000000000,
+            1699167600000000000,
+            1699174800123456000,
+        ]
+
+        for tz_info in ["UTC", "US/Eastern", "Asia/Kolkata"]:
+            # Test
+            result = unix_to_iso_array(timestamps, tz_info)
+
+            # Validate
+            self.assertEqual(
+                result.tolist(),
+                [unix_to_iso(ts, tz_info) for ts in timestamps],
+            )
+
+    def test_unix_to_date_array(self):
+        timestamps = [1635728461000000000, 1679789200000000000]
+
+        # Test
+        result = unix_to_date_array(timestamps, "US/Eastern")
+
+        # Validate
+        self.assertEqual(
+            result.tolist(),
+            [unix_to_date(ts, "US/Eastern") for ts in timestamps],
+        )
+
+    def test_convert_timestamp(self):
+        df = pd.DataFrame({"ts": [1635728461000000000, 1679789200000000000]})
+
+        # Test
+        _convert_timestamp(df, "ts", "US/Eastern")
+
+        # Validate
+        self.assertEqual(
+            [ts.isoformat() for ts in df["ts"]],
+            [
+                "2021-10-31T21:01:01-04:00",
+                "2023-03-25T20:06:40-04:00",
+            ],
+        )
+
     def test_resample_daily(self):
         df = pd.DataFrame(
             {
@@ -100,6 +164,8 @@ class TestUtils(unittest.TestCase):
 
         # Validate
         pd.testing.assert_frame_equal(daily_df, expected_df)
+        self.assertEqual(df.index.name, "timestamp")
+        self.assertEqual(df.index.dtype, np.int64)
 
 
 if __name__ == "__main__":